@@ -1,80 +1,133 @@
 import os
-import io
-import pandas as pd
-from flask import Flask, render_template, request, redirect, url_for, flash
-import matplotlib.pyplot as plt
-import base64
+import click
+from flask import Flask, render_template, request, redirect, url_for, flash, abort, make_response, jsonify, g, has_request_context, stream_with_context
 
 import db_postgres as db_conexao
+import contador_pesquisas
+import indice_nomes
+import graficos
+import consultas
+import cache_respostas
+import origens
+import exportacao
+import rotas_comuns
+from rotas_comuns import QUERY_RANKING, QUERY_ORIGENS, definir_grafico
 
 app = Flask(__name__)
 app.secret_key = os.environ.get('FLASK_SECRET_KEY', 'sua_chave_secreta_padrao_muito_segura')
 
-try:
-    db_conexao.init_db()
-except Exception as e:
-    print(f"FATAL: Falha ao inicializar o banco de dados PostgreSQL. Verifique DB_CONFIG ou .env. Erro: {e}")
-    exit(1)
+# O schema não é mais criado na importação do app: cada cold start pagaria
+# um round trip e uma falha momentânea do banco derrubaria o worker.
+# Rode a migração explicitamente com "flask --app app init-db"
+# (ou "python db_postgres.py"). O pool é criado na primeira consulta.
+@app.cli.command('init-db')
+@click.option('--fundir-duplicados', is_flag=True,
+              help='Funde os nomes repetidos (sem diferenciar maiúsculas/acentos) no mais antigo.')
+def init_db_command(fundir_duplicados):
+    """Cria/atualiza a tabela 'nomes' e seus índices no PostgreSQL."""
+    try:
+        db_conexao.init_db(fundir_duplicados)
+    except db_conexao.NomesDuplicados as e:
+        raise click.ClickException(str(e))
+
+def get_db():
+    """Conexão da requisição atual: todas as consultas da requisição a compartilham.
+
+    É retirada do pool na primeira consulta e devolvida em close_db(). Em
+    requisições GET/HEAD as leituras rodam numa única transação somente leitura.
+    """
+    if 'db_conn' not in g:
+        conn = db_conexao.get_connection()
+        conn.readonly = has_request_context() and request.method in ('GET', 'HEAD')
+        g.db_conn = conn
+    return g.db_conn
+
+@app.teardown_appcontext
+def close_db(exc=None):
+    conn = g.pop('db_conn', None)
+    if conn is None:
+        return
+    descartar = False
+    try:
+        # Encerra a transação de leitura (escritas já foram confirmadas em execute_returning).
+        conn.rollback()
+        conn.readonly = None
+    except Exception as e:
+        print(f"Conexão descartada ao final da requisição: {e}")
+        descartar = True
+    db_conexao.devolver_conexao(conn, close=descartar)
 
 def fetch_all(query, params=None):
     conn = None
     try:
-        conn = db_conexao.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(query, params or ())
-        columns = [desc[0] for desc in cursor.description]
-        results = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        conn = get_db()
+        with conn.cursor() as cursor:
+            consultas.executar(cursor, query, params)
+            columns = [desc[0] for desc in cursor.description]
+            results = [dict(zip(columns, row)) for row in cursor.fetchall()]
         return results
     except Exception as e:
+        if conn and not conn.closed:
+            conn.rollback()
         flash(f"Erro de banco de dados: {e}", 'error')
         print(f"Erro de banco de dados (fetch_all): {e}")
         return []
-    finally:
-        if conn:
-            cursor.close()
-            db_conexao.connection_pool.putconn(conn)
 
-def execute_query(query, params=None):
+def execute_returning(query, params=None):
+    """Executa uma escrita com RETURNING e confirma.
+
+    Retorna as linhas devolvidas (lista vazia se nada foi gravado) ou None em caso de erro.
+    """
     conn = None
     try:
-        conn = db_conexao.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(query, params or ())
+        conn = get_db()
+        with conn.cursor() as cursor:
+            consultas.executar(cursor, query, params)
+            columns = [desc[0] for desc in cursor.description]
+            results = [dict(zip(columns, row)) for row in cursor.fetchall()]
         conn.commit()
-        return True
+        return results
     except Exception as e:
+        if conn and not conn.closed:
+            conn.rollback()
         flash(f"Erro ao salvar no banco de dados: {e}", 'error')
-        print(f"Erro ao salvar no banco de dados (execute_query): {e}")
-        return False
-    finally:
-        if conn:
-            cursor.close()
-            db_conexao.connection_pool.putconn(conn)
+        print(f"Erro ao salvar no banco de dados (execute_returning): {e}")
+        return None
 
 def fetch_one(query, params=None):
     conn = None
     try:
-        conn = db_conexao.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(query, params or ())
-        columns = [desc[0] for desc in cursor.description]
-        row = cursor.fetchone()
+        conn = get_db()
+        with conn.cursor() as cursor:
+            consultas.executar(cursor, query, params)
+            columns = [desc[0] for desc in cursor.description]
+            row = cursor.fetchone()
         return dict(zip(columns, row)) if row else None
     except Exception as e:
+        if conn and not conn.closed:
+            conn.rollback()
         flash(f"Erro de banco de dados: {e}", 'error')
         print(f"Erro de banco de dados (fetch_one): {e}")
         return None
-    finally:
-        if conn:
-            cursor.close()
-            db_conexao.connection_pool.putconn(conn)
+
+@app.cli.command('verificar-origens')
+@click.option('--corrigir', is_flag=True, help='Grava os totais recalculados em origem_stats.')
+def verificar_origens_command(corrigir):
+    """Recalcula origem_stats a partir de 'nomes' e mostra as diferenças."""
+    diferencas = db_conexao.verificar_origem_stats(corrigir=corrigir)
+    if not diferencas:
+        print("origem_stats está consistente com a tabela 'nomes'.")
+        return
+    for origem, registrado, real in diferencas:
+        print(f"{origem or '(sem origem)'}: registrado {registrado}, real {real}")
+    print(f"{len(diferencas)} origem(ns) com diferença" + (" corrigida(s)." if corrigir else "."))
 
 @app.route('/')
+@cache_respostas.em_cache(contadores=True)
 def index():
-    total_result = fetch_one("SELECT COUNT(id) as total FROM nomes")
+    total_result = fetch_one(rotas_comuns.QUERY_TOTAL)
     total = total_result['total'] if total_result else 0
-    query_top10 = "SELECT nome, pesquisas FROM nomes ORDER BY pesquisas DESC LIMIT 10"
-    top_nomes = fetch_all(query_top10)
+    top_nomes = fetch_all(QUERY_RANKING, (10,))
     return render_template('index.html', total=total, top_nomes=top_nomes)
 
 @app.route('/buscar', methods=['GET', 'POST'])
@@ -84,19 +137,15 @@ def buscar():
     if request.method == 'POST':
         termo_pesquisado = request.form.get('termo', '').strip()
         if termo_pesquisado:
-            query_busca = """
-                SELECT id, nome, significado, origem, motivo_escolha, pesquisas
-                FROM nomes
-                WHERE nome ILIKE %s
-                ORDER BY nome ASC
-            """
-            resultados = fetch_all(query_busca, (f'%{termo_pesquisado}%',))
+            indice = indice_nomes.obter()
+            if indice is not None:
+                resultados = indice.linhas(indice.contem(termo_pesquisado))
+            else:
+                resultados = fetch_all(rotas_comuns.QUERY_BUSCA, (f'%{termo_pesquisado}%',))
             if resultados:
-                for row in resultados:
-                    novo_total = row['pesquisas'] + 1
-                    query_update = "UPDATE nomes SET pesquisas = %s WHERE id = %s"
-                    execute_query(query_update, (novo_total, row['id']))
-                    row['pesquisas'] = novo_total
+                # O incremento vai para o buffer write-behind; a gravação no
+                # banco acontece em lote, fora do caminho da requisição.
+                contador_pesquisas.registrar(rotas_comuns.marcar_pesquisados(resultados))
                 flash(f"{len(resultados)} nome(s) encontrado(s) e contador(es) atualizado(s).", 'success')
             else:
                 flash(f"Nenhum nome encontrado para '{termo_pesquisado}'.", 'warning')
@@ -104,120 +153,113 @@ def buscar():
             flash("Por favor, digite um nome para buscar.", 'error')
     return render_template('buscar.html', resultados=resultados, termo_pesquisado=termo_pesquisado)
 
+def contar_aproximado(pagina):
+    """Total aproximado de registros da listagem (ver rotas_comuns.Pagina)."""
+    total = pagina.total_estimado(fetch_one(*pagina.consulta_estimativa()))
+    if total is None:
+        # Tabela ainda não analisada: conta de verdade.
+        result = fetch_one(rotas_comuns.QUERY_TOTAL)
+        total = result['total'] if result else 0
+    return total
+
 @app.route('/listar')
+@cache_respostas.em_cache
 def listar():
-    try:
-        page = int(request.args.get('page', 1))
-    except ValueError:
-        page = 1
-    per_page = 10
-    offset = (page - 1) * per_page
-    filtro_nome = request.args.get('nome', '').strip()
-    filtro_origem = request.args.get('origem', '').strip()
-    query_count = "SELECT COUNT(id) as total FROM nomes WHERE 1=1"
-    params = []
-    if filtro_nome:
-        query_count += " AND nome ILIKE %s"
-        params.append(f"%{filtro_nome}%")
-    if filtro_origem:
-        query_count += " AND origem ILIKE %s"
-        params.append(f"%{filtro_origem}%")
-    total_result = fetch_one(query_count, tuple(params))
-    total_registros = total_result['total'] if total_result else 0
-    total_pages = (total_registros + per_page - 1) // per_page
-    if page < 1:
-        page = 1
-    if page > total_pages and total_pages > 0:
-        page = total_pages
-        offset = (page - 1) * per_page
-    query = "SELECT id, nome, significado, origem, motivo_escolha, pesquisas FROM nomes WHERE 1=1"
-    params = []
-    if filtro_nome:
-        query += " AND nome ILIKE %s"
-        params.append(f"%{filtro_nome}%")
-    if filtro_origem:
-        query += " AND origem ILIKE %s"
-        params.append(f"%{filtro_origem}%")
-    query += " ORDER BY nome ASC LIMIT %s OFFSET %s"
-    params.extend([per_page, offset])
-    nomes = fetch_all(query, tuple(params))
-    print(f"Debug /listar: Total registros: {total_registros}, Nomes encontrados: {len(nomes)}")
-    for i, nome in enumerate(nomes):
-        nome['indice'] = offset + i + 1
-    return render_template('listar.html', 
-                           nomes=nomes, 
-                           page=page, 
-                           total_pages=total_pages,
-                           filtro_nome=filtro_nome,
-                           filtro_origem=filtro_origem)
+    pagina = rotas_comuns.Pagina(request.args)
+    indice = indice_nomes.obter()
+    if indice is not None:
+        # Filtro e paginação direto da memória, sem ida ao banco.
+        contexto = pagina.do_indice(indice)
+    else:
+        total_registros = contar_aproximado(pagina)
+        contexto = pagina.do_banco(fetch_all(*pagina.consulta_linhas()), total_registros)
+    print(f"Debug /listar: Total registros: {contexto['total_registros']}, Nomes encontrados: {len(contexto['nomes'])}")
+    return render_template('listar.html', **contexto)
 
 @app.route('/cadastrar', methods=['GET', 'POST'])
 def cadastrar():
     if request.method == 'POST':
-        nome = request.form.get('nome', '').strip()
-        significado = request.form.get('significado', '').strip()
-        origem = request.form.get('origem', '').strip()
-        motivo_escolha = request.form.get('motivo_escolha', '').strip()
-        if nome and significado and origem:
-            query_check = "SELECT id FROM nomes WHERE nome ILIKE %s"
-            existing_name = fetch_one(query_check, (nome,))
-            if existing_name:
+        nome, significado, origem, motivo_escolha = rotas_comuns.parametros_cadastro(request.form)
+        canonica = origens.canonizar_origem(origem)
+        if nome and significado and canonica:
+            inseridos = execute_returning(rotas_comuns.QUERY_CADASTRO, rotas_comuns.valores_cadastro(
+                nome, significado, origem, canonica, motivo_escolha))
+            if inseridos:
+                indice_nomes.invalidar()
+                cache_respostas.invalidar()
+                flash(f"Nome '{nome}' cadastrado com sucesso!", 'success')
+                return redirect(url_for('listar'))
+            elif inseridos is not None:
                 flash(f"O nome '{nome}' já existe no banco de dados.", 'error')
             else:
-                query_insert = """
-                    INSERT INTO nomes (nome, significado, origem, motivo_escolha, pesquisas)
-                    VALUES (%s, %s, %s, %s, 0)
-                """
-                if execute_query(query_insert, (nome, significado, origem, motivo_escolha)):
-                    flash(f"Nome '{nome}' cadastrado com sucesso!", 'success')
-                    return redirect(url_for('listar'))
-                else:
-                    flash("Falha ao cadastrar o nome.", 'error')
+                flash("Falha ao cadastrar o nome.", 'error')
         else:
             flash("Nome, Significado e Origem são campos obrigatórios.", 'error')
     return render_template('cadastrar.html')
 
+@app.route('/exportar')
+def exportar():
+    """Exporta os nomes (com os filtros do /listar) em CSV ou NDJSON, em streaming."""
+    formato, query, params = rotas_comuns.consulta_exportacao(request.args)
+    if formato is None:
+        abort(400)
+
+    def gerar():
+        # O cabeçalho do CSV sai antes da consulta e o primeiro lote é
+        # pequeno: o download começa logo, também no NDJSON.
+        yield exportacao.cabecalho(formato)
+        try:
+            conn = get_db()
+            # Cursor nomeado (no servidor): o resultado fica no PostgreSQL e
+            # vem em lotes, sem carregar a tabela inteira na memória.
+            with conn.cursor(name='exportar_nomes') as cursor:
+                cursor.execute(query, params)
+                for tamanho in exportacao.tamanhos_lote():
+                    linhas = cursor.fetchmany(tamanho)
+                    if not linhas:
+                        break
+                    yield exportacao.formatar_lote(formato, linhas)
+        except Exception as e:
+            # Os cabeçalhos HTTP já foram enviados: relança para o servidor
+            # abortar a resposta em chunks. Terminar o gerador normalmente
+            # entregaria ao cliente um arquivo "completo" sem parte das linhas.
+            print(f"Erro de banco de dados (exportar): {e}")
+            raise
+
+    mimetype, arquivo = exportacao.FORMATOS[formato]
+    response = app.response_class(stream_with_context(gerar()), mimetype=mimetype)
+    response.headers['Content-Disposition'] = f'attachment; filename="{arquivo}"'
+    return response
+
 @app.route('/top10')
+@cache_respostas.em_cache(contadores=True)
 def top10():
-    query = "SELECT nome, pesquisas FROM nomes ORDER BY pesquisas DESC LIMIT 10"
-    top_nomes = fetch_all(query)
+    top_nomes = fetch_all(QUERY_RANKING, (10,))
     for i, nome in enumerate(top_nomes):
         nome['ranking'] = i + 1
     return render_template('top10.html', top_nomes=top_nomes)
 
+@app.route('/saude')
+def saude():
+    """Readiness: informa se o banco de dados está acessível."""
+    banco_ok = db_conexao.verificar_conexao()
+    status = 200 if banco_ok else 503
+    return jsonify(status='ok' if banco_ok else 'indisponivel',
+                   banco='ok' if banco_ok else 'inacessivel',
+                   pool=db_conexao.metricas_pool()), status
+
 @app.route('/estatisticas')
+@cache_respostas.em_cache(contadores=True)
 def estatisticas():
-    query_origem = "SELECT origem, COUNT(id) as count FROM nomes GROUP BY origem ORDER BY count DESC"
-    data_origem = fetch_all(query_origem)
-    query_top5 = "SELECT nome, pesquisas FROM nomes ORDER BY pesquisas DESC LIMIT 5"
-    data_top5 = fetch_all(query_top5)
-
-    def generate_chart(labels, values, chart_type, title, ylabel=None):
-        plt.figure(figsize=(10, 6))
-        if chart_type == 'pie':
-            plt.pie(values, labels=labels, autopct='%1.1f%%', startangle=90, wedgeprops={'edgecolor': 'black'})
-            plt.title(title)
-            plt.axis('equal')
-        elif chart_type == 'bar':
-            plt.bar(labels, values, color='skyblue')
-            plt.title(title)
-            if ylabel:
-                plt.ylabel(ylabel)
-            plt.xlabel('Nome')
-            plt.xticks(rotation=45, ha='right')
-            plt.tight_layout()
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', transparent=True)
-        plt.close()
-        data = base64.b64encode(buf.getvalue()).decode('utf-8')
-        return f"data:image/png;base64,{data}"
-
-    origens = [d['origem'] for d in data_origem]
-    contagens = [d['count'] for d in data_origem]
-    grafico_origem_url = generate_chart(origens, contagens, 'pie', 'Distribuição de Nomes por Origem')
-    top_nomes_labels = [d['nome'] for d in data_top5]
-    top_nomes_pesquisas = [d['pesquisas'] for d in data_top5]
-    grafico_top5_url = generate_chart(top_nomes_labels, top_nomes_pesquisas, 'bar', 'Top 5 Nomes Mais Pesquisados', 'Número de Pesquisas')
+    data_origem = fetch_all(QUERY_ORIGENS)
+    data_top5 = fetch_all(QUERY_RANKING, (5,))
+
+    # A página só referencia as imagens; o PNG é gerado (e cacheado) na rota
+    # /graficos, e a versão na URL muda quando os dados mudam.
+    grafico_origem_url = url_for('grafico', nome_grafico='origens',
+                                 v=graficos.chave(*definir_grafico('origens', data_origem)))
+    grafico_top5_url = url_for('grafico', nome_grafico='top5',
+                               v=graficos.chave(*definir_grafico('top5', data_top5)))
 
     return render_template('estatisticas.html', 
                            grafico_origem_url=grafico_origem_url, 
@@ -225,5 +267,24 @@ def estatisticas():
                            tabela_origem=data_origem,
                            tabela_top5=data_top5)
 
+@app.route('/graficos/<nome_grafico>.png')
+def grafico(nome_grafico):
+    consulta = rotas_comuns.consulta_grafico(nome_grafico)
+    if consulta is None:
+        abort(404)
+    dados = fetch_all(*consulta)
+    chave, png = graficos.obter_png(*definir_grafico(nome_grafico, dados))
+    response = make_response(png)
+    response.mimetype = 'image/png'
+    response.set_etag(chave)
+    if request.args.get('v') == chave:
+        # URL versionada pelo hash dos dados: o conteúdo nunca muda.
+        response.cache_control.public = True
+        response.cache_control.max_age = 31536000
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=int(os.environ.get('PORT', 5000)))
\ No newline at end of file
@@ -0,0 +1,270 @@
+import os
+import time
+import asyncio
+
+from quart import Quart, render_template, request, redirect, url_for, flash, abort, make_response, jsonify
+from psycopg.conninfo import make_conninfo
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
+
+import db_postgres as db_conexao
+import contador_pesquisas
+import indice_nomes
+import graficos
+import origens
+import exportacao
+import cache_respostas
+import rotas_comuns
+from rotas_comuns import QUERY_RANKING, QUERY_ORIGENS, definir_grafico
+
+# Variante assíncrona (ASGI) do app, com as mesmas rotas e templates.
+# Cada worker atende muitas requisições ao mesmo tempo: enquanto uma espera
+# o round trip ao Supabase, o event loop serve as outras. Rode com:
+#     hypercorn app_async:app --bind 0.0.0.0:$PORT
+app = Quart(__name__)
+app.secret_key = os.environ.get('FLASK_SECRET_KEY', 'sua_chave_secreta_padrao_muito_segura')
+
+pool = AsyncConnectionPool(
+    make_conninfo(host=db_conexao.DB_HOST, port=db_conexao.DB_PORT, dbname=db_conexao.DB_NAME,
+                  user=db_conexao.DB_USER, password=db_conexao.DB_PASSWORD),
+    min_size=db_conexao.DB_POOL_MIN,
+    max_size=db_conexao.DB_POOL_MAX,
+    timeout=db_conexao.DB_POOL_TIMEOUT,
+    check=AsyncConnectionPool.check_connection,
+    open=False,
+)
+
+@app.before_serving
+async def abrir_pool():
+    await pool.open()
+
+@app.after_serving
+async def fechar_pool():
+    await pool.close()
+
+async def fetch_all(query, params=None):
+    try:
+        async with pool.connection() as conn:
+            async with conn.cursor(row_factory=dict_row) as cursor:
+                # O psycopg 3 prepara a instrução no servidor a partir do uso repetido.
+                await cursor.execute(query, params or (), prepare=consultas_preparadas())
+                return await cursor.fetchall()
+    except Exception as e:
+        await flash(f"Erro de banco de dados: {e}", 'error')
+        print(f"Erro de banco de dados (fetch_all): {e}")
+        return []
+
+async def fetch_one(query, params=None):
+    resultados = await fetch_all(query, params)
+    return resultados[0] if resultados else None
+
+async def execute_returning(query, params=None):
+    """Escrita com RETURNING: as linhas devolvidas (vazia se nada foi gravado) ou None em caso de erro."""
+    try:
+        async with pool.connection() as conn:
+            async with conn.cursor(row_factory=dict_row) as cursor:
+                await cursor.execute(query, params or (), prepare=consultas_preparadas())
+                return await cursor.fetchall()
+    except Exception as e:
+        await flash(f"Erro ao salvar no banco de dados: {e}", 'error')
+        print(f"Erro ao salvar no banco de dados (execute_returning): {e}")
+        return None
+
+def consultas_preparadas():
+    """None deixa o psycopg decidir (prepara após uso repetido); False desliga."""
+    return None if os.environ.get('DB_PREPARED_STATEMENTS', '1') != '0' else False
+
+_indice = None
+_indice_carregado_em = 0.0
+_indice_lock = asyncio.Lock()
+
+async def obter_indice():
+    """Índice de nomes em memória (indice_nomes.IndiceNomes), carregado pelo pool assíncrono."""
+    global _indice, _indice_carregado_em
+    if not indice_nomes.ATIVO:
+        return None
+    if _indice is not None and time.monotonic() - _indice_carregado_em < indice_nomes.TTL_SEGUNDOS:
+        return _indice
+    async with _indice_lock:
+        if _indice is not None and time.monotonic() - _indice_carregado_em < indice_nomes.TTL_SEGUNDOS:
+            return _indice
+        try:
+            async with pool.connection() as conn:
+                cursor = await conn.execute(indice_nomes.QUERY_LINHAS)
+                linhas = await cursor.fetchall()
+            _indice = await asyncio.to_thread(indice_nomes.IndiceNomes, linhas)
+            _indice_carregado_em = time.monotonic()
+        except Exception as e:
+            print(f"Erro ao carregar o índice de nomes em memória: {e}")
+    return _indice
+
+def invalidar_indice():
+    global _indice_carregado_em
+    _indice_carregado_em = 0.0
+
+@app.route('/')
+@cache_respostas.em_cache_async(contadores=True)
+async def index():
+    total_result = await fetch_one(rotas_comuns.QUERY_TOTAL)
+    total = total_result['total'] if total_result else 0
+    top_nomes = await fetch_all(QUERY_RANKING, (10,))
+    return await render_template('index.html', total=total, top_nomes=top_nomes)
+
+@app.route('/buscar', methods=['GET', 'POST'])
+async def buscar():
+    termo_pesquisado = ''
+    resultados = []
+    if request.method == 'POST':
+        form = await request.form
+        termo_pesquisado = form.get('termo', '').strip()
+        if termo_pesquisado:
+            indice = await obter_indice()
+            if indice is not None:
+                resultados = indice.linhas(indice.contem(termo_pesquisado))
+            else:
+                resultados = await fetch_all(rotas_comuns.QUERY_BUSCA, (f'%{termo_pesquisado}%',))
+            if resultados:
+                ids = rotas_comuns.marcar_pesquisados(resultados)
+                # O buffer dos contadores usa psycopg2 e, no modo serverless,
+                # grava na hora (flush síncrono): fora do event loop.
+                await asyncio.to_thread(contador_pesquisas.registrar, ids)
+                await flash(f"{len(resultados)} nome(s) encontrado(s) e contador(es) atualizado(s).", 'success')
+            else:
+                await flash(f"Nenhum nome encontrado para '{termo_pesquisado}'.", 'warning')
+        else:
+            await flash("Por favor, digite um nome para buscar.", 'error')
+    return await render_template('buscar.html', resultados=resultados, termo_pesquisado=termo_pesquisado)
+
+async def contar_aproximado(pagina):
+    """Total aproximado de registros da listagem (ver rotas_comuns.Pagina)."""
+    total = pagina.total_estimado(await fetch_one(*pagina.consulta_estimativa()))
+    if total is None:
+        # Tabela ainda não analisada: conta de verdade.
+        result = await fetch_one(rotas_comuns.QUERY_TOTAL)
+        total = result['total'] if result else 0
+    return total
+
+@app.route('/listar')
+@cache_respostas.em_cache_async
+async def listar():
+    pagina = rotas_comuns.Pagina(request.args)
+    indice = await obter_indice()
+    if indice is not None:
+        contexto = pagina.do_indice(indice)
+    else:
+        total_registros, nomes = await asyncio.gather(contar_aproximado(pagina),
+                                                      fetch_all(*pagina.consulta_linhas()))
+        contexto = pagina.do_banco(nomes, total_registros)
+    return await render_template('listar.html', **contexto)
+
+@app.route('/cadastrar', methods=['GET', 'POST'])
+async def cadastrar():
+    if request.method == 'POST':
+        form = await request.form
+        nome, significado, origem, motivo_escolha = rotas_comuns.parametros_cadastro(form)
+        canonica = origens.canonizar_origem(origem)
+        if nome and significado and canonica:
+            inseridos = await execute_returning(rotas_comuns.QUERY_CADASTRO, rotas_comuns.valores_cadastro(
+                nome, significado, origem, canonica, motivo_escolha))
+            if inseridos:
+                invalidar_indice()
+                await asyncio.to_thread(cache_respostas.invalidar)
+                await flash(f"Nome '{nome}' cadastrado com sucesso!", 'success')
+                return redirect(url_for('listar'))
+            elif inseridos is not None:
+                await flash(f"O nome '{nome}' já existe no banco de dados.", 'error')
+            else:
+                await flash("Falha ao cadastrar o nome.", 'error')
+        else:
+            await flash("Nome, Significado e Origem são campos obrigatórios.", 'error')
+    return await render_template('cadastrar.html')
+
+@app.route('/exportar')
+async def exportar():
+    """Exporta os nomes (com os filtros do /listar) em CSV ou NDJSON, em streaming."""
+    formato, query, params = rotas_comuns.consulta_exportacao(request.args)
+    if formato is None:
+        abort(400)
+
+    async def gerar():
+        yield exportacao.cabecalho(formato)
+        try:
+            async with pool.connection() as conn:
+                # Cursor nomeado: o resultado fica no servidor e vem em lotes.
+                async with conn.cursor(name='exportar_nomes') as cursor:
+                    await cursor.execute(query, params)
+                    for tamanho in exportacao.tamanhos_lote():
+                        linhas = await cursor.fetchmany(tamanho)
+                        if not linhas:
+                            break
+                        yield exportacao.formatar_lote(formato, linhas)
+        except Exception as e:
+            # Os cabeçalhos HTTP já foram enviados: relança para o servidor
+            # abortar a resposta em chunks. Terminar o gerador normalmente
+            # entregaria ao cliente um arquivo "completo" sem parte das linhas.
+            print(f"Erro de banco de dados (exportar): {e}")
+            raise
+
+    mimetype, arquivo = exportacao.FORMATOS[formato]
+    response = app.response_class(gerar(), mimetype=mimetype)
+    response.headers['Content-Disposition'] = f'attachment; filename="{arquivo}"'
+    return response
+
+@app.route('/top10')
+@cache_respostas.em_cache_async(contadores=True)
+async def top10():
+    top_nomes = await fetch_all(QUERY_RANKING, (10,))
+    for i, nome in enumerate(top_nomes):
+        nome['ranking'] = i + 1
+    return await render_template('top10.html', top_nomes=top_nomes)
+
+@app.route('/saude')
+async def saude():
+    """Readiness: informa se o banco de dados está acessível."""
+    try:
+        async with pool.connection(timeout=5) as conn:
+            await conn.execute("SELECT 1")
+        banco_ok = True
+    except Exception as e:
+        print(f"Banco de dados inacessível: {e}")
+        banco_ok = False
+    status = 200 if banco_ok else 503
+    return jsonify(status='ok' if banco_ok else 'indisponivel',
+                   banco='ok' if banco_ok else 'inacessivel',
+                   pool=pool.get_stats()), status
+
+@app.route('/estatisticas')
+@cache_respostas.em_cache_async(contadores=True)
+async def estatisticas():
+    data_origem, data_top5 = await asyncio.gather(fetch_all(QUERY_ORIGENS), fetch_all(QUERY_RANKING, (5,)))
+    grafico_origem_url = url_for('grafico', nome_grafico='origens',
+                                 v=graficos.chave(*definir_grafico('origens', data_origem)))
+    grafico_top5_url = url_for('grafico', nome_grafico='top5',
+                               v=graficos.chave(*definir_grafico('top5', data_top5)))
+    return await render_template('estatisticas.html',
+                                 grafico_origem_url=grafico_origem_url,
+                                 grafico_top5_url=grafico_top5_url,
+                                 tabela_origem=data_origem,
+                                 tabela_top5=data_top5)
+
+@app.route('/graficos/<nome_grafico>.png')
+async def grafico(nome_grafico):
+    consulta = rotas_comuns.consulta_grafico(nome_grafico)
+    if consulta is None:
+        abort(404)
+    dados = await fetch_all(*consulta)
+    # Renderizar o PNG é trabalho de CPU: fica fora do event loop.
+    chave, png = await asyncio.to_thread(graficos.obter_png, *definir_grafico(nome_grafico, dados))
+    response = await make_response(png)
+    response.mimetype = 'image/png'
+    response.set_etag(chave)
+    if request.args.get('v') == chave:
+        response.cache_control.public = True
+        response.cache_control.max_age = 31536000
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+    return await response.make_conditional(request)
+
+if __name__ == '__main__':
+    app.run(debug=True, host='0.0.0.0', port=int(os.environ.get('PORT', 5000)))
@@ -0,0 +1,109 @@
+"""
+Benchmark da busca "nome ILIKE '%termo%'" com e sem índice de trigramas.
+
+Cria uma tabela própria (nomes_bench) no banco configurado em db_postgres
+(variáveis DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD), popula com nomes
+sintéticos e mostra o plano e a latência para 1 mil, 100 mil e 1 milhão de
+linhas. Use de preferência um PostgreSQL local:
+
+    DB_HOST=localhost DB_PASSWORD=postgres python benchmarks/bench_busca_trigram.py
+"""
+import os
+import sys
+import statistics
+
+import psycopg2
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import db_postgres as db_conexao  # noqa: E402
+
+TAMANHOS = [1_000, 100_000, 1_000_000]
+TERMOS = ['ana', 'rique', 'cel']
+REPETICOES = 5
+
+SILABAS = ['a', 'be', 'ca', 'da', 'el', 'fa', 'gu', 'he', 'il', 'jo',
+           'ka', 'lu', 'ma', 'na', 'ol', 'pe', 'ri', 'que', 'sa', 'to']
+ORIGENS = ['Grego', 'Latim', 'Tupi', 'Hebraico', 'Germânico', 'Árabe', 'Celta', 'Francês']
+
+
+def conectar():
+    return psycopg2.connect(host=db_conexao.DB_HOST, port=db_conexao.DB_PORT,
+                            database=db_conexao.DB_NAME, user=db_conexao.DB_USER,
+                            password=db_conexao.DB_PASSWORD)
+
+
+def popular(cursor, total):
+    cursor.execute("DROP TABLE IF EXISTS nomes_bench")
+    cursor.execute("""
+        CREATE TABLE nomes_bench (
+            id SERIAL PRIMARY KEY,
+            nome VARCHAR(255) NOT NULL,
+            origem VARCHAR(100)
+        )
+    """)
+    cursor.execute("SELECT setseed(0.42)")
+    cursor.execute("""
+        INSERT INTO nomes_bench (nome, origem)
+        SELECT initcap(s[1 + floor(random() * 20)::int]
+                    || s[1 + floor(random() * 20)::int]
+                    || s[1 + floor(random() * 20)::int]
+                    || s[1 + floor(random() * 20)::int]),
+               o[1 + floor(random() * 8)::int]
+        FROM generate_series(1, %s) AS i,
+             (SELECT %s::text[] AS s, %s::text[] AS o) AS dados
+    """, (total, SILABAS, ORIGENS))
+    cursor.execute("ANALYZE nomes_bench")
+
+
+def medir(cursor, termo):
+    """Retorna (nó raiz do plano, mediana do tempo de execução em ms)."""
+    tempos = []
+    plano = None
+    for _ in range(REPETICOES):
+        cursor.execute("""
+            EXPLAIN (ANALYZE, FORMAT JSON)
+            SELECT id, nome, origem FROM nomes_bench
+            WHERE nome ILIKE %s
+            ORDER BY nome ASC
+        """, (f'%{termo}%',))
+        resultado = cursor.fetchone()[0][0]
+        tempos.append(resultado['Execution Time'])
+        plano = resultado['Plan']
+    return descrever_plano(plano), statistics.median(tempos)
+
+
+def descrever_plano(plano):
+    """Resume o plano como 'Sort > Bitmap Heap Scan > Bitmap Index Scan'."""
+    nos = []
+    while plano:
+        nos.append(plano['Node Type'])
+        filhos = plano.get('Plans') or []
+        plano = filhos[0] if filhos else None
+    return ' > '.join(nos)
+
+
+def main():
+    conn = conectar()
+    conn.autocommit = True
+    cursor = conn.cursor()
+    cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    try:
+        for total in TAMANHOS:
+            print(f"\n=== {total:,} linhas ===".replace(',', '.'))
+            popular(cursor, total)
+            for indice in (False, True):
+                if indice:
+                    cursor.execute("CREATE INDEX idx_nomes_bench_trgm ON nomes_bench USING gin (nome gin_trgm_ops)")
+                    cursor.execute("ANALYZE nomes_bench")
+                rotulo = 'com pg_trgm' if indice else 'sem índice '
+                for termo in TERMOS:
+                    plano, ms = medir(cursor, termo)
+                    print(f"  [{rotulo}] '%{termo}%': {ms:9.3f} ms  | {plano}")
+    finally:
+        cursor.execute("DROP TABLE IF EXISTS nomes_bench")
+        cursor.close()
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
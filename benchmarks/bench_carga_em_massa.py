@@ -0,0 +1,135 @@
+"""
+Benchmark da carga em massa (carga_em_massa.py): linhas/s para 1k, 100k e 1M
+nomes sintéticos.
+
+    python benchmarks/bench_carga_em_massa.py              # só SQLite
+    python benchmarks/bench_carga_em_massa.py --postgres   # SQLite + PostgreSQL local
+
+O SQLite roda num arquivo temporário, com o mesmo schema do nomes.db, e é
+comparado ao laço antigo dos scripts (SELECT + INSERT por linha). No
+PostgreSQL (variáveis DB_*) a carga vai para um schema descartável
+"bench_carga", criado e removido pelo script.
+"""
+import os
+import sys
+import time
+import sqlite3
+import tempfile
+import subprocess
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import carga_em_massa  # noqa: E402
+
+TAMANHOS = [1_000, 100_000, 1_000_000]
+# O laço antigo é lento demais para 1M linhas.
+MAX_LACO_ANTIGO = 100_000
+ORIGENS = ['Hebr aico', 'Lati m', 'Grego', 'Tupi', 'Germ ânico', 'Ára be', 'Português']
+
+SCHEMA_SQLITE = """
+    CREATE TABLE nomes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        nome TEXT NOT NULL UNIQUE,
+        significado TEXT,
+        origem TEXT,
+        motivo_escolha TEXT,
+        pesquisas INTEGER DEFAULT 0
+    );
+    CREATE INDEX idx_nome ON nomes(nome);
+    CREATE INDEX idx_origem ON nomes(origem);
+"""
+
+
+def sinteticos(total):
+    """Gera nomes sintéticos; ~1% repetidos, como no arquivo real."""
+    for i in range(total):
+        numero = i - 1 if i % 100 == 99 else i
+        yield (f"\tNome{numero:07d}\t", f"Significado do nome {numero}",
+               ORIGENS[numero % len(ORIGENS)], "Benchmark")
+
+
+def banco_sqlite(pasta, nome):
+    caminho = os.path.join(pasta, nome)
+    conn = sqlite3.connect(caminho)
+    conn.executescript(SCHEMA_SQLITE)
+    conn.close()
+    return caminho
+
+
+def laco_antigo(caminho, registros):
+    """O que populate_db.py fazia: um SELECT e um INSERT por nome."""
+    conn = sqlite3.connect(caminho)
+    cursor = conn.cursor()
+    for nome, significado, origem, motivo in registros:
+        cursor.execute("SELECT id FROM nomes WHERE nome = ?", (nome,))
+        if cursor.fetchone() is None:
+            cursor.execute("""
+                INSERT INTO nomes (nome, significado, origem, motivo_escolha, pesquisas)
+                VALUES (?, ?, ?, ?, 0)
+            """, (nome, significado, origem, motivo))
+    conn.commit()
+    conn.close()
+
+
+def medir(funcao):
+    inicio = time.perf_counter()
+    funcao()
+    return time.perf_counter() - inicio
+
+
+def bench_sqlite():
+    print(f"{'SQLite':<10} {'linhas':>10} {'laço antigo':>16} {'carga em massa':>16}")
+    with tempfile.TemporaryDirectory() as pasta:
+        for total in TAMANHOS:
+            antigo = '-'
+            if total <= MAX_LACO_ANTIGO:
+                caminho = banco_sqlite(pasta, f"antigo_{total}.db")
+                segundos = medir(lambda: laco_antigo(caminho, sinteticos(total)))
+                antigo = f"{total / segundos:,.0f}/s"
+            caminho = banco_sqlite(pasta, f"massa_{total}.db")
+            progresso = carga_em_massa.Progresso(saida=None)
+            segundos = medir(lambda: carga_em_massa.carregar_sqlite(sinteticos(total), caminho, progresso))
+            print(f"{'':<10} {total:>10,} {antigo:>16} {total / segundos:>14,.0f}/s")
+
+
+def bench_postgres():
+    ambiente = dict(os.environ, PGOPTIONS='-c search_path=bench_carga,public')
+    codigo = r'''
+import sys, time
+sys.path.insert(0, sys.argv[1])
+import db_postgres, carga_em_massa
+from bench_carga_em_massa import sinteticos
+db_postgres.init_db()
+total = int(sys.argv[2])
+progresso = carga_em_massa.Progresso(saida=None)
+inicio = time.perf_counter()
+lidos, inseridos = carga_em_massa.carregar_postgres(sinteticos(total), progresso)
+print(f"{total / (time.perf_counter() - inicio):.0f} {inseridos}")
+'''
+    import psycopg2
+    import db_postgres
+    print(f"{'PostgreSQL':<10} {'linhas':>10} {'carga em massa':>16} {'inseridos':>12}")
+    for total in TAMANHOS:
+        conn = psycopg2.connect(host=db_postgres.DB_HOST, port=db_postgres.DB_PORT,
+                                database=db_postgres.DB_NAME, user=db_postgres.DB_USER,
+                                password=db_postgres.DB_PASSWORD)
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute("DROP SCHEMA IF EXISTS bench_carga CASCADE; CREATE SCHEMA bench_carga;")
+        try:
+            saida = subprocess.run([sys.executable, '-c', codigo, RAIZ, str(total)],
+                                   cwd=os.path.dirname(os.path.abspath(__file__)), env=ambiente,
+                                   check=True, capture_output=True, text=True).stdout
+            taxa, inseridos = saida.strip().splitlines()[-1].split()
+            print(f"{'':<10} {total:>10,} {float(taxa):>14,.0f}/s {int(inseridos):>12,}")
+        finally:
+            with conn.cursor() as cursor:
+                cursor.execute("DROP SCHEMA IF EXISTS bench_carga CASCADE;")
+            conn.close()
+
+
+if __name__ == '__main__':
+    bench_sqlite()
+    if '--postgres' in sys.argv:
+        bench_postgres()
@@ -0,0 +1,114 @@
+"""
+Benchmark do conjunto de nomes em arquivo (dados_nomes.py) contra a lista de
+tuplas embutida no código, como ficava no populate_db.py.
+
+    python benchmarks/bench_dados_nomes.py
+
+Para comparar com o mesmo conteúdo, o módulo antigo é gerado a partir do
+dados/nomes.csv.gz ("nomes = [(...), ...]") num diretório temporário. Mede
+tempo e pico de memória (tracemalloc) de: importar o módulo sem .pyc
+(compilar a lista), importar com .pyc, e ler o arquivo compactado (com a
+conferência do checksum); e, em cada caso, a carga num SQLite temporário.
+"""
+import os
+import sys
+import time
+import sqlite3
+import tempfile
+import importlib
+import importlib.util
+import py_compile
+import tracemalloc
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import dados_nomes  # noqa: E402
+import carga_em_massa  # noqa: E402
+
+REPETICOES = 5
+SCHEMA_SQLITE = """
+    CREATE TABLE nomes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        nome TEXT NOT NULL UNIQUE,
+        significado TEXT,
+        origem TEXT,
+        motivo_escolha TEXT,
+        pesquisas INTEGER DEFAULT 0
+    );
+"""
+
+
+def gerar_modulo_antigo(pasta):
+    """Escreve nomes_literal.py no formato dos scripts antigos (campos com tabs)."""
+    caminho = os.path.join(pasta, 'nomes_literal.py')
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        arquivo.write("nomes = [\n")
+        for registro in dados_nomes.ler():
+            arquivo.write("(" + ", ".join(repr(f"\t{campo}\t") for campo in registro) + "),\n")
+        arquivo.write("]\n")
+    return caminho
+
+
+def importar_literal(modulo, com_pyc):
+    sys.modules.pop('nomes_literal', None)
+    pyc = importlib.util.cache_from_source(modulo)
+    if com_pyc and not os.path.exists(pyc):
+        py_compile.compile(modulo, pyc)
+    elif not com_pyc and os.path.exists(pyc):
+        os.remove(pyc)
+    importlib.invalidate_caches()
+    return importlib.import_module('nomes_literal').nomes
+
+
+def medir(funcao):
+    """(segundos, pico de memória em KB, resultado), melhor de REPETICOES."""
+    melhor = None
+    for _ in range(REPETICOES):
+        tracemalloc.start()
+        inicio = time.perf_counter()
+        resultado = funcao()
+        segundos = time.perf_counter() - inicio
+        pico = tracemalloc.get_traced_memory()[1] / 1024
+        tracemalloc.stop()
+        if melhor is None or segundos < melhor[0]:
+            melhor = (segundos, pico, resultado)
+    return melhor
+
+
+def carregar(pasta, registros):
+    caminho = os.path.join(pasta, 'bench.db')
+    if os.path.exists(caminho):
+        os.remove(caminho)
+    conn = sqlite3.connect(caminho)
+    conn.executescript(SCHEMA_SQLITE)
+    conn.close()
+    return carga_em_massa.carregar_sqlite(registros, caminho)
+
+
+if __name__ == '__main__':
+    sys.dont_write_bytecode = True
+    with tempfile.TemporaryDirectory() as pasta:
+        modulo = gerar_modulo_antigo(pasta)
+        sys.path.insert(0, pasta)
+        importar_literal(modulo, com_pyc=True)
+        tamanho_pyc = os.path.getsize(importlib.util.cache_from_source(modulo))
+
+        print(f"Lista no código: {os.path.getsize(modulo) / 1024:.0f} KB de .py, "
+              f"{tamanho_pyc / 1024:.0f} KB de .pyc")
+        print(f"Arquivo de dados: {os.path.getsize(dados_nomes.ARQUIVO) / 1024:.0f} KB (.csv.gz)")
+        print()
+        print(f"{'':<34} {'leitura':>10} {'pico':>10} {'leitura + carga':>16} {'pico':>10}")
+        casos = [
+            ("lista no código (sem .pyc)", lambda: importar_literal(modulo, com_pyc=False)),
+            ("lista no código (com .pyc)", lambda: importar_literal(modulo, com_pyc=True)),
+            ("dados/nomes.csv.gz (streaming)", lambda: sum(1 for _ in dados_nomes.ler())),
+        ]
+        for rotulo, funcao in casos:
+            leitura, pico_leitura, _ = medir(funcao)
+            if rotulo.startswith('dados'):
+                total, pico_total, _ = medir(lambda: carregar(pasta, dados_nomes.ler()))
+            else:
+                total, pico_total, _ = medir(lambda: carregar(pasta, funcao()))
+            print(f"{rotulo:<34} {leitura * 1000:>8.1f}ms {pico_leitura:>8.0f}KB "
+                  f"{total * 1000:>14.1f}ms {pico_total:>8.0f}KB")
@@ -0,0 +1,74 @@
+"""
+Benchmark da detecção de duplicados (deduplicacao.py) contra o laço antigo
+do funcão_duplicatas.encontrar_duplicados (dict de listas, nome exato).
+
+    python benchmarks/bench_deduplicacao.py
+
+Para 10k, 100k, 1M e 3M tuplas sintéticas (~2% de nomes repetidos, metade
+com acento ou maiúscula diferente e significado/origem divergentes):
+- laço antigo: dict de listas em Python;
+- por_nome exato: lista de tuplas -> DataFrame -> mesmo dict do laço antigo;
+- por_nome: idem, ignorando acentos e maiúsculas (padrão);
+- relatorio: DataFrame já montado -> grupos com conflitos (lote colunar,
+  como vem da tabela nomes ou de um CSV).
+"""
+import os
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import deduplicacao  # noqa: E402
+
+TAMANHOS = [10_000, 100_000, 1_000_000, 3_000_000]
+ORIGENS = ['Hebraico', 'Latim', 'Grego', 'Tupi', 'Germânico', 'Árabe', 'Português']
+
+
+def sinteticos(total):
+    registros = []
+    for i in range(total):
+        if i % 50 == 49:
+            # Repete o nome anterior: exato ou com acento/maiúscula diferentes.
+            numero, nome = i - 1, f"Nome{i - 1:07d}" if i % 100 == 99 else f"NÔME{i - 1:07d}"
+            origem = ORIGENS[(i + 1) % len(ORIGENS)]
+        else:
+            numero, nome = i, f"Nome{i:07d}"
+            origem = ORIGENS[i % len(ORIGENS)]
+        registros.append((nome, f"Significado {numero}", origem, "Benchmark"))
+    return registros
+
+
+def laco_antigo(lista_nomes):
+    """O encontrar_duplicados original."""
+    contagem = {}
+    for nome, significado, origem, motivacao in lista_nomes:
+        if nome in contagem:
+            contagem[nome].append((significado, origem, motivacao))
+        else:
+            contagem[nome] = [(significado, origem, motivacao)]
+    return {nome: detalhes for nome, detalhes in contagem.items() if len(detalhes) > 1}
+
+
+def medir(funcao):
+    inicio = time.perf_counter()
+    resultado = funcao()
+    return time.perf_counter() - inicio, resultado
+
+
+if __name__ == '__main__':
+    print(f"{'tuplas':>10} {'laço antigo':>18} {'por_nome exato':>18} {'por_nome':>18} "
+          f"{'relatorio':>18} {'conflitos':>10}")
+    for total in TAMANHOS:
+        registros = sinteticos(total)
+        antigo, exatos = medir(lambda: laco_antigo(registros))
+        exato, grupos_exatos = medir(lambda: deduplicacao.por_nome(registros, normalizar=False))
+        assert grupos_exatos == exatos
+        lote, grupos = medir(lambda: deduplicacao.por_nome(registros))
+        df = deduplicacao.tabela(registros)
+        colunar, relatorio = medir(lambda: deduplicacao.relatorio(df))
+        conflitos = int((relatorio['conflito_significado'] | relatorio['conflito_origem']).sum())
+        print(f"{total:>10,} {antigo * 1000:>9.0f}ms {len(exatos):>6,}g "
+              f"{exato * 1000:>9.0f}ms {len(grupos_exatos):>6,}g "
+              f"{lote * 1000:>9.0f}ms {len(grupos):>6,}g "
+              f"{colunar * 1000:>9.0f}ms {len(relatorio):>6,}g {conflitos:>10,}")
@@ -0,0 +1,125 @@
+"""
+Mede o custo de importação (cold start) do app: "import app".
+
+Roda o mesmo comando ("python -X importtime") na árvore atual e num
+checkout do commit de referência, criado com "git worktree" num diretório
+temporário. Por padrão a referência é o pai do commit que passou a
+importar o matplotlib sob demanda e tirou o pandas do app.py, e assim
+entram na conta todos os módulos que o app.py importa de fato, sem lista
+fixa. Cada execução é um processo novo; o relatório completo é gravado em
+benchmarks/importtime_app.txt.
+
+O app.py antigo chamava init_db() ao ser importado (conexão e CREATE
+TABLE, ou exit(1) sem banco). Para medir só os imports, o comando importa
+antes o db_postgres e troca o init_db() por uma função vazia; o tempo do
+app soma as linhas do db_postgres e do app, nos dois lados. É preciso ter
+o pandas e o matplotlib instalados (requirements.txt).
+
+    python benchmarks/bench_importtime.py
+    python benchmarks/bench_importtime.py --base <commit>
+"""
+import os
+import re
+import sys
+import argparse
+import tempfile
+import subprocess
+import statistics
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RELATORIO = os.path.join(RAIZ, 'benchmarks', 'importtime_app.txt')
+REPETICOES = 5
+COMANDO = 'import db_postgres; db_postgres.init_db = lambda *args, **kwargs: None; import app'
+# Commit que tirou o pandas e o matplotlib do caminho de "import app".
+ASSUNTO_IMPORTS_SOB_DEMANDA = r'^\[user-007\] Import matplotlib lazily'
+
+LINHA = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def git(*args):
+    return subprocess.run(['git', *args], cwd=RAIZ, capture_output=True, text=True, check=True).stdout.strip()
+
+
+def commit_base():
+    """Pai do commit que passou a importar o matplotlib sob demanda."""
+    commit = git('log', '--format=%H', '--grep', ASSUNTO_IMPORTS_SOB_DEMANDA, 'HEAD').splitlines()
+    if not commit:
+        raise SystemExit("Commit de referência não encontrado: informe --base.")
+    return commit[-1] + '^'
+
+
+def medir(pasta):
+    """Roda COMANDO num processo novo dentro da pasta; retorna (ms, saída do importtime)."""
+    processo = subprocess.run([sys.executable, '-X', 'importtime', '-c', COMANDO],
+                              cwd=pasta, capture_output=True, text=True)
+    # Tempo acumulado das linhas de nível superior do db_postgres e do app.
+    totais = {m.group(4): int(m.group(2)) for m in LINHA.finditer(processo.stderr)
+              if len(m.group(3)) == 1 and m.group(4) in ('db_postgres', 'app')}
+    if processo.returncode != 0 or 'app' not in totais:
+        linhas = processo.stderr.strip().splitlines() or [f"código de saída {processo.returncode}"]
+        raise RuntimeError(linhas[-1])
+    return sum(totais.values()) / 1000, processo.stderr
+
+
+def maiores(saida, quantidade=15):
+    """Os imports diretos do db_postgres e do app mais caros (tempo acumulado)."""
+    # O importtime lista os filhos antes do pai: os diretos de um módulo são
+    # os de um nível abaixo entre a linha de nível superior anterior e a dele.
+    diretos, bloco = [], []
+    for m in LINHA.finditer(saida):
+        if len(m.group(3)) == 3:
+            bloco.append((int(m.group(2)), m.group(4)))
+        elif len(m.group(3)) == 1:
+            if m.group(4) in ('db_postgres', 'app'):
+                diretos.extend(bloco)
+            bloco = []
+    return sorted(diretos, reverse=True)[:quantidade]
+
+
+def cenario(rotulo, pasta, relatorio):
+    tempos = []
+    saida = ''
+    try:
+        for _ in range(REPETICOES):
+            ms, saida = medir(pasta)
+            tempos.append(ms)
+    except RuntimeError as e:
+        resumo = f"{rotulo}: não foi possível medir ({e})"
+        print(resumo)
+        relatorio.write(f"# {resumo}\n\n")
+        return None
+    mediana = statistics.median(tempos)
+    resumo = f"{rotulo}: mediana {mediana:.1f} ms em {REPETICOES} execuções"
+    print(resumo)
+    relatorio.write(f"# {resumo}\n")
+    for us, modulo in maiores(saida):
+        relatorio.write(f"#   {us / 1000:9.1f} ms  {modulo}\n")
+    relatorio.write(saida + '\n')
+    return mediana
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compara o tempo de 'import app' com o de um commit anterior.")
+    parser.add_argument('--base', metavar='COMMIT',
+                        help="commit de referência (padrão: o anterior aos imports sob demanda)")
+    args = parser.parse_args(argv)
+
+    base = git('rev-parse', '--short', args.base or commit_base())
+    atual = git('rev-parse', '--short', 'HEAD')
+    with tempfile.TemporaryDirectory() as pasta_temp:
+        pasta_base = os.path.join(pasta_temp, 'base')
+        git('worktree', 'add', '--detach', pasta_base, base)
+        try:
+            with open(RELATORIO, 'w', encoding='utf-8') as relatorio:
+                relatorio.write(f"# python -X importtime -c \"{COMANDO}\" (Python {sys.version.split()[0]})\n\n")
+                antes = cenario(f"antes ({base})", pasta_base, relatorio)
+                agora = cenario(f"agora ({atual})", RAIZ, relatorio)
+        finally:
+            git('worktree', 'remove', '--force', pasta_base)
+    if antes and agora:
+        print(f"'import app' {antes / agora:.1f}x mais rápido")
+    print(f"Relatório completo em {os.path.relpath(RELATORIO, RAIZ)}")
+
+
+if __name__ == '__main__':
+    main()
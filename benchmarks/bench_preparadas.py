@@ -0,0 +1,82 @@
+"""
+Micro-benchmark: consultas do app com e sem instruções preparadas (PREPARE).
+
+Roda as consultas que o app executa (importadas de rotas_comuns, as mesmas
+do app.py e do app_async.py) contra o banco configurado em db_postgres (use
+um PostgreSQL local, já populado e migrado com init_db):
+
+    DB_HOST=localhost DB_PASSWORD=postgres python benchmarks/bench_preparadas.py
+
+Para cada consulta mostra o tempo médio por execução com SQL simples
+(análise + planejamento a cada vez), com EXECUTE de uma instrução preparada,
+e o "Planning Time" que o EXPLAIN ANALYZE reporta para o SQL simples.
+"""
+import os
+import sys
+import time
+
+import psycopg2
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import db_postgres as db_conexao  # noqa: E402
+import consultas  # noqa: E402
+import rotas_comuns  # noqa: E402
+
+REPETICOES = 2000
+
+CONSULTAS = {
+    'top10': (rotas_comuns.QUERY_RANKING, (10,)),
+    'total': (rotas_comuns.QUERY_TOTAL, ()),
+    'busca': (rotas_comuns.QUERY_BUSCA, ('%ana%',)),
+    'pagina': rotas_comuns.Pagina({'after': 'M,0'}).consulta_linhas(),
+    'filtro': rotas_comuns.Pagina({'nome': 'ana', 'origem': 'lat'}).consulta_linhas(),
+    'origens': (rotas_comuns.QUERY_ORIGENS, ()),
+}
+
+
+def conectar():
+    return psycopg2.connect(host=db_conexao.DB_HOST, port=db_conexao.DB_PORT,
+                            database=db_conexao.DB_NAME, user=db_conexao.DB_USER,
+                            password=db_conexao.DB_PASSWORD,
+                            connection_factory=db_conexao.Conexao)
+
+
+def cronometrar(funcao):
+    inicio = time.perf_counter()
+    for _ in range(REPETICOES):
+        funcao()
+    return (time.perf_counter() - inicio) / REPETICOES * 1e6
+
+
+def tempo_planejamento(cursor, sql, params):
+    cursor.execute("EXPLAIN (ANALYZE, FORMAT JSON) " + sql, params)
+    return cursor.fetchone()[0][0]['Planning Time'] * 1000
+
+
+def main():
+    conn = conectar()
+    conn.autocommit = True
+    cursor = conn.cursor()
+    print(f"{'consulta':<10} {'simples (µs)':>13} {'preparada (µs)':>15} {'ganho':>7} {'planejamento (µs)':>18}")
+    for rotulo, (sql, params) in CONSULTAS.items():
+        def simples():
+            cursor.execute(sql, params)
+            cursor.fetchall()
+
+        def preparada():
+            consultas.executar(cursor, sql, params)
+            cursor.fetchall()
+
+        simples()
+        preparada()
+        t_simples = cronometrar(simples)
+        t_preparada = cronometrar(preparada)
+        planejamento = tempo_planejamento(cursor, sql, params)
+        ganho = (1 - t_preparada / t_simples) * 100
+        print(f"{rotulo:<10} {t_simples:13.1f} {t_preparada:15.1f} {ganho:6.1f}% {planejamento:18.1f}")
+    cursor.close()
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark e conjunto de acurácia do reparo de espaços (reparo_espacos.py).
+
+    python benchmarks/bench_reparo_espacos.py
+
+Acurácia: benchmarks/reparo_espacos_casos.tsv traz linhas extraídas do PDF
+("quebrado") e a mesma linha no livro_dos_nomes.txt ("esperado"), pareadas
+pelo texto sem espaços: 600 linhas com espaços quebrados e 200 já corretas
+(para medir junções indevidas). Velocidade: reparo de nome, significado e
+origem de todas as linhas do nomes.db.
+"""
+import os
+import sys
+import csv
+import time
+import sqlite3
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import reparo_espacos  # noqa: E402
+
+CASOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'reparo_espacos_casos.tsv')
+
+
+def acuracia(reparador):
+    with open(CASOS, encoding='utf-8', newline='') as arquivo:
+        casos = list(csv.DictReader(arquivo, delimiter='\t', quoting=csv.QUOTE_NONE))
+    quebrados = [c for c in casos if c['quebrado'] != c['esperado']]
+    corretos = [c for c in casos if c['quebrado'] == c['esperado']]
+    reparados = sum(reparador.reparar(c['quebrado']) == c['esperado'] for c in quebrados)
+    intactos = sum(reparador.reparar(c['quebrado']) == c['esperado'] for c in corretos)
+
+    # Por palavra: quantas palavras do texto esperado saíram iguais.
+    palavras_ok = palavras_total = 0
+    for caso in quebrados:
+        esperado = caso['esperado'].split()
+        obtido = set(reparador.reparar(caso['quebrado']).split())
+        palavras_ok += sum(p in obtido for p in esperado)
+        palavras_total += len(esperado)
+
+    print(f"Linhas quebradas reparadas por completo: {reparados}/{len(quebrados)} "
+          f"({reparados / len(quebrados):.1%})")
+    print(f"Palavras corretas nas linhas quebradas:  {palavras_ok}/{palavras_total} "
+          f"({palavras_ok / palavras_total:.1%})")
+    print(f"Linhas corretas mantidas intactas:       {intactos}/{len(corretos)} "
+          f"({intactos / len(corretos):.1%})")
+    sem_reparo = sum(' '.join(c['quebrado'].split()) == c['esperado'] for c in quebrados)
+    print(f"(sem reparo, linhas quebradas corretas:  {sem_reparo}/{len(quebrados)})")
+
+
+def velocidade(reparador):
+    conn = sqlite3.connect(os.path.join(RAIZ, 'nomes.db'))
+    linhas = conn.execute("SELECT nome, significado, origem FROM nomes").fetchall()
+    conn.close()
+    inicio = time.perf_counter()
+    for linha in linhas:
+        for valor in linha:
+            reparador.reparar(valor)
+    segundos = time.perf_counter() - inicio
+    print(f"nomes.db: {len(linhas)} linhas em {segundos * 1000:.0f} ms "
+          f"({segundos / len(linhas) * 1000 * 1000:.0f} ms por mil linhas)")
+
+
+if __name__ == '__main__':
+    inicio = time.perf_counter()
+    reparador = reparo_espacos.Reparador.de_arquivo()
+    print(f"Vocabulário e trie montados em {(time.perf_counter() - inicio) * 1000:.0f} ms")
+    acuracia(reparador)
+    velocidade(reparador)
@@ -0,0 +1,82 @@
+"""
+Teste de carga: app síncrono (Flask + gunicorn) x assíncrono (Quart + hypercorn).
+
+Suba as duas versões apontando para o mesmo PostgreSQL local, com o mesmo
+número de workers, por exemplo:
+
+    DB_HOST=localhost gunicorn -w 2 -b 127.0.0.1:8000 app:app
+    DB_HOST=localhost hypercorn -w 2 -b 127.0.0.1:8001 app_async:app
+
+e rode:
+
+    python benchmarks/carga_sync_async.py http://127.0.0.1:8000 http://127.0.0.1:8001
+
+Cada rota é atacada com CONCORRENCIA clientes simultâneos por DURACAO
+segundos; o script mostra requisições/s, latência p50/p95 e erros.
+"""
+import sys
+import time
+import statistics
+import urllib.request
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+CONCORRENCIA = [1, 16, 64]
+DURACAO = 10
+ROTAS = [
+    ('GET', '/', None),
+    ('GET', '/top10', None),
+    ('GET', '/listar?nome=an', None),
+    ('POST', '/buscar', {'termo': 'ana'}),
+    ('GET', '/estatisticas', None),
+]
+
+
+def requisitar(base, metodo, rota, dados):
+    corpo = urllib.parse.urlencode(dados).encode() if dados else None
+    req = urllib.request.Request(base + rota, data=corpo, method=metodo)
+    inicio = time.perf_counter()
+    with urllib.request.urlopen(req, timeout=30) as resposta:
+        resposta.read()
+    return time.perf_counter() - inicio
+
+
+def cliente(base, metodo, rota, dados, fim):
+    latencias, erros = [], 0
+    while time.perf_counter() < fim:
+        try:
+            latencias.append(requisitar(base, metodo, rota, dados))
+        except Exception:
+            erros += 1
+    return latencias, erros
+
+
+def rodar(base, metodo, rota, dados, concorrencia):
+    fim = time.perf_counter() + DURACAO
+    with ThreadPoolExecutor(max_workers=concorrencia) as executor:
+        futuros = [executor.submit(cliente, base, metodo, rota, dados, fim) for _ in range(concorrencia)]
+        resultados = [f.result() for f in futuros]
+    latencias = [lat for lats, _ in resultados for lat in lats]
+    erros = sum(e for _, e in resultados)
+    if not latencias:
+        return 0.0, 0.0, 0.0, erros
+    latencias.sort()
+    p95 = latencias[int(len(latencias) * 0.95) - 1] if len(latencias) >= 20 else latencias[-1]
+    return len(latencias) / DURACAO, statistics.median(latencias) * 1000, p95 * 1000, erros
+
+
+def main():
+    if len(sys.argv) != 3:
+        print(__doc__)
+        sys.exit(1)
+    alvos = {'sync': sys.argv[1].rstrip('/'), 'async': sys.argv[2].rstrip('/')}
+    print(f"{'rota':<18} {'conc':>5} {'versão':>6} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'erros':>6}")
+    for metodo, rota, dados in ROTAS:
+        for concorrencia in CONCORRENCIA:
+            for versao, base in alvos.items():
+                rps, p50, p95, erros = rodar(base, metodo, rota, dados, concorrencia)
+                print(f"{rota:<18} {concorrencia:>5} {versao:>6} {rps:9.1f} {p50:9.1f} {p95:9.1f} {erros:>6}")
+
+
+if __name__ == '__main__':
+    main()
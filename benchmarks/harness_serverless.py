@@ -0,0 +1,177 @@
+"""
+Harness do modo serverless (DB_MODO=serverless) atrás de um PgBouncer em modo transação.
+
+Suba o PostgreSQL e o PgBouncer locais:
+
+    docker compose -f benchmarks/pgbouncer/docker-compose.yml up -d
+    python benchmarks/harness_serverless.py
+
+O script cria o schema direto no PostgreSQL (porta 5432) e simula INSTANCIAS
+instâncias serverless em processos separados, todas falando com o PgBouncer
+(porta 6432). Cada uma faz REQUISICOES requisições às rotas do app, uma por
+vez, como uma função da Vercel. Ao final confere que:
+
+  * nenhuma requisição falhou e nenhum erro de banco foi registrado
+    (ex.: "prepared statement ... does not exist");
+  * cada instância usou uma única conexão (sem reconexões), medido de dois
+    lados: as conexões que o processo abriu de fato (Conexao criadas, em
+    metricas_pool()['conexoes_abertas']) e os clientes distintos (endereço e
+    porta) que o PgBouncer viu com o application_name da instância
+    (PGAPPNAME), amostrados com SHOW CLIENTS no console de administração;
+  * o servidor nunca teve mais conexões do que o pool do PgBouncer.
+"""
+import os
+import sys
+import json
+import time
+import threading
+import subprocess
+
+import psycopg2
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INSTANCIAS = int(os.environ.get('HARNESS_INSTANCIAS', '40'))
+REQUISICOES = int(os.environ.get('HARNESS_REQUISICOES', '50'))
+POOL_PGBOUNCER = 5
+
+AMBIENTE_BASE = {
+    'DB_HOST': 'localhost',
+    'DB_NAME': 'postgres',
+    'DB_USER': 'postgres',
+    'DB_PASSWORD': 'postgres',
+}
+
+# Código rodado em cada instância simulada.
+INSTANCIA = r'''
+import json, sys
+from app import app
+import db_postgres
+
+cliente = app.test_client()
+falhas = 0
+numero = int(sys.argv[1])
+for i in range(int(sys.argv[2])):
+    respostas = [
+        cliente.get('/'),
+        cliente.get('/listar?nome=a'),
+        cliente.get('/listar?after=M,0&page=2'),
+        cliente.post('/buscar', data={'termo': 'an'}),
+        cliente.get('/top10'),
+        cliente.get('/saude'),
+        cliente.post('/cadastrar', data={'nome': f'Harness {numero}-{i}', 'significado': 'Teste',
+                                         'origem': 'Latim', 'motivo_escolha': 'harness'}),
+    ]
+    falhas += sum(1 for r in respostas if r.status_code >= 400)
+print('RESULTADO ' + json.dumps({'falhas': falhas, 'pool': db_postgres.metricas_pool()}))
+'''
+
+
+def conectar_direto():
+    return psycopg2.connect(host='localhost', port=5432, **{
+        'database': AMBIENTE_BASE['DB_NAME'], 'user': AMBIENTE_BASE['DB_USER'],
+        'password': AMBIENTE_BASE['DB_PASSWORD']})
+
+
+def preparar_banco():
+    ambiente = dict(os.environ, **AMBIENTE_BASE, DB_PORT='5432', DB_MODO='pool')
+    subprocess.run([sys.executable, 'db_postgres.py'], cwd=RAIZ, env=ambiente, check=True)
+    conn = conectar_direto()
+    with conn, conn.cursor() as cursor:
+        cursor.execute("DELETE FROM nomes WHERE motivo_escolha = 'harness'")
+        cursor.execute("INSERT INTO origens (nome) VALUES ('Latim') ON CONFLICT (nome) DO NOTHING")
+        cursor.execute("""
+            INSERT INTO nomes (nome, significado, origem, origem_id, motivo_escolha, pesquisas)
+            SELECT 'Nome ' || i, 'Significado ' || i, 'Latim',
+                   (SELECT id FROM origens WHERE nome = 'Latim'), 'harness', 0
+            FROM generate_series(1, 200) AS i
+        """)
+    conn.close()
+
+
+def conectar_admin_pgbouncer():
+    conn = psycopg2.connect(host='localhost', port=6432, database='pgbouncer',
+                            user=AMBIENTE_BASE['DB_USER'], password=AMBIENTE_BASE['DB_PASSWORD'])
+    conn.autocommit = True
+    return conn
+
+
+def clientes_pgbouncer(cursor):
+    """(application_name, endereço, porta) de cada cliente conectado ao PgBouncer."""
+    cursor.execute("SHOW CLIENTS")
+    colunas = [coluna[0] for coluna in cursor.description]
+    for linha in cursor.fetchall():
+        cliente = dict(zip(colunas, linha))
+        yield cliente.get('application_name') or '', cliente['addr'], cliente['port']
+
+
+def monitorar(parar, pico, clientes):
+    """Acompanha quantas conexões o PostgreSQL tem de fato e quais clientes
+    cada instância abriu no PgBouncer (clientes[application_name] = {(addr, porta)})."""
+    conn = conectar_direto()
+    conn.autocommit = True
+    admin = conectar_admin_pgbouncer()
+    with conn.cursor() as cursor, admin.cursor() as cursor_admin:
+        while not parar.is_set():
+            cursor.execute("""
+                SELECT COUNT(*) FROM pg_stat_activity
+                WHERE datname = %s AND backend_type = 'client backend' AND pid <> pg_backend_pid()
+            """, (AMBIENTE_BASE['DB_NAME'],))
+            pico[0] = max(pico[0], cursor.fetchone()[0])
+            for aplicacao, endereco, porta in clientes_pgbouncer(cursor_admin):
+                if aplicacao.startswith('harness-'):
+                    clientes.setdefault(aplicacao, set()).add((endereco, porta))
+            time.sleep(0.05)
+    admin.close()
+    conn.close()
+
+
+def main():
+    preparar_banco()
+    ambiente = dict(os.environ, **AMBIENTE_BASE, DB_PORT='6432', DB_MODO='serverless',
+                    INDICE_NOMES_MEMORIA='0')
+    parar, pico, clientes = threading.Event(), [0], {}
+    monitor = threading.Thread(target=monitorar, args=(parar, pico, clientes))
+    monitor.start()
+
+    inicio = time.perf_counter()
+    processos = [subprocess.Popen([sys.executable, '-c', INSTANCIA, str(n), str(REQUISICOES)],
+                                  cwd=RAIZ, env=dict(ambiente, PGAPPNAME=f'harness-{n}'),
+                                  stdout=subprocess.PIPE,
+                                  stderr=subprocess.STDOUT, text=True)
+                 for n in range(INSTANCIAS)]
+    saidas = [p.communicate()[0] for p in processos]
+    duracao = time.perf_counter() - inicio
+    parar.set()
+    monitor.join()
+
+    falhas = erros_banco = reconexoes = conexoes_por_instancia = 0
+    for saida in saidas:
+        erros_banco += sum(1 for linha in saida.splitlines() if linha.startswith('Erro'))
+        resultado = next((linha for linha in saida.splitlines() if linha.startswith('RESULTADO ')), None)
+        if resultado is None:
+            falhas += 1
+            print(saida[-2000:])
+            continue
+        dados = json.loads(resultado[len('RESULTADO '):])
+        falhas += dados['falhas']
+        reconexoes += dados['pool']['reconexoes']
+        conexoes_por_instancia = max(conexoes_por_instancia, dados['pool']['conexoes_abertas'])
+    clientes_por_instancia = max((len(vistos) for vistos in clientes.values()), default=0)
+
+    total = INSTANCIAS * REQUISICOES * 7
+    print(f"{INSTANCIAS} instâncias x {REQUISICOES} rodadas = {total} requisições em {duracao:.1f}s")
+    print(f"  respostas com falha:                  {falhas}")
+    print(f"  erros de banco registrados:           {erros_banco}")
+    print(f"  reconexões nas instâncias:            {reconexoes}")
+    print(f"  conexões abertas por instância:       {conexoes_por_instancia} (máximo entre os processos)")
+    print(f"  clientes por instância (PgBouncer):   {clientes_por_instancia} "
+          f"({len(clientes)} de {INSTANCIAS} instâncias vistas no SHOW CLIENTS)")
+    print(f"  pico de conexões no servidor:         {pico[0]} (pool do PgBouncer: {POOL_PGBOUNCER})")
+    ok = (falhas == 0 and erros_banco == 0 and reconexoes == 0 and conexoes_por_instancia == 1
+          and clientes_por_instancia == 1 and pico[0] <= POOL_PGBOUNCER)
+    print("OK" if ok else "FALHOU")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
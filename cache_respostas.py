@@ -0,0 +1,237 @@
+import os
+import time
+import asyncio
+import hashlib
+import secrets
+import threading
+from functools import wraps, partial
+from collections import OrderedDict
+
+from flask import request, session, make_response
+
+try:
+    import redis
+except ImportError:  # backend compartilhado é opcional
+    redis = None
+
+# Cache das páginas de leitura (/, /top10, /listar, /estatisticas).
+# Chave = rota + query string. Guarda as respostas num LRU local com TTL curto
+# e, se REDIS_URL estiver configurado, num Redis compartilhado entre workers.
+# Uma "versão dos dados" entra na chave e no ETag: /cadastrar muda a versão, o
+# que invalida as entradas e os ETags antigos. Os contadores de pesquisa têm
+# uma versão à parte, que o flush dos contadores muda: só as rotas marcadas
+# com em_cache(contadores=True) (ranking: /, /top10, /estatisticas) a usam.
+# Nas demais (/listar) a coluna de pesquisas pode atrasar até o TTL.
+TTL_SEGUNDOS = float(os.environ.get('CACHE_RESPOSTAS_TTL', '30'))
+MAX_ENTRADAS = int(os.environ.get('CACHE_RESPOSTAS_MAX', '256'))
+REDIS_URL = os.environ.get('REDIS_URL')
+
+_lru = OrderedDict()
+_lock = threading.Lock()
+# Sem backend compartilhado a versão é local ao processo; o prefixo aleatório
+# evita que dois workers gerem o mesmo ETag para dados diferentes.
+_epoca = secrets.token_hex(4)
+_versao_local = 0
+_versao_local_em = time.time()
+_contadores_local = 0
+_contadores_local_em = _versao_local_em
+_redis = None
+
+
+def _backend():
+    global _redis
+    if _redis is None and REDIS_URL and redis is not None:
+        _redis = redis.Redis.from_url(REDIS_URL, socket_timeout=0.2)
+    return _redis
+
+
+def versao(contadores=False):
+    """(versão dos dados, instante da última mudança em epoch).
+
+    Com contadores=True, a versão inclui também a dos contadores de pesquisa.
+    """
+    backend = _backend()
+    if backend is not None:
+        try:
+            numero, instante, numero_contadores, instante_contadores = backend.mget(
+                'nomes:versao', 'nomes:versao_em', 'nomes:versao_contadores', 'nomes:versao_contadores_em')
+            if not contadores:
+                return f"r{int(numero or 0)}", float(instante or 0)
+            return (f"r{int(numero or 0)}c{int(numero_contadores or 0)}",
+                    max(float(instante or 0), float(instante_contadores or 0)))
+        except redis.RedisError as e:
+            print(f"Cache compartilhado indisponível (versao): {e}")
+    # Só local: outro worker pode ter mudado os dados sem avisar este, então a
+    # versão também vence a cada TTL para limitar quanto tempo um ETag vale.
+    janela = int(time.time() // TTL_SEGUNDOS)
+    numero, instante = f"{_epoca}.{_versao_local}.{janela}", max(_versao_local_em, janela * TTL_SEGUNDOS)
+    if not contadores:
+        return numero, instante
+    return f"{numero}c{_contadores_local}", max(instante, _contadores_local_em)
+
+
+def invalidar():
+    """Os dados mudaram: nova versão e descarte das respostas guardadas."""
+    global _versao_local, _versao_local_em
+    with _lock:
+        _versao_local += 1
+        _versao_local_em = time.time()
+        _lru.clear()
+    backend = _backend()
+    if backend is not None:
+        try:
+            backend.pipeline().incr('nomes:versao').set('nomes:versao_em', time.time()).execute()
+        except redis.RedisError as e:
+            print(f"Cache compartilhado indisponível (invalidar): {e}")
+
+
+def invalidar_contadores():
+    """Os contadores de pesquisa mudaram: nova versão só para as rotas de ranking.
+
+    As respostas guardadas não são apagadas: as das rotas de ranking deixam
+    de ser encontradas (a chave muda) e saem pelo TTL/LRU; as demais continuam
+    valendo.
+    """
+    global _contadores_local, _contadores_local_em
+    with _lock:
+        _contadores_local += 1
+        _contadores_local_em = time.time()
+    backend = _backend()
+    if backend is not None:
+        try:
+            backend.pipeline().incr('nomes:versao_contadores').set('nomes:versao_contadores_em', time.time()).execute()
+        except redis.RedisError as e:
+            print(f"Cache compartilhado indisponível (invalidar_contadores): {e}")
+
+
+def _obter(chave):
+    agora = time.monotonic()
+    with _lock:
+        entrada = _lru.get(chave)
+        if entrada is not None:
+            expira_em, valor = entrada
+            if expira_em > agora:
+                _lru.move_to_end(chave)
+                return valor
+            del _lru[chave]
+    backend = _backend()
+    if backend is not None:
+        try:
+            bruto = backend.get(chave)
+        except redis.RedisError:
+            bruto = None
+        if bruto is not None:
+            mimetype, _, corpo = bruto.partition(b'\n')
+            valor = (corpo, mimetype.decode('ascii'))
+            _guardar_local(chave, valor)
+            return valor
+    return None
+
+
+def _guardar_local(chave, valor):
+    with _lock:
+        _lru[chave] = (time.monotonic() + TTL_SEGUNDOS, valor)
+        _lru.move_to_end(chave)
+        while len(_lru) > MAX_ENTRADAS:
+            _lru.popitem(last=False)
+
+
+def _guardar(chave, valor):
+    _guardar_local(chave, valor)
+    backend = _backend()
+    if backend is not None:
+        try:
+            corpo, mimetype = valor
+            backend.set(chave, mimetype.encode('ascii') + b'\n' + corpo, ex=max(int(TTL_SEGUNDOS), 1))
+        except redis.RedisError:
+            pass
+
+
+def _etag(numero_versao, rota):
+    return f"{numero_versao}-{hashlib.sha1(rota.encode('utf-8')).hexdigest()[:10]}"
+
+
+def _cabecalhos(response, etag, modificado_em):
+    response.set_etag(etag)
+    if modificado_em:
+        response.last_modified = modificado_em
+    response.cache_control.public = True
+    response.cache_control.no_cache = True
+    return response
+
+
+def em_cache(view=None, contadores=False):
+    """Decorator para rotas GET de leitura: cache da resposta + ETag/Last-Modified.
+
+    Use @em_cache(contadores=True) nas páginas que mostram o ranking de
+    pesquisas, para que o flush dos contadores as invalide.
+    """
+    if view is None:
+        return partial(em_cache, contadores=contadores)
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if request.method != 'GET':
+            return view(*args, **kwargs)
+        numero_versao, modificado_em = versao(contadores)
+        rota = request.full_path
+        etag = _etag(numero_versao, rota)
+
+        # Visitante que já tem esta versão: 304 sem renderizar nada.
+        if request.if_none_match.contains(etag):
+            response = make_response('', 304)
+        else:
+            chave = f"nomes:resp:{numero_versao}:{rota}"
+            guardada = _obter(chave)
+            if guardada is not None:
+                corpo, mimetype = guardada
+                response = make_response(corpo)
+                response.mimetype = mimetype
+            else:
+                flashes_antes = len(session.get('_flashes', []))
+                response = make_response(view(*args, **kwargs))
+                # Não guarda respostas de erro nem páginas renderizadas com
+                # falha de banco (que geram mensagens flash).
+                if response.status_code == 200 and len(session.get('_flashes', [])) == flashes_antes:
+                    _guardar(chave, (response.get_data(), response.mimetype))
+        return _cabecalhos(response, etag, modificado_em)
+    return wrapper
+
+
+def em_cache_async(view=None, contadores=False):
+    """em_cache para as rotas do app_async.py (Quart).
+
+    As idas ao Redis são síncronas: com REDIS_URL configurado, rodam numa
+    thread para não travar o event loop.
+    """
+    if view is None:
+        return partial(em_cache_async, contadores=contadores)
+    from quart import request as requisicao, session as sessao, make_response as criar_resposta
+
+    async def chamar(funcao, *args):
+        return await asyncio.to_thread(funcao, *args) if _backend() is not None else funcao(*args)
+
+    @wraps(view)
+    async def wrapper(*args, **kwargs):
+        if requisicao.method != 'GET':
+            return await view(*args, **kwargs)
+        numero_versao, modificado_em = await chamar(versao, contadores)
+        rota = requisicao.full_path
+        etag = _etag(numero_versao, rota)
+
+        if requisicao.if_none_match.contains(etag):
+            response = await criar_resposta('', 304)
+        else:
+            chave = f"nomes:resp:{numero_versao}:{rota}"
+            guardada = await chamar(_obter, chave)
+            if guardada is not None:
+                corpo, mimetype = guardada
+                response = await criar_resposta(corpo)
+                response.mimetype = mimetype
+            else:
+                flashes_antes = len(sessao.get('_flashes', []))
+                response = await criar_resposta(await view(*args, **kwargs))
+                if response.status_code == 200 and len(sessao.get('_flashes', [])) == flashes_antes:
+                    await chamar(_guardar, chave, (await response.get_data(), response.mimetype))
+        return _cabecalhos(response, etag, modificado_em)
+    return wrapper
@@ -0,0 +1,252 @@
+"""
+Carga em massa de nomes no PostgreSQL ou no SQLite.
+
+    python carga_em_massa.py nomes_data.csv                 # PostgreSQL (DB_*)
+    python carga_em_massa.py nomes_data.csv --sqlite nomes.db
+
+O CSV segue o formato do exportar_dados.py (nome, significado, origem,
+motivo_escolha[, pesquisas]). Nomes que já existem no destino são ignorados.
+"""
+import io
+import sys
+import csv
+import gzip
+import time
+import sqlite3
+import argparse
+from functools import lru_cache
+
+import origens
+
+# A cada quantas linhas o progresso é informado.
+PROGRESSO_A_CADA = 50000
+
+
+def normalizar_registro(item):
+    """(nome, significado, origem, motivo) sem espaços nas bordas, ou None.
+
+    Aceita as tuplas dos scripts antigos, em que o significado às vezes veio
+    quebrado em vários campos: (nome, *partes_do_significado, origem, motivo).
+    """
+    try:
+        nome, *partes_significado, origem, motivo = item
+    except ValueError:
+        return None
+    nome = str(nome).strip()
+    if not nome:
+        return None
+    significado = " ".join(str(p).strip() for p in partes_significado).strip()
+    return nome, significado, str(origem).strip(), str(motivo).strip()
+
+
+def ler_csv(caminho):
+    """Gera os registros de um CSV com cabeçalho (ou .csv.gz), uma linha por vez."""
+    abrir = gzip.open if str(caminho).endswith('.gz') else open
+    with abrir(caminho, 'rt', newline='', encoding='utf-8-sig') as arquivo:
+        for linha in csv.DictReader(arquivo):
+            yield (linha['nome'], linha.get('significado') or '',
+                   linha.get('origem') or '', linha.get('motivo_escolha') or '')
+
+
+class Progresso:
+    """Conta as linhas lidas e imprime linhas/s a cada PROGRESSO_A_CADA."""
+
+    def __init__(self, a_cada=PROGRESSO_A_CADA, saida=sys.stdout):
+        self.a_cada = a_cada
+        self.saida = saida
+        self.linhas = 0
+        self.inicio = time.perf_counter()
+
+    def contar(self, registros):
+        for registro in registros:
+            self.linhas += 1
+            if self.a_cada and self.linhas % self.a_cada == 0:
+                self.mostrar()
+            yield registro
+
+    def taxa(self):
+        decorrido = time.perf_counter() - self.inicio
+        return self.linhas / decorrido if decorrido > 0 else 0.0
+
+    def mostrar(self):
+        if self.saida is not None:
+            print(f"  {self.linhas} linhas lidas ({self.taxa():.0f} linhas/s)", file=self.saida)
+
+
+def _validos(registros):
+    for item in registros:
+        registro = normalizar_registro(item)
+        if registro is not None:
+            yield registro
+
+
+# --------------------------------------------------------------------------
+# PostgreSQL: COPY FROM STDIN numa tabela temporária + um único INSERT ... SELECT
+# --------------------------------------------------------------------------
+
+def _texto_copy(valor):
+    """Valor no formato texto do COPY (\\N = nulo; \\, tab e quebras escapados)."""
+    if valor is None:
+        return '\\N'
+    return (valor.replace('\\', '\\\\').replace('\t', '\\t')
+                 .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+class _FluxoCopy(io.RawIOBase):
+    """Arquivo "virtual" lido pelo COPY: gera as linhas sob demanda, sem
+    montar o lote inteiro na memória."""
+
+    def __init__(self, registros):
+        self._linhas = self._gerar(registros)
+        self._resto = b''
+
+    @staticmethod
+    def _gerar(registros):
+        canonizar = lru_cache(maxsize=4096)(origens.canonizar_origem)
+        for ordem, (nome, significado, origem, motivo) in enumerate(registros):
+            campos = (str(ordem), nome, significado, origem, canonizar(origem), motivo)
+            yield ('\t'.join(_texto_copy(c) for c in campos) + '\n').encode('utf-8')
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        pedacos, tamanho = [self._resto], len(self._resto)
+        while tamanho < len(buffer):
+            linha = next(self._linhas, None)
+            if linha is None:
+                break
+            pedacos.append(linha)
+            tamanho += len(linha)
+        dados = b''.join(pedacos)
+        tamanho = min(len(buffer), len(dados))
+        buffer[:tamanho] = dados[:tamanho]
+        self._resto = dados[tamanho:]
+        return tamanho
+
+
+CARGA_POSTGRES_SQL = """
+    CREATE TEMP TABLE nomes_carga (
+        ordem BIGINT,
+        nome TEXT,
+        significado TEXT,
+        origem TEXT,
+        origem_canonica TEXT,
+        motivo_escolha TEXT
+    ) ON COMMIT DROP;
+"""
+
+# O índice único em nome_normalizado(nome) descarta tanto os nomes que já
+# estão na tabela quanto as repetições dentro da carga; a ordem do SELECT
+# garante que fica a primeira ocorrência do arquivo.
+INSERIR_CARGA_SQL = """
+    INSERT INTO nomes (nome, significado, origem, origem_id, motivo_escolha, pesquisas)
+    SELECT c.nome, c.significado, c.origem, o.id, c.motivo_escolha, 0
+    FROM nomes_carga c
+    LEFT JOIN origens o ON o.nome = c.origem_canonica
+    ORDER BY c.ordem
+    ON CONFLICT (nome_normalizado(nome)) DO NOTHING;
+"""
+
+
+def carregar_postgres(registros, progresso=None):
+    """Carrega os registros no PostgreSQL numa única transação.
+
+    Retorna (linhas lidas, nomes inseridos).
+    """
+    import db_postgres as db_conexao
+
+    progresso = progresso or Progresso()
+    conn = db_conexao.get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(CARGA_POSTGRES_SQL)
+        cursor.copy_expert(
+            "COPY nomes_carga (ordem, nome, significado, origem, origem_canonica, motivo_escolha) FROM STDIN",
+            _FluxoCopy(progresso.contar(_validos(registros))), size=65536)
+        cursor.execute("""
+            INSERT INTO origens (nome)
+            SELECT DISTINCT origem_canonica FROM nomes_carga WHERE origem_canonica IS NOT NULL
+            ON CONFLICT (nome) DO NOTHING;
+        """)
+        cursor.execute(INSERIR_CARGA_SQL)
+        inseridos = cursor.rowcount
+        conn.commit()
+        cursor.close()
+        return progresso.linhas, inseridos
+    except Exception as e:
+        conn.rollback()
+        print(f"Erro na carga em massa (PostgreSQL): {e}")
+        raise
+    finally:
+        db_conexao.devolver_conexao(conn)
+
+
+# --------------------------------------------------------------------------
+# SQLite: executemany numa única transação
+# --------------------------------------------------------------------------
+
+# Com UNIQUE em nomes.nome (schema do nomes.db), INSERT OR IGNORE; sem ele
+# (schema do db.py), o NOT EXISTS usa o índice idx_nome e também enxerga as
+# linhas já inseridas nesta mesma carga.
+INSERIR_SQLITE_SQL = """
+    INSERT OR IGNORE INTO nomes (nome, significado, origem, motivo_escolha, pesquisas)
+    VALUES (?, ?, ?, ?, 0)
+"""
+INSERIR_SQLITE_SEM_UNIQUE_SQL = """
+    INSERT INTO nomes (nome, significado, origem, motivo_escolha, pesquisas)
+    SELECT ?, ?, ?, ?, 0
+    WHERE NOT EXISTS (SELECT 1 FROM nomes WHERE nome = ?)
+"""
+
+
+def _nome_unico(conn):
+    """True se a tabela 'nomes' do SQLite tem índice UNIQUE só em 'nome'."""
+    for _, indice, unico, *_ in conn.execute("PRAGMA index_list(nomes)").fetchall():
+        colunas = [coluna for _, _, coluna in conn.execute(f"PRAGMA index_info('{indice}')")]
+        if unico and colunas == ['nome']:
+            return True
+    return False
+
+
+def carregar_sqlite(registros, caminho=None, progresso=None):
+    """Carrega os registros num banco SQLite numa única transação.
+
+    Retorna (linhas lidas, nomes inseridos).
+    """
+    import db
+
+    progresso = progresso or Progresso()
+    conn = sqlite3.connect(caminho or db.DATABASE, timeout=10)
+    try:
+        registros = progresso.contar(_validos(registros))
+        if _nome_unico(conn):
+            sql = INSERIR_SQLITE_SQL
+        else:
+            sql = INSERIR_SQLITE_SEM_UNIQUE_SQL
+            registros = (registro + (registro[0],) for registro in registros)
+        antes = conn.total_changes
+        with conn:
+            conn.executemany(sql, registros)
+        return progresso.linhas, conn.total_changes - antes
+    finally:
+        conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Carga em massa de nomes a partir de um CSV.")
+    parser.add_argument('csv', help="arquivo CSV ou .csv.gz (nome, significado, origem, motivo_escolha)")
+    parser.add_argument('--sqlite', metavar='ARQUIVO', help="carrega neste banco SQLite em vez do PostgreSQL")
+    args = parser.parse_args(argv)
+
+    progresso = Progresso()
+    if args.sqlite:
+        lidos, inseridos = carregar_sqlite(ler_csv(args.csv), args.sqlite, progresso)
+    else:
+        lidos, inseridos = carregar_postgres(ler_csv(args.csv), progresso)
+    print(f"{lidos} linhas lidas, {inseridos} nomes inseridos, "
+          f"{lidos - inseridos} ignorados (já existiam) em {time.perf_counter() - progresso.inicio:.2f}s.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+import os
+import re
+import hashlib
+import threading
+
+import psycopg2
+
+import db_postgres as db_conexao
+
+# Registro de instruções preparadas no servidor (PREPARE / EXECUTE).
+# Cada SQL usado pelo app recebe um nome estável (hash do texto) e é
+# preparado uma única vez por conexão do pool; daí em diante o PostgreSQL
+# reaproveita a análise e o plano em vez de refazê-los a cada requisição.
+# Desligado no modo serverless: atrás de um pooler em modo transação a próxima
+# transação pode cair em outra conexão do servidor, sem a instrução preparada.
+ATIVO = os.environ.get('DB_PREPARED_STATEMENTS', '1') != '0' and not db_conexao.MODO_SERVERLESS
+
+# PREPARE só aceita estas instruções; o resto (EXPLAIN, SET...) vai direto.
+_PREPARAVEIS = ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'WITH', 'VALUES')
+_MARCADOR = re.compile(r'%(s|%)')
+
+_registro = {}
+_lock = threading.Lock()
+
+
+def _converter(sql):
+    """Troca os marcadores %s do psycopg2 por $1, $2... e conta os parâmetros."""
+    contador = 0
+
+    def trocar(match):
+        nonlocal contador
+        if match.group(1) == '%':
+            return '%'
+        contador += 1
+        return f'${contador}'
+
+    return _MARCADOR.sub(trocar, sql), contador
+
+
+def registrar(sql):
+    """Retorna (nome, sql no formato $n, nº de parâmetros) da instrução."""
+    registro = _registro.get(sql)
+    if registro is None:
+        with _lock:
+            registro = _registro.get(sql)
+            if registro is None:
+                nome = 'q_' + hashlib.sha1(sql.encode('utf-8')).hexdigest()[:12]
+                sql_preparado, total_parametros = _converter(sql)
+                registro = (nome, sql_preparado, total_parametros)
+                _registro[sql] = registro
+    return registro
+
+
+def executar(cursor, sql, params=None):
+    """Executa o SQL usando a instrução preparada da conexão do cursor."""
+    params = tuple(params or ())
+    conn = cursor.connection
+    preparadas = getattr(conn, 'preparadas', None)
+    if not ATIVO or preparadas is None or not sql.lstrip().upper().startswith(_PREPARAVEIS):
+        cursor.execute(sql, params)
+        return
+    nome, sql_preparado, total_parametros = registrar(sql)
+    try:
+        if nome not in preparadas:
+            cursor.execute(f"PREPARE {nome} AS {sql_preparado}")
+            preparadas.add(nome)
+        if total_parametros:
+            marcadores = ', '.join(['%s'] * total_parametros)
+            cursor.execute(f"EXECUTE {nome} ({marcadores})", params)
+        else:
+            cursor.execute(f"EXECUTE {nome}")
+    except psycopg2.errors.InvalidSqlStatementName:
+        # A sessão perdeu as instruções (ex.: DISCARD ALL): prepara de novo na próxima.
+        preparadas.clear()
+        raise
@@ -0,0 +1,128 @@
+import os
+import atexit
+import threading
+from collections import Counter
+
+import db_postgres as db_conexao
+import consultas
+import cache_respostas
+
+# Buffer em memória (write-behind) para o contador de pesquisas.
+# As buscas só registram incrementos aqui; uma thread em segundo plano
+# grava tudo no PostgreSQL de uma vez só, a cada N segundos ou M incrementos.
+FLUSH_SEGUNDOS = float(os.environ.get('CONTADOR_FLUSH_SEGUNDOS', '5'))
+FLUSH_MAX_INCREMENTOS = int(os.environ.get('CONTADOR_FLUSH_MAX', '500'))
+# No modo serverless a instância pode ser congelada logo após a resposta e
+# threads em segundo plano não são confiáveis: o lote é gravado na hora.
+FLUSH_IMEDIATO = db_conexao.MODO_SERVERLESS
+
+_pendentes = Counter()
+# Lotes que o flush já tirou de _pendentes, mas cujo UPDATE ainda não foi
+# confirmado: continuam contando em pendentes() até o commit.
+_em_voo = Counter()
+_total_pendente = 0
+_lock = threading.Lock()
+_acordar = threading.Event()
+_thread = None
+
+
+def registrar(ids):
+    """Soma 1 pesquisa para cada id informado (sem tocar no banco)."""
+    global _total_pendente
+    ids = list(ids)
+    if not ids:
+        return
+    with _lock:
+        _pendentes.update(ids)
+        _total_pendente += len(ids)
+        atingiu_limite = _total_pendente >= FLUSH_MAX_INCREMENTOS
+    if FLUSH_IMEDIATO:
+        flush()
+        return
+    _iniciar_thread()
+    if atingiu_limite:
+        _acordar.set()
+
+
+def pendentes(ids):
+    """{id: pesquisas ainda não gravadas no banco} dos ids informados.
+
+    Lido de uma vez sob o lock do flush, contando os lotes em gravação: um
+    flush em andamento não some com os incrementos. Só um commit que caia
+    entre a leitura das linhas no banco e esta chamada fica de fora da soma,
+    então o total é aproximado.
+    """
+    with _lock:
+        return {id_nome: _pendentes.get(id_nome, 0) + _em_voo.get(id_nome, 0) for id_nome in ids}
+
+
+def flush():
+    """Grava no PostgreSQL, numa única instrução, todos os incrementos pendentes."""
+    global _total_pendente
+    with _lock:
+        if not _pendentes:
+            return 0
+        lote = dict(_pendentes)
+        _em_voo.update(lote)
+        _pendentes.clear()
+        _total_pendente = 0
+
+    conn = None
+    try:
+        conn = db_conexao.get_connection()
+        cursor = conn.cursor()
+        consultas.executar(cursor, """
+            UPDATE nomes AS n
+            SET pesquisas = COALESCE(n.pesquisas, 0) + v.incremento
+            FROM unnest(%s::int[], %s::int[]) AS v(id, incremento)
+            WHERE n.id = v.id
+        """, (list(lote.keys()), list(lote.values())))
+        conn.commit()
+        cursor.close()
+        with _lock:
+            _em_voo.subtract(lote)
+            _remover_zerados()
+        cache_respostas.invalidar_contadores()
+        return len(lote)
+    except Exception as e:
+        # Devolve os incrementos ao buffer para tentar de novo no próximo ciclo.
+        if conn:
+            conn.rollback()
+        with _lock:
+            _em_voo.subtract(lote)
+            _remover_zerados()
+            _pendentes.update(lote)
+            _total_pendente += sum(lote.values())
+        print(f"Erro ao gravar contadores de pesquisa (flush): {e}")
+        return 0
+    finally:
+        if conn:
+            db_conexao.devolver_conexao(conn)
+
+
+def _remover_zerados():
+    for id_nome in [id_nome for id_nome, total in _em_voo.items() if total <= 0]:
+        del _em_voo[id_nome]
+
+
+def _loop():
+    while True:
+        _acordar.wait(FLUSH_SEGUNDOS)
+        _acordar.clear()
+        flush()
+
+
+def _iniciar_thread():
+    """Sobe a thread de flush sob demanda (uma por processo/worker)."""
+    global _thread
+    if _thread is not None and _thread.is_alive():
+        return
+    with _lock:
+        if _thread is not None and _thread.is_alive():
+            return
+        _thread = threading.Thread(target=_loop, name='contador-pesquisas', daemon=True)
+        _thread.start()
+
+
+# Garante que nada fique no buffer quando o worker for encerrado.
+atexit.register(flush)
@@ -1,3 +1,5 @@
+import deduplicacao
+
 nomes = [
     ("Alice", "Nobre", "Hebraica", "Escolhido pelos pais por tradição"),
     ("Bruno", "Castanho, moreno", "Germânica", "Gostaram do som do nome"),
@@ -643,17 +645,9 @@ nomes = [
 quantidade = len(nomes)
 print(f"A lista contém {quantidade} nomes.")
 
-# Contar ocorrências de cada nome
-contagem = {}
-for nome, significado, origem, motivacao in nomes:
-    if nome in contagem:
-        contagem[nome] += 1
-    else:
-        contagem[nome] = 1
-
-# Encontrar nomes duplicados
-duplicados = {nome: count for nome, count in contagem.items() if count > 1}
+# Nomes duplicados e suas contagens (em lote, ver deduplicacao.py)
+duplicados = deduplicacao.relatorio(deduplicacao.tabela(nomes))
 
 print("Nomes duplicados e suas contagens:")
-for nome, count in duplicados.items():
-    print(f"{nome}: {count} ocorrências")
\ No newline at end of file
+for nome, count in zip(duplicados['nome'], duplicados['ocorrencias']):
+    print(f"{nome}: {count} ocorrências")
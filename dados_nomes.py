@@ -0,0 +1,108 @@
+"""
+Conjunto de nomes do projeto (dados/nomes.csv.gz), que antes ficava como
+lista de tuplas dentro do populate_db.py e do adicionar_nomes_bando_dados.py.
+
+    python dados_nomes.py                          # carrega no PostgreSQL (DB_*)
+    python dados_nomes.py --sqlite nomes.db        # carrega no SQLite
+    python dados_nomes.py --verificar              # só confere o checksum
+
+O arquivo é um CSV compactado no formato do exportar_dados.py (nome,
+significado, origem, motivo_escolha), lido linha a linha direto do gzip e
+entregue à carga em massa (carga_em_massa.py). O SHA-256 esperado fica em
+dados/nomes.csv.gz.sha256 (formato do sha256sum) e é conferido antes da carga.
+"""
+import io
+import os
+import sys
+import csv
+import gzip
+import hashlib
+import argparse
+
+import carga_em_massa
+
+PASTA_DADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dados')
+ARQUIVO = os.path.join(PASTA_DADOS, 'nomes.csv.gz')
+COLUNAS = ('nome', 'significado', 'origem', 'motivo_escolha')
+
+
+class ChecksumInvalido(Exception):
+    pass
+
+
+def arquivo_checksum(caminho):
+    return caminho + '.sha256'
+
+
+def sha256_arquivo(caminho):
+    """SHA-256 do arquivo, lido em blocos."""
+    resumo = hashlib.sha256()
+    with open(caminho, 'rb') as arquivo:
+        for bloco in iter(lambda: arquivo.read(1 << 16), b''):
+            resumo.update(bloco)
+    return resumo.hexdigest()
+
+
+def verificar(caminho=ARQUIVO):
+    """Confere o arquivo com o .sha256 ao lado; levanta ChecksumInvalido se não bater."""
+    with open(arquivo_checksum(caminho), encoding='utf-8') as arquivo:
+        esperado = arquivo.read().split()[0]
+    obtido = sha256_arquivo(caminho)
+    if obtido != esperado:
+        raise ChecksumInvalido(f"{os.path.basename(caminho)}: checksum {obtido} diferente do esperado {esperado}")
+
+
+def ler(caminho=ARQUIVO):
+    """Gera os registros (nome, significado, origem, motivo), após conferir o checksum."""
+    verificar(caminho)
+    yield from carga_em_massa.ler_csv(caminho)
+
+
+def gravar(registros, caminho=ARQUIVO):
+    """Grava os registros no CSV compactado e atualiza o .sha256.
+
+    O gzip sai sem data nem nome de arquivo no cabeçalho, para que os mesmos
+    dados gerem sempre o mesmo checksum. Retorna o número de linhas gravadas.
+    """
+    total = 0
+    with open(caminho, 'wb') as bruto:
+        with gzip.GzipFile(filename='', mode='wb', fileobj=bruto, mtime=0) as compactado:
+            with io.TextIOWrapper(compactado, encoding='utf-8', newline='') as texto:
+                escritor = csv.writer(texto, lineterminator='\n')
+                escritor.writerow(COLUNAS)
+                for registro in registros:
+                    registro = carga_em_massa.normalizar_registro(registro)
+                    if registro is not None:
+                        escritor.writerow(registro)
+                        total += 1
+    with open(arquivo_checksum(caminho), 'w', encoding='utf-8') as arquivo:
+        arquivo.write(f"{sha256_arquivo(caminho)}  {os.path.basename(caminho)}\n")
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Carrega o conjunto de nomes (dados/nomes.csv.gz) no banco.")
+    parser.add_argument('arquivo', nargs='?', default=ARQUIVO)
+    parser.add_argument('--sqlite', metavar='ARQUIVO', help="carrega neste banco SQLite em vez do PostgreSQL")
+    parser.add_argument('--verificar', action='store_true', help="só confere o checksum do arquivo")
+    args = parser.parse_args(argv)
+
+    try:
+        verificar(args.arquivo)
+    except (OSError, ChecksumInvalido) as e:
+        print(f"ERRO: {e}", file=sys.stderr)
+        sys.exit(1)
+    if args.verificar:
+        print(f"{os.path.basename(args.arquivo)}: checksum ok.")
+        return
+
+    progresso = carga_em_massa.Progresso(a_cada=1000)
+    if args.sqlite:
+        lidos, inseridos = carga_em_massa.carregar_sqlite(ler(args.arquivo), args.sqlite, progresso)
+    else:
+        lidos, inseridos = carga_em_massa.carregar_postgres(ler(args.arquivo), progresso)
+    print(f"{lidos} registros lidos, {inseridos} nomes inseridos, {lidos - inseridos} já existiam.")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,14 @@
 import psycopg2
+import psycopg2.extensions
 from psycopg2 import pool
 import os
+import sys
+import time
+import threading
 from dotenv import load_dotenv  # Para suportar .env localmente
 
+import origens
+
 # Carrega variáveis de ambiente do arquivo .env (local)
 load_dotenv()
 
@@ -16,30 +22,234 @@ DB_PASSWORD = os.environ.get('DB_PASSWORD', 'projeto_integrador_2025_banco_de_da
 # Adiciona debug para verificar as variáveis
 print(f"DB_HOST: {DB_HOST}, DB_PASSWORD: {DB_PASSWORD[:4]}... (fallback usado)")  # Mostra só os primeiros 4 chars por segurança
 
+# Dimensionamento do pool (por processo/worker). Some DB_POOL_MAX de todos os
+# workers para não passar do limite de conexões do banco.
+DB_POOL_MIN = int(os.environ.get('DB_POOL_MIN', '1'))
+DB_POOL_MAX = int(os.environ.get('DB_POOL_MAX', '20'))
+# Tempo máximo (s) esperando uma conexão livre antes de desistir.
+DB_POOL_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT', '10'))
+# Conexões paradas há mais que isso (s) são testadas com SELECT 1 antes do uso
+# (o Supabase derruba conexões ociosas).
+DB_POOL_CHECK_IDLE = float(os.environ.get('DB_POOL_CHECK_IDLE', '30'))
+
+# Modo de conexão: 'pool' (gunicorn, processos de longa duração) ou
+# 'serverless' (padrão quando roda na Vercel). No modo serverless cada
+# instância usa uma única conexão, reaproveitada entre invocações, e nada
+# depende de estado de sessão (sem PREPARE no servidor), para funcionar atrás
+# de um pooler em modo transação (PgBouncer / Supavisor do Supabase, porta 6543).
+DB_MODO = os.environ.get('DB_MODO', 'serverless' if os.environ.get('VERCEL') else 'pool')
+MODO_SERVERLESS = DB_MODO == 'serverless'
+
 # Pool de conexões para serverless
 connection_pool = None
+_conexao_unica = None
+# Reentrante: o buffer de contadores e o índice em memória podem pedir a
+# conexão na mesma thread em que a requisição já a está usando.
+_uso_unico = threading.RLock()
+_pool_lock = threading.Lock()
+_vagas = threading.BoundedSemaphore(DB_POOL_MAX)
 
-def get_connection():
-    """Retorna uma conexão do pool ou inicializa o pool se necessário."""
+_metricas_lock = threading.Lock()
+_metricas = {
+    'checkouts': 0,
+    'em_uso': 0,
+    'pico_em_uso': 0,
+    'espera_total_ms': 0.0,
+    'espera_max_ms': 0.0,
+    'esgotamentos': 0,
+    'reconexoes': 0,
+    'conexoes_abertas': 0,
+}
+
+class PoolEsgotado(psycopg2.pool.PoolError):
+    """Nenhuma conexão ficou livre dentro de DB_POOL_TIMEOUT."""
+
+class Conexao(psycopg2.extensions.connection):
+    """Conexão que guarda quais instruções já foram preparadas nela (ver consultas.py)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.preparadas = set()
+        self.devolvida_em = time.monotonic()
+        with _metricas_lock:
+            _metricas['conexoes_abertas'] += 1
+
+def _criar_pool():
     global connection_pool
-    if connection_pool is None:
-        try:
-            connection_pool = psycopg2.pool.ThreadedConnectionPool(
-                1,  # Min connections
-                20, # Max connections
+    with _pool_lock:
+        if connection_pool is None:
+            try:
+                connection_pool = psycopg2.pool.ThreadedConnectionPool(
+                    DB_POOL_MIN,
+                    DB_POOL_MAX,
+                    host=DB_HOST,
+                    port=DB_PORT,
+                    database=DB_NAME,
+                    user=DB_USER,
+                    password=DB_PASSWORD,
+                    connection_factory=Conexao
+                )
+            except psycopg2.Error as e:
+                print(f"Erro ao inicializar o pool de conexões: {e}")
+                raise
+    return connection_pool
+
+def _conexao_viva(conn):
+    """Confere se a conexão ainda serve; só faz round trip se ela ficou ociosa."""
+    if conn.closed:
+        return False
+    if time.monotonic() - conn.devolvida_em < DB_POOL_CHECK_IDLE:
+        return True
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        conn.rollback()
+        return True
+    except psycopg2.Error:
+        return False
+
+def get_connection():
+    """Retorna uma conexão do pool ou inicializa o pool se necessário.
+
+    Espera no máximo DB_POOL_TIMEOUT segundos por uma conexão livre
+    (PoolEsgotado) e troca conexões quebradas por novas. Devolva sempre
+    com devolver_conexao().
+    """
+    if MODO_SERVERLESS:
+        return _obter_conexao_unica()
+    inicio = time.monotonic()
+    if not _vagas.acquire(timeout=DB_POOL_TIMEOUT):
+        with _metricas_lock:
+            _metricas['esgotamentos'] += 1
+        raise PoolEsgotado(
+            f"Pool de conexões esgotado: nenhuma das {DB_POOL_MAX} conexões ficou livre "
+            f"em {DB_POOL_TIMEOUT:.0f}s. Aumente DB_POOL_MAX ou reduza os workers."
+        )
+    try:
+        pool_atual = connection_pool or _criar_pool()
+        # Depois de um corte por ociosidade ou failover, todas as conexões
+        # paradas no pool podem estar mortas: descarta uma a uma até achar
+        # uma viva (as novas, abertas pelo próprio pool, passam direto).
+        for _ in range(DB_POOL_MAX + 1):
+            conn = pool_atual.getconn()
+            if _conexao_viva(conn):
+                break
+            pool_atual.putconn(conn, close=True)
+            with _metricas_lock:
+                _metricas['reconexoes'] += 1
+        else:
+            raise psycopg2.OperationalError("Nenhuma conexão viva obtida do pool.")
+    except Exception:
+        _vagas.release()
+        raise
+    conn.devolvida_em = time.monotonic()
+    _registrar_checkout(inicio)
+    return conn
+
+def _obter_conexao_unica():
+    """Modo serverless: a conexão única da instância (criada na primeira consulta)."""
+    global _conexao_unica
+    inicio = time.monotonic()
+    if not _uso_unico.acquire(timeout=DB_POOL_TIMEOUT):
+        with _metricas_lock:
+            _metricas['esgotamentos'] += 1
+        raise PoolEsgotado(f"A conexão da instância ficou ocupada por mais de {DB_POOL_TIMEOUT:.0f}s.")
+    try:
+        if _conexao_unica is not None and not _conexao_viva(_conexao_unica):
+            _fechar_conexao_unica()
+            with _metricas_lock:
+                _metricas['reconexoes'] += 1
+        if _conexao_unica is None:
+            _conexao_unica = psycopg2.connect(
                 host=DB_HOST,
                 port=DB_PORT,
                 database=DB_NAME,
                 user=DB_USER,
-                password=DB_PASSWORD
+                password=DB_PASSWORD,
+                connection_factory=Conexao
             )
-        except psycopg2.Error as e:
-            print(f"Erro ao inicializar o pool de conexões: {e}")
-            raise
-    return connection_pool.getconn()
+    except Exception:
+        _uso_unico.release()
+        raise
+    # Marca como verificada agora: um checkout aninhado não refaz o SELECT 1
+    # (nem o rollback) no meio da transação de quem já está usando a conexão.
+    _conexao_unica.devolvida_em = time.monotonic()
+    _registrar_checkout(inicio)
+    return _conexao_unica
+
+def _fechar_conexao_unica():
+    global _conexao_unica
+    try:
+        _conexao_unica.close()
+    except psycopg2.Error:
+        pass
+    _conexao_unica = None
+
+def _registrar_checkout(inicio):
+    espera_ms = (time.monotonic() - inicio) * 1000
+    with _metricas_lock:
+        _metricas['checkouts'] += 1
+        _metricas['em_uso'] += 1
+        _metricas['pico_em_uso'] = max(_metricas['pico_em_uso'], _metricas['em_uso'])
+        _metricas['espera_total_ms'] += espera_ms
+        _metricas['espera_max_ms'] = max(_metricas['espera_max_ms'], espera_ms)
+
+def devolver_conexao(conn, close=False):
+    """Devolve ao pool uma conexão obtida com get_connection()."""
+    if MODO_SERVERLESS:
+        try:
+            conn.devolvida_em = time.monotonic()
+            if (close or conn.closed) and conn is _conexao_unica:
+                _fechar_conexao_unica()
+        finally:
+            with _metricas_lock:
+                _metricas['em_uso'] -= 1
+            _uso_unico.release()
+        return
+    try:
+        conn.devolvida_em = time.monotonic()
+        connection_pool.putconn(conn, close=close or conn.closed)
+    finally:
+        with _metricas_lock:
+            _metricas['em_uso'] -= 1
+        _vagas.release()
+
+def metricas_pool():
+    """Retrato das métricas do pool: checkouts, espera, uso, esgotamentos e conexões abertas."""
+    with _metricas_lock:
+        metricas = dict(_metricas)
+    checkouts = metricas['checkouts']
+    metricas['espera_media_ms'] = metricas['espera_total_ms'] / checkouts if checkouts else 0.0
+    metricas['modo'] = DB_MODO
+    metricas['min'] = 0 if MODO_SERVERLESS else DB_POOL_MIN
+    metricas['max'] = 1 if MODO_SERVERLESS else DB_POOL_MAX
+    metricas['timeout_s'] = DB_POOL_TIMEOUT
+    return metricas
 
-def init_db():
-    """Inicializa o banco de dados, criando a tabela 'nomes' se ela não existir."""
+def verificar_conexao():
+    """Retorna True se o banco responde a um SELECT 1 (usado no readiness)."""
+    conn = None
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+        cursor.close()
+        conn.rollback()
+        return True
+    except psycopg2.Error as e:
+        print(f"Banco de dados inacessível: {e}")
+        return False
+    finally:
+        if conn:
+            devolver_conexao(conn)
+
+def init_db(fundir_duplicados=False):
+    """Inicializa o banco de dados, criando a tabela 'nomes' e seus índices se não existirem.
+
+    Levanta NomesDuplicados se o índice único de nomes ainda não existe e há
+    nomes que só diferem em maiúsculas/acentos (ver criar_indice_nome_unico).
+    """
     conn = None
     try:
         conn = get_connection()
@@ -55,15 +265,275 @@ def init_db():
             );
         """
         cursor.execute(create_table_query)
+        criar_indice_nome_unico(cursor, fundir_duplicados)
+        # Índices de trigramas (pg_trgm): permitem que os filtros
+        # "nome ILIKE '%termo%'" e "origem ILIKE '%termo%'" usem índice GIN
+        # em vez de varrer a tabela inteira a cada busca.
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_nomes_nome_trgm ON nomes USING gin (nome gin_trgm_ops);")
+        # Origens canônicas numa tabela à parte; 'nomes' aponta para ela por id.
+        # O filtro por origem vira "origem_id IN (...)" sobre um índice inteiro.
+        cursor.execute(ORIGENS_SQL)
+        cursor.execute("DROP INDEX IF EXISTS idx_nomes_origem_trgm;")
+        normalizar_origens(cursor)
+        # Índice composto para a paginação por cursor (keyset) do /listar.
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_nomes_nome_id ON nomes (nome, id);")
+        # Ranking dos mais pesquisados: o "ORDER BY pesquisas DESC ... LIMIT k"
+        # vira uma leitura das k primeiras entradas do índice, sem ordenar a tabela.
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_nomes_ranking ON nomes (pesquisas DESC NULLS LAST, nome, id);")
+        criar_origem_stats(cursor)
         conn.commit()
         print("Tabela 'nomes' verificada/criada no PostgreSQL na nuvem com sucesso.")
+    except NomesDuplicados:
+        conn.rollback()
+        raise
     except psycopg2.Error as e:
         print(f"Erro durante a inicialização do DB: {e}")
         raise
     finally:
         if conn:
             cursor.close()
-            connection_pool.putconn(conn)  # Retorna ao pool
+            devolver_conexao(conn)  # Retorna ao pool
+
+# Unicidade do nome sem diferenciar maiúsculas nem acentos ("José" = "jose").
+# O /cadastrar e a carga em massa inserem com ON CONFLICT (nome_normalizado(nome))
+# DO NOTHING, sem consulta prévia e sem corrida entre requisições simultâneas.
+# A função é criada com o schema em que o unaccent foi instalado (no Supabase,
+# "extensions"), pois índices exigem funções IMMUTABLE com nomes qualificados.
+NOME_NORMALIZADO_SQL = """
+    CREATE OR REPLACE FUNCTION nome_normalizado(texto TEXT) RETURNS TEXT
+        LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE
+        AS $$ SELECT lower({schema}.unaccent('{schema}.unaccent'::regdictionary, texto)) $$;
+"""
+
+# Nomes que o índice único barraria. Não são apagados automaticamente: "Aida"
+# (Italiano) e "Aída" (Etíope) podem ser nomes diferentes, com significados
+# diferentes. Sem --fundir-duplicados, o init_db lista os grupos e para.
+CONFLITOS_NOME_SQL = """
+    SELECT id, nome, significado, origem, motivo_escolha FROM nomes
+    WHERE nome_normalizado(nome) IN (
+        SELECT nome_normalizado(nome) FROM nomes GROUP BY 1 HAVING COUNT(*) > 1
+    )
+    ORDER BY id
+"""
+
+# Com --fundir-duplicados: fica o registro mais antigo (menor id), que herda
+# as pesquisas dos demais.
+DUPLICADOS_SQL = """
+    SELECT id, first_value(id) OVER (PARTITION BY nome_normalizado(nome) ORDER BY id) AS manter
+    FROM nomes
+"""
+
+class NomesDuplicados(Exception):
+    pass
+
+def listar_nomes_repetidos(linhas):
+    """Mostra os grupos de (id, nome, significado, origem, motivo) repetidos."""
+    import deduplicacao  # pandas só quando há o que listar
+    deduplicacao.imprimir(deduplicacao.relatorio(deduplicacao.tabela_linhas(linhas)))
+
+def criar_indice_nome_unico(cursor, fundir_duplicados=False):
+    """Cria nome_normalizado() e o índice único sobre ela.
+
+    Se já houver nomes repetidos (sem diferenciar maiúsculas/acentos), lista
+    os grupos com o relatório do deduplicacao.py e levanta NomesDuplicados,
+    sem criar o índice. Só com fundir_duplicados=True os repetidos são
+    fundidos no registro mais antigo.
+    """
+    cursor.execute("CREATE EXTENSION IF NOT EXISTS unaccent;")
+    cursor.execute("SELECT extnamespace::regnamespace::text FROM pg_extension WHERE extname = 'unaccent';")
+    schema = cursor.fetchone()[0]
+    cursor.execute(NOME_NORMALIZADO_SQL.format(schema=schema))
+    cursor.execute("SELECT to_regclass('idx_nomes_nome_unico') IS NULL;")
+    if not cursor.fetchone()[0]:
+        return
+    cursor.execute("LOCK TABLE nomes IN SHARE ROW EXCLUSIVE MODE;")
+    if fundir_duplicados:
+        cursor.execute(f"""
+            UPDATE nomes AS n SET pesquisas = COALESCE(n.pesquisas, 0) + d.extra
+            FROM (SELECT dup.manter, SUM(COALESCE(x.pesquisas, 0)) AS extra
+                  FROM ({DUPLICADOS_SQL}) dup JOIN nomes x ON x.id = dup.id
+                  WHERE dup.id <> dup.manter GROUP BY dup.manter) d
+            WHERE n.id = d.manter;
+        """)
+        cursor.execute(f"""
+            DELETE FROM nomes AS n USING ({DUPLICADOS_SQL}) dup
+            WHERE n.id = dup.id AND dup.id <> dup.manter;
+        """)
+        if cursor.rowcount:
+            print(f"{cursor.rowcount} nome(s) duplicado(s) fundido(s) antes de criar o índice único.")
+    else:
+        cursor.execute(CONFLITOS_NOME_SQL)
+        conflitos = cursor.fetchall()
+        if conflitos:
+            listar_nomes_repetidos(conflitos)
+            raise NomesDuplicados(
+                f"{len(conflitos)} registro(s) com nome repetido (sem diferenciar maiúsculas/acentos): "
+                "índice único não criado. Corrija-os ou rode o init-db com --fundir-duplicados.")
+    cursor.execute("CREATE UNIQUE INDEX idx_nomes_nome_unico ON nomes (nome_normalizado(nome));")
+
+# Tabela de origens (dimensão). nomes.origem guarda o texto como veio da
+# fonte; nomes.origem_id, a origem canônica (ver origens.canonizar_origem).
+ORIGENS_SQL = """
+    CREATE TABLE IF NOT EXISTS origens (
+        id SERIAL PRIMARY KEY,
+        nome VARCHAR(100) NOT NULL UNIQUE
+    );
+    ALTER TABLE nomes ADD COLUMN IF NOT EXISTS origem_id INTEGER REFERENCES origens (id);
+    CREATE INDEX IF NOT EXISTS idx_nomes_origem_id ON nomes (origem_id);
+"""
+
+def normalizar_origens(cursor):
+    """Liga às origens canônicas os nomes que ainda não têm origem_id.
+
+    Retorna quantos registros foram atualizados.
+    """
+    cursor.execute("SELECT DISTINCT origem FROM nomes WHERE origem_id IS NULL AND origem IS NOT NULL;")
+    pares = [(bruta, origens.canonizar_origem(bruta)) for (bruta,) in cursor.fetchall()]
+    pares = [(bruta, canonica) for bruta, canonica in pares if canonica]
+    if not pares:
+        return 0
+    brutas = [bruta for bruta, _ in pares]
+    canonicas = [canonica for _, canonica in pares]
+    cursor.execute("""
+        INSERT INTO origens (nome) SELECT DISTINCT unnest(%s::text[])
+        ON CONFLICT (nome) DO NOTHING;
+    """, (canonicas,))
+    cursor.execute("""
+        UPDATE nomes AS n SET origem_id = o.id
+        FROM unnest(%s::text[], %s::text[]) AS v(origem, canonica)
+        JOIN origens o ON o.nome = v.canonica
+        WHERE n.origem = v.origem AND n.origem_id IS NULL;
+    """, (brutas, canonicas))
+    return cursor.rowcount
+
+# Contagem de nomes por origem, mantida por triggers de instrução (com tabelas
+# de transição) em qualquer INSERT/UPDATE/DELETE em 'nomes': /cadastrar, as
+# cargas em massa e edições manuais. Assim /estatisticas lê uma tabela pequena
+# em vez de fazer GROUP BY na tabela inteira. Chave = origem_id; nomes sem
+# origem ficam em origem_id = 0.
+ORIGEM_STATS_SQL = """
+    CREATE TABLE IF NOT EXISTS origem_stats (
+        origem_id INTEGER PRIMARY KEY,
+        total INTEGER NOT NULL DEFAULT 0
+    );
+
+    CREATE OR REPLACE FUNCTION origem_stats_atualizar() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            INSERT INTO origem_stats (origem_id, total)
+            SELECT COALESCE(origem_id, 0), COUNT(*) FROM novos GROUP BY 1
+            ON CONFLICT (origem_id) DO UPDATE SET total = origem_stats.total + EXCLUDED.total;
+        ELSIF TG_OP = 'DELETE' THEN
+            UPDATE origem_stats s SET total = s.total - d.qtd
+            FROM (SELECT COALESCE(origem_id, 0) AS origem_id, COUNT(*) AS qtd FROM antigos GROUP BY 1) d
+            WHERE s.origem_id = d.origem_id;
+        ELSE
+            -- Só contam as linhas cuja origem mudou (o flush dos contadores
+            -- de pesquisa, por exemplo, não mexe nela).
+            UPDATE origem_stats s SET total = s.total - d.qtd
+            FROM (SELECT COALESCE(a.origem_id, 0) AS origem_id, COUNT(*) AS qtd
+                  FROM antigos a JOIN novos n USING (id)
+                  WHERE a.origem_id IS DISTINCT FROM n.origem_id GROUP BY 1) d
+            WHERE s.origem_id = d.origem_id;
+            INSERT INTO origem_stats (origem_id, total)
+            SELECT COALESCE(n.origem_id, 0), COUNT(*)
+            FROM antigos a JOIN novos n USING (id)
+            WHERE a.origem_id IS DISTINCT FROM n.origem_id GROUP BY 1
+            ON CONFLICT (origem_id) DO UPDATE SET total = origem_stats.total + EXCLUDED.total;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS trg_origem_stats_insert ON nomes;
+    CREATE TRIGGER trg_origem_stats_insert AFTER INSERT ON nomes
+        REFERENCING NEW TABLE AS novos
+        FOR EACH STATEMENT EXECUTE FUNCTION origem_stats_atualizar();
+    DROP TRIGGER IF EXISTS trg_origem_stats_delete ON nomes;
+    CREATE TRIGGER trg_origem_stats_delete AFTER DELETE ON nomes
+        REFERENCING OLD TABLE AS antigos
+        FOR EACH STATEMENT EXECUTE FUNCTION origem_stats_atualizar();
+    DROP TRIGGER IF EXISTS trg_origem_stats_update ON nomes;
+    CREATE TRIGGER trg_origem_stats_update AFTER UPDATE ON nomes
+        REFERENCING OLD TABLE AS antigos NEW TABLE AS novos
+        FOR EACH STATEMENT EXECUTE FUNCTION origem_stats_atualizar();
+"""
+
+RECALCULAR_ORIGEM_STATS_SQL = """
+    SELECT COALESCE(s.origem_id, r.origem_id) AS origem_id,
+           COALESCE(s.total, 0) AS registrado,
+           COALESCE(r.total, 0) AS real
+    FROM origem_stats s
+    FULL JOIN (SELECT COALESCE(origem_id, 0) AS origem_id, COUNT(*) AS total
+               FROM nomes GROUP BY 1) r ON r.origem_id = s.origem_id
+    WHERE COALESCE(s.total, 0) <> COALESCE(r.total, 0)
+    ORDER BY 1
+"""
+
+def criar_origem_stats(cursor):
+    """Cria origem_stats e seus triggers; na primeira vez, preenche a partir de 'nomes'."""
+    # Bloqueia escritas em 'nomes' até o commit, para nada escapar entre a
+    # carga inicial e a criação dos triggers.
+    cursor.execute("LOCK TABLE nomes IN SHARE ROW EXCLUSIVE MODE;")
+    cursor.execute("""
+        SELECT to_regclass('origem_stats') IS NULL,
+               EXISTS (SELECT 1 FROM information_schema.columns
+                       WHERE table_name = 'origem_stats' AND column_name = 'origem_id');
+    """)
+    tabela_nova, chave_por_id = cursor.fetchone()
+    if not tabela_nova and not chave_por_id:
+        # Versão anterior, agrupada pelo texto da origem: refeita por origem_id.
+        cursor.execute("DROP TABLE origem_stats;")
+        tabela_nova = True
+    cursor.execute(ORIGEM_STATS_SQL)
+    if tabela_nova:
+        cursor.execute("""
+            INSERT INTO origem_stats (origem_id, total)
+            SELECT COALESCE(origem_id, 0), COUNT(*) FROM nomes GROUP BY 1;
+        """)
+
+def verificar_origem_stats(corrigir=False):
+    """Recalcula a contagem por origem do zero e retorna as diferenças (drift).
+
+    Cada item é (origem, total registrado em origem_stats, total real).
+    Com corrigir=True, grava os totais reais na tabela.
+    """
+    conn = None
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+        if corrigir:
+            cursor.execute("LOCK TABLE nomes IN SHARE ROW EXCLUSIVE MODE;")
+        cursor.execute(RECALCULAR_ORIGEM_STATS_SQL)
+        diferencas = cursor.fetchall()
+        if corrigir and diferencas:
+            cursor.executemany("""
+                INSERT INTO origem_stats (origem_id, total) VALUES (%s, %s)
+                ON CONFLICT (origem_id) DO UPDATE SET total = EXCLUDED.total
+            """, [(origem_id, real) for origem_id, _, real in diferencas])
+        cursor.execute("SELECT id, nome FROM origens;")
+        nomes_origens = dict(cursor.fetchall())
+        conn.commit()
+        cursor.close()
+        return [(nomes_origens.get(origem_id), registrado, real)
+                for origem_id, registrado, real in diferencas]
+    except psycopg2.Error as e:
+        if conn:
+            conn.rollback()
+        print(f"Erro ao verificar origem_stats: {e}")
+        raise
+    finally:
+        if conn:
+            devolver_conexao(conn)
 
 if __name__ == '__main__':
-    init_db()
\ No newline at end of file
+    import argparse
+    parser = argparse.ArgumentParser(description="Cria/atualiza a tabela 'nomes' e seus índices no PostgreSQL.")
+    parser.add_argument('--fundir-duplicados', action='store_true',
+                        help="funde os nomes repetidos (sem diferenciar maiúsculas/acentos) no mais antigo")
+    try:
+        init_db(parser.parse_args().fundir_duplicados)
+    except NomesDuplicados as e:
+        print(f"ERRO: {e}", file=sys.stderr)
+        sys.exit(1)
\ No newline at end of file
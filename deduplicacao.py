@@ -0,0 +1,217 @@
+"""
+Detecção de nomes duplicados em lote (pandas/NumPy).
+
+    python deduplicacao.py                          # tabela nomes do PostgreSQL (DB_*)
+    python deduplicacao.py --sqlite nomes.db        # tabela nomes do SQLite
+    python deduplicacao.py --csv dados/nomes.csv.gz # CSV (ou .csv.gz) de nomes
+    python deduplicacao.py --sqlite nomes.db --conflitos
+    python deduplicacao.py --sqlite nomes.db --exato   # só nomes idênticos
+
+Os registros viram colunas de um DataFrame e os duplicados saem numa única
+passada: a chave de cada nome (sem acentos, maiúsculas e espaços nas bordas,
+a mesma regra do índice único nome_normalizado do PostgreSQL) é calculada só
+para os valores distintos, e os grupos são contados com factorize/bincount.
+Em cada grupo, significado e origem são comparados já normalizados (a origem
+pela forma canônica de origens.py), para apontar os conflitos de verdade.
+"""
+import re
+import argparse
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+import origens
+
+COLUNAS = ['nome', 'significado', 'origem', 'motivo_escolha']
+COLUNAS_RELATORIO = ['nome', 'ocorrencias', 'grafias', 'significados', 'origens',
+                     'conflito_significado', 'conflito_origem']
+
+QUERY_SQLITE = "SELECT id, nome, significado, origem, motivo_escolha FROM nomes"
+QUERY_POSTGRES = """
+    SELECT n.id, n.nome, n.significado, COALESCE(o.nome, n.origem) AS origem, n.motivo_escolha
+    FROM nomes n LEFT JOIN origens o ON o.id = n.origem_id
+"""
+
+
+# Acentos e outros sinais que o NFKD separa da letra ("á" -> "a" + "´").
+_COMBINANTES = re.compile('[\u0300-\u036f]')
+
+
+def chave_nome(nome):
+    """Chave de comparação: sem acentos, minúsculo e sem espaços nas bordas ("Aná " -> "ana")."""
+    nome = nome.strip()
+    if nome.isascii():
+        return nome.casefold()
+    return _COMBINANTES.sub('', unicodedata.normalize('NFKD', nome)).casefold()
+
+
+def _chave_texto(texto):
+    # Sem nenhum espaço: "Esper ança" (quebrado no PDF) não conta como conflito.
+    return ''.join(texto.split()).casefold()
+
+
+def _chave_origem(texto):
+    return origens.canonizar_origem(texto) or ''
+
+
+def _mapear(serie, funcao):
+    """Aplica funcao só aos valores distintos da coluna e espalha o resultado."""
+    codigos, unicos = pd.factorize(serie.fillna(''))
+    valores = np.array(list(map(funcao, unicos)), dtype=object)
+    return valores[codigos]
+
+
+# --------------------------------------------------------------------------
+# Entrada: listas de tuplas, CSV e tabela nomes
+# --------------------------------------------------------------------------
+
+def tabela(registros):
+    """DataFrame a partir de tuplas (nome, significado, origem, motivo)."""
+    if not isinstance(registros, list):
+        registros = list(registros)
+    return pd.DataFrame(registros, columns=COLUNAS, dtype=object)
+
+
+def tabela_linhas(linhas):
+    """DataFrame a partir de tuplas (id, nome, significado, origem, motivo)."""
+    return pd.DataFrame.from_records(list(linhas), columns=['id'] + COLUNAS)
+
+
+def tabela_csv(caminho):
+    import carga_em_massa
+    return tabela(carga_em_massa.ler_csv(caminho))
+
+
+def tabela_sqlite(caminho=None):
+    import sqlite3
+    import db
+    conn = sqlite3.connect(caminho or db.DATABASE)
+    try:
+        return pd.read_sql_query(QUERY_SQLITE, conn)
+    finally:
+        conn.close()
+
+
+def tabela_postgres():
+    import db_postgres as db_conexao
+
+    conn = db_conexao.get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(QUERY_POSTGRES)
+        df = tabela_linhas(cursor.fetchall())
+        conn.commit()
+        cursor.close()
+        return df
+    finally:
+        db_conexao.devolver_conexao(conn)
+
+
+# --------------------------------------------------------------------------
+# Duplicados
+# --------------------------------------------------------------------------
+
+def linhas_duplicadas(df, normalizar=True):
+    """Linhas cujo nome se repete, com a coluna "grupo" (0, 1, ... na ordem
+    em que cada nome aparece pela primeira vez) e na ordem original dentro
+    de cada grupo. Com normalizar=False, só nomes exatamente iguais."""
+    if df.empty:
+        return df.assign(grupo=pd.Series(dtype='int64'))
+    nomes = _mapear(df['nome'], chave_nome) if normalizar else df['nome'].fillna('')
+    grupos, _ = pd.factorize(nomes)
+    repetidos = np.bincount(grupos)[grupos] > 1
+    duplicadas = df[repetidos].copy()
+    # Renumera os grupos que sobraram, mantendo a ordem de aparição.
+    duplicadas['grupo'], _ = pd.factorize(grupos[repetidos])
+    return duplicadas.sort_values('grupo', kind='stable')
+
+
+def _distintos_por_grupo(grupos, valores):
+    """Valores distintos de cada grupo, na ordem de aparição (grupos ordenados).
+
+    Retorna (lista de listas, quantidade de distintos por grupo).
+    """
+    pares = pd.DataFrame({'grupo': grupos, 'valor': valores}).drop_duplicates()
+    grupos_pares = pares['grupo'].to_numpy()
+    cortes = np.flatnonzero(np.diff(grupos_pares)) + 1
+    listas = [list(parte) for parte in np.split(pares['valor'].to_numpy(dtype=object), cortes)]
+    return listas, np.bincount(grupos_pares)
+
+
+def relatorio(df, normalizar=True):
+    """Um registro por nome repetido: grafias, significados e origens
+    distintos e se há conflito (valores diferentes depois de normalizados)."""
+    duplicadas = linhas_duplicadas(df, normalizar)
+    if duplicadas.empty:
+        return pd.DataFrame(columns=COLUNAS_RELATORIO)
+    grupos = duplicadas['grupo'].to_numpy()
+    primeiras = duplicadas.drop_duplicates('grupo')
+    grafias, _ = _distintos_por_grupo(grupos, duplicadas['nome'].to_numpy())
+    significados, _ = _distintos_por_grupo(grupos, duplicadas['significado'].to_numpy())
+    origens_grupo, _ = _distintos_por_grupo(grupos, duplicadas['origem'].to_numpy())
+    _, significados_distintos = _distintos_por_grupo(grupos, _mapear(duplicadas['significado'], _chave_texto))
+    _, origens_distintas = _distintos_por_grupo(grupos, _mapear(duplicadas['origem'], _chave_origem))
+    resultado = pd.DataFrame({
+        'nome': primeiras['nome'].str.strip().to_numpy(),
+        'ocorrencias': np.bincount(grupos),
+        'grafias': grafias,
+        'significados': significados,
+        'origens': origens_grupo,
+        'conflito_significado': significados_distintos > 1,
+        'conflito_origem': origens_distintas > 1,
+    })
+    if 'id' in duplicadas:
+        resultado['ids'], _ = _distintos_por_grupo(grupos, duplicadas['id'].to_numpy())
+    return resultado
+
+
+def por_nome(registros, normalizar=True):
+    """{nome: [(significado, origem, motivo), ...]} só dos nomes repetidos,
+    no formato do encontrar_duplicados() (a chave é a primeira grafia)."""
+    duplicadas = linhas_duplicadas(tabela(registros), normalizar)
+    resultado, primeira_grafia = {}, {}
+    for grupo, nome, significado, origem, motivo in zip(
+            duplicadas['grupo'], duplicadas['nome'], duplicadas['significado'],
+            duplicadas['origem'], duplicadas['motivo_escolha']):
+        chave = primeira_grafia.setdefault(grupo, nome)
+        resultado.setdefault(chave, []).append((significado, origem, motivo))
+    return resultado
+
+
+def imprimir(grupos):
+    """Mostra cada grupo do relatorio(), com os significados/origens divergentes."""
+    for grupo in grupos.itertuples(index=False):
+        ids = f" [ids {', '.join(map(str, grupo.ids))}]" if 'ids' in grupos else ''
+        print(f"\n{grupo.nome} aparece {grupo.ocorrencias} vezes ({' / '.join(g.strip() for g in grupo.grafias)}){ids}")
+        if grupo.conflito_significado:
+            for significado in grupo.significados:
+                print(f"  significado: {str(significado).strip()}")
+        if grupo.conflito_origem:
+            print(f"  origens: {' / '.join(str(o).strip() for o in grupo.origens)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Lista os nomes duplicados e os conflitos de significado/origem.")
+    parser.add_argument('--sqlite', metavar='ARQUIVO', help="lê a tabela nomes deste banco SQLite")
+    parser.add_argument('--csv', metavar='ARQUIVO', help="lê um CSV (ou .csv.gz) de nomes")
+    parser.add_argument('--conflitos', action='store_true', help="mostra só os grupos com significado ou origem divergentes")
+    parser.add_argument('--exato', action='store_true', help="só nomes exatamente iguais (sem ignorar acentos e maiúsculas)")
+    args = parser.parse_args(argv)
+
+    if args.csv:
+        df = tabela_csv(args.csv)
+    elif args.sqlite:
+        df = tabela_sqlite(args.sqlite)
+    else:
+        df = tabela_postgres()
+
+    grupos = relatorio(df, normalizar=not args.exato)
+    conflitantes = grupos[grupos['conflito_significado'] | grupos['conflito_origem']]
+    print(f"{len(df)} registros, {len(grupos)} nome(s) repetido(s), "
+          f"{len(conflitantes)} com significado ou origem divergentes.")
+    imprimir(conflitantes if args.conflitos else grupos)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+import io
+import csv
+import json
+
+# Formatação da exportação em streaming (/exportar, nos dois apps).
+# As linhas chegam do banco em lotes de LOTE_LINHAS (cursor nomeado no
+# servidor) e cada lote vira um pedaço da resposta: a memória usada não
+# depende do tamanho da tabela.
+LOTE_LINHAS = 2000
+# O primeiro lote é pequeno: no NDJSON, que não tem cabeçalho, é ele que
+# começa o download, sem esperar LOTE_LINHAS linhas.
+PRIMEIRO_LOTE_LINHAS = 50
+
+COLUNAS = ('nome', 'significado', 'origem', 'motivo_escolha', 'pesquisas')
+
+QUERY = """
+    SELECT n.nome, n.significado, o.nome AS origem, n.motivo_escolha, n.pesquisas
+    FROM nomes n LEFT JOIN origens o ON o.id = n.origem_id
+    WHERE 1=1
+"""
+
+# formato -> (mimetype, nome do arquivo baixado)
+FORMATOS = {
+    'csv': ('text/csv', 'nomes.csv'),
+    'ndjson': ('application/x-ndjson', 'nomes.ndjson'),
+}
+
+
+def tamanhos_lote():
+    """Tamanho de cada fetchmany(): PRIMEIRO_LOTE_LINHAS e depois LOTE_LINHAS."""
+    yield PRIMEIRO_LOTE_LINHAS
+    while True:
+        yield LOTE_LINHAS
+
+
+def cabecalho(formato):
+    """Primeiro pedaço da resposta (enviado antes mesmo da consulta; vazio no NDJSON)."""
+    if formato == 'csv':
+        # BOM: o Excel abre o CSV em UTF-8 com os acentos certos.
+        return '\ufeff' + ','.join(COLUNAS) + '\r\n'
+    return ''
+
+
+def formatar_lote(formato, linhas):
+    """Converte um lote de tuplas (na ordem de COLUNAS) no texto da resposta."""
+    if formato == 'csv':
+        saida = io.StringIO()
+        csv.writer(saida).writerows(linhas)
+        return saida.getvalue()
+    return ''.join(json.dumps(dict(zip(COLUNAS, linha)), ensure_ascii=False) + '\n'
+                   for linha in linhas)
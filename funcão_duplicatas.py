@@ -1,16 +1,16 @@
+import deduplicacao
+
+
 def encontrar_duplicados(lista_nomes):
     """
     Encontra e retorna nomes duplicados em uma lista de tuplas
+
+    Retorna {nome: [(significado, origem, motivacao), ...]} só dos nomes que
+    aparecem mais de uma vez. A contagem é feita em lote (deduplicacao.py) e
+    considera iguais nomes que só diferem em acentos, maiúsculas ou espaços
+    nas bordas ("Aida" e "Aída").
     """
-    contagem = {}
-    for nome, significado, origem, motivacao in lista_nomes:
-        if nome in contagem:
-            contagem[nome].append((significado, origem, motivacao))
-        else:
-            contagem[nome] = [(significado, origem, motivacao)]
-    
-    # Filtrar apenas os que têm mais de uma entrada
-    return {nome: detalhes for nome, detalhes in contagem.items() if len(detalhes) > 1}
+    return deduplicacao.por_nome(lista_nomes)
 
 # Exemplo de uso
 
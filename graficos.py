@@ -0,0 +1,67 @@
+import io
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+# Cache dos gráficos PNG da página de estatísticas.
+# A chave é o hash dos dados do gráfico: a imagem só é gerada de novo quando
+# a contagem por origem ou o top 5 mudam. Usa a API orientada a objetos
+# (Figure + Agg), que não depende do estado global do pyplot e é segura
+# entre threads. O matplotlib só é importado na primeira renderização, para
+# não pesar no cold start dos workers que nunca servem /estatisticas.
+MAX_GRAFICOS = 32
+
+_cache = OrderedDict()
+_lock = threading.Lock()
+
+
+def chave(tipo, titulo, labels, values, ylabel=None):
+    """Hash estável dos dados do gráfico (usado como ETag e na URL)."""
+    conteudo = json.dumps([tipo, titulo, list(labels), list(values), ylabel],
+                          ensure_ascii=False, default=str)
+    return hashlib.sha256(conteudo.encode('utf-8')).hexdigest()[:16]
+
+
+def renderizar(tipo, titulo, labels, values, ylabel=None):
+    """Gera o PNG do gráfico e devolve os bytes."""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=(10, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    if tipo == 'pie':
+        ax.pie(values, labels=labels, autopct='%1.1f%%', startangle=90, wedgeprops={'edgecolor': 'black'})
+        ax.set_title(titulo)
+        ax.axis('equal')
+    elif tipo == 'bar':
+        ax.bar(labels, values, color='skyblue')
+        ax.set_title(titulo)
+        if ylabel:
+            ax.set_ylabel(ylabel)
+        ax.set_xlabel('Nome')
+        ax.tick_params(axis='x', labelrotation=45)
+        for rotulo in ax.get_xticklabels():
+            rotulo.set_horizontalalignment('right')
+        fig.tight_layout()
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', transparent=True)
+    return buf.getvalue()
+
+
+def obter_png(tipo, titulo, labels, values, ylabel=None):
+    """Retorna (chave, bytes do PNG), gerando a imagem só se não estiver no cache."""
+    k = chave(tipo, titulo, labels, values, ylabel)
+    with _lock:
+        png = _cache.get(k)
+        if png is not None:
+            _cache.move_to_end(k)
+            return k, png
+    png = renderizar(tipo, titulo, labels, values, ylabel)
+    with _lock:
+        _cache[k] = png
+        _cache.move_to_end(k)
+        while len(_cache) > MAX_GRAFICOS:
+            _cache.popitem(last=False)
+    return k, png
@@ -0,0 +1,179 @@
+import os
+import time
+import threading
+from array import array
+from bisect import bisect_left
+
+import db_postgres as db_conexao
+import consultas
+
+# Modelo de leitura em memória da tabela 'nomes'.
+# O catálogo é pequeno (~1.2k linhas), então cada worker carrega tudo uma vez
+# e responde /buscar e /listar sem ir ao banco. O índice é recarregado após
+# o TTL ou quando invalidar() é chamado (ex.: depois de um /cadastrar).
+ATIVO = os.environ.get('INDICE_NOMES_MEMORIA', '1') != '0'
+TTL_SEGUNDOS = float(os.environ.get('INDICE_NOMES_TTL', '60'))
+
+COLUNAS = ('id', 'nome', 'significado', 'origem', 'motivo_escolha', 'pesquisas')
+_ID, _NOME, _SIGNIFICADO, _ORIGEM, _MOTIVO, _PESQUISAS = range(len(COLUNAS))
+
+# Linhas de 'nomes' com a origem canônica (tabela 'origens') no lugar do texto bruto.
+QUERY_LINHAS = """
+    SELECT n.id, n.nome, n.significado, o.nome AS origem, n.motivo_escolha, n.pesquisas
+    FROM nomes n LEFT JOIN origens o ON o.id = n.origem_id
+"""
+
+
+def normalizar(texto):
+    """Chave de comparação sem diferenciar maiúsculas (equivalente ao ILIKE)."""
+    return (texto or '').casefold()
+
+
+def trigramas(texto):
+    return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+
+class IndiceNomes:
+    """Array ordenado por nome com índice de prefixo e postings de trigramas."""
+
+    def __init__(self, linhas):
+        # Tuplas em vez de dicts: bem menos memória por registro.
+        self.registros = sorted((tuple(linha) for linha in linhas),
+                                key=lambda r: (normalizar(r[_NOME]), r[_ID]))
+        # Chaves ordenadas: busca por prefixo com bisect.
+        self.chaves = [normalizar(r[_NOME]) for r in self.registros]
+
+        # Postings: trigrama -> posições (crescentes) no array ordenado.
+        postings = {}
+        for posicao, chave in enumerate(self.chaves):
+            for tri in trigramas(chave):
+                postings.setdefault(tri, array('I')).append(posicao)
+        self.postings = postings
+
+        # Origens distintas são poucas: filtra-se a origem e depois une as posições.
+        origens = {}
+        for posicao, registro in enumerate(self.registros):
+            origens.setdefault(normalizar(registro[_ORIGEM]), array('I')).append(posicao)
+        self.origens = origens
+
+    def __len__(self):
+        return len(self.registros)
+
+    def prefixo(self, termo):
+        """Posições dos nomes que começam com o termo."""
+        chave = normalizar(termo)
+        inicio = bisect_left(self.chaves, chave)
+        fim = bisect_left(self.chaves, chave + '\U0010ffff')
+        return range(inicio, fim)
+
+    def contem(self, termo):
+        """Posições dos nomes que contêm o termo (como nome ILIKE '%termo%')."""
+        chave = normalizar(termo)
+        if not chave:
+            return range(len(self.registros))
+        if len(chave) < 3:
+            return [p for p, k in enumerate(self.chaves) if chave in k]
+        listas = []
+        for tri in trigramas(chave):
+            lista = self.postings.get(tri)
+            if lista is None:
+                return []
+            listas.append(lista)
+        listas.sort(key=len)
+        candidatas = set(listas[0])
+        for lista in listas[1:]:
+            candidatas.intersection_update(lista)
+            if not candidatas:
+                return []
+        # Trigramas não garantem a substring inteira: confirma cada candidata.
+        return [p for p in sorted(candidatas) if chave in self.chaves[p]]
+
+    def filtrar(self, nome='', origem=''):
+        """Posições (em ordem de nome) que atendem aos filtros de nome e origem."""
+        posicoes = self.contem(nome) if nome else range(len(self.registros))
+        if origem:
+            chave = normalizar(origem)
+            permitidas = set()
+            for origem_normalizada, lista in self.origens.items():
+                if chave in origem_normalizada:
+                    permitidas.update(lista)
+            posicoes = [p for p in posicoes if p in permitidas]
+        return posicoes
+
+    def _corte(self, nome, id_nome):
+        """Quantidade de registros que vêm antes de (nome, id) na ordenação."""
+        chave = normalizar(nome)
+        posicao = bisect_left(self.chaves, chave)
+        while (posicao < len(self.chaves) and self.chaves[posicao] == chave
+               and self.registros[posicao][_ID] < id_nome):
+            posicao += 1
+        return posicao
+
+    def pagina(self, posicoes, limite, offset=0, apos=None, antes=None):
+        """Intervalo (inicio, fim) de posicoes para uma página.
+
+        Por cursor (keyset) quando apos/antes = (nome, id); senão, por offset.
+        """
+        if apos is not None:
+            corte = self._corte(*apos)
+            if corte < len(self.registros) and self.registros[corte][_ID] == apos[1]:
+                corte += 1
+            inicio = bisect_left(posicoes, corte)
+            return inicio, min(inicio + limite, len(posicoes))
+        if antes is not None:
+            fim = bisect_left(posicoes, self._corte(*antes))
+            return max(0, fim - limite), fim
+        inicio = min(max(offset, 0), len(posicoes))
+        return inicio, min(inicio + limite, len(posicoes))
+
+    def linhas(self, posicoes):
+        """Converte posições em dicts, no formato retornado por fetch_all."""
+        return [dict(zip(COLUNAS, self.registros[p])) for p in posicoes]
+
+
+_indice = None
+_carregado_em = 0.0
+_lock = threading.Lock()
+
+
+def carregar():
+    """Lê a tabela 'nomes' inteira do PostgreSQL e monta um novo índice."""
+    conn = None
+    try:
+        conn = db_conexao.get_connection()
+        cursor = conn.cursor()
+        consultas.executar(cursor, QUERY_LINHAS)
+        linhas = cursor.fetchall()
+        conn.rollback()
+        cursor.close()
+        return IndiceNomes(linhas)
+    finally:
+        if conn:
+            db_conexao.devolver_conexao(conn)
+
+
+def obter():
+    """Retorna o índice atual (recarregando se expirou) ou None se indisponível."""
+    global _indice, _carregado_em
+    if not ATIVO:
+        return None
+    if _indice is not None and time.monotonic() - _carregado_em < TTL_SEGUNDOS:
+        return _indice
+    with _lock:
+        if _indice is not None and time.monotonic() - _carregado_em < TTL_SEGUNDOS:
+            return _indice
+        try:
+            _indice = carregar()
+            _carregado_em = time.monotonic()
+        except Exception as e:
+            # Mantém o índice antigo (se houver); sem ele, as rotas
+            # voltam a consultar o banco diretamente.
+            print(f"Erro ao carregar o índice de nomes em memória: {e}")
+            return _indice
+    return _indice
+
+
+def invalidar():
+    """Força a recarga do índice na próxima leitura."""
+    global _carregado_em
+    _carregado_em = 0.0
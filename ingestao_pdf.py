@@ -0,0 +1,125 @@
+"""
+Ingestão direta do "Livros dos Nomes.pdf".
+
+    python ingestao_pdf.py                              # carrega no PostgreSQL (DB_*)
+    python ingestao_pdf.py --sqlite nomes.db            # carrega no SQLite
+    python ingestao_pdf.py --simular                    # só extrai e mostra os totais
+
+As páginas são extraídas em paralelo (um processo por núcleo). O texto de
+cada página fica em cache (.cache_pdf/), indexado pelo hash do conteúdo da
+página: numa nova execução só as páginas alteradas são extraídas de novo.
+Depois, os espaços que o extrator insere no meio das palavras ("Hebr aico")
+são reparados (reparo_espacos.py) e os verbetes seguem pelo mesmo caminho do livro_nomes.py até
+a carga em massa.
+"""
+import os
+import sys
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from PyPDF2 import PdfReader
+
+import livro_nomes
+import reparo_espacos
+import carga_em_massa
+
+ARQUIVO_PADRAO = 'Livros dos Nomes.pdf'
+PASTA_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache_pdf')
+# Muda quando a extração muda, para não reaproveitar textos antigos do cache.
+VERSAO_EXTRACAO = '1'
+
+
+# --------------------------------------------------------------------------
+# Extração das páginas (processos)
+# --------------------------------------------------------------------------
+
+_leitor = None
+
+
+def _abrir_no_processo(caminho):
+    """Cada processo abre o PDF uma única vez."""
+    global _leitor
+    _leitor = PdfReader(caminho)
+
+
+def _extrair(indice):
+    return indice, _leitor.pages[indice].extract_text() or ''
+
+
+def hash_pagina(pagina):
+    """Hash do conteúdo bruto da página (não exige extrair o texto)."""
+    conteudo = pagina.get_contents()
+    dados = conteudo.get_data() if conteudo is not None else b''
+    return hashlib.sha256(VERSAO_EXTRACAO.encode() + dados).hexdigest()
+
+
+def extrair_paginas(caminho, processos=None, pasta_cache=PASTA_CACHE):
+    """Texto de cada página, em ordem, extraindo só o que não está no cache."""
+    leitor = PdfReader(caminho)
+    hashes = [hash_pagina(pagina) for pagina in leitor.pages]
+    os.makedirs(pasta_cache, exist_ok=True)
+
+    textos, pendentes = {}, []
+    for indice, chave in enumerate(hashes):
+        arquivo = os.path.join(pasta_cache, f"{chave}.txt")
+        if os.path.exists(arquivo):
+            with open(arquivo, encoding='utf-8') as f:
+                textos[indice] = f.read()
+        else:
+            pendentes.append(indice)
+
+    if pendentes:
+        with ProcessPoolExecutor(max_workers=processos, initializer=_abrir_no_processo,
+                                 initargs=(caminho,)) as executor:
+            for indice, texto in executor.map(_extrair, pendentes, chunksize=4):
+                textos[indice] = texto
+                with open(os.path.join(pasta_cache, f"{hashes[indice]}.txt"), 'w', encoding='utf-8') as f:
+                    f.write(texto)
+    print(f"{len(hashes)} páginas: {len(pendentes)} extraída(s), {len(hashes) - len(pendentes)} do cache.")
+    return [textos[indice] for indice in range(len(hashes))]
+
+
+def linhas_reparadas(paginas, reparador):
+    for texto in paginas:
+        for linha in texto.splitlines():
+            yield reparador.reparar_linha(linha)
+
+
+def ler_pdf(caminho=ARQUIVO_PADRAO, processos=None, ignorados=None):
+    """Gera os registros do PDF (nome, significado, origem, motivo)."""
+    paginas = extrair_paginas(caminho, processos)
+    reparador = reparo_espacos.reparador()
+    for verbete in livro_nomes.verbetes(linhas_reparadas(paginas, reparador)):
+        registros = livro_nomes.interpretar(verbete)
+        if not registros and ignorados is not None:
+            ignorados.append(verbete)
+        yield from registros
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Carrega o Livros dos Nomes.pdf no banco.")
+    parser.add_argument('arquivo', nargs='?', default=ARQUIVO_PADRAO)
+    parser.add_argument('--sqlite', metavar='ARQUIVO', help="carrega neste banco SQLite em vez do PostgreSQL")
+    parser.add_argument('--simular', action='store_true', help="só extrai o PDF e mostra os totais")
+    parser.add_argument('--processos', type=int, default=None, help="processos de extração (padrão: nº de núcleos)")
+    args = parser.parse_args(argv)
+
+    ignorados = []
+    registros = ler_pdf(args.arquivo, args.processos, ignorados)
+    progresso = carga_em_massa.Progresso(a_cada=1000)
+    if args.simular:
+        total = sum(1 for _ in registros)
+        print(f"{total} registros lidos.")
+    elif args.sqlite:
+        lidos, inseridos = carga_em_massa.carregar_sqlite(registros, args.sqlite, progresso)
+        print(f"{lidos} registros lidos, {inseridos} nomes inseridos.")
+    else:
+        lidos, inseridos = carga_em_massa.carregar_postgres(registros, progresso)
+        print(f"{lidos} registros lidos, {inseridos} nomes inseridos.")
+    if ignorados:
+        print(f"{len(ignorados)} trecho(s) fora do formato \"Nome - ...\" ignorado(s).", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+Leitura do livro_dos_nomes.txt em registros (nome, significado, origem, motivo).
+
+    python livro_nomes.py                          # carrega no PostgreSQL (DB_*)
+    python livro_nomes.py --sqlite nomes.db        # carrega no SQLite
+    python livro_nomes.py --simular                # só lê e mostra os totais
+
+O arquivo é lido linha a linha e cada registro segue direto para a carga em
+massa (carga_em_massa.py): a memória usada não depende do tamanho do livro.
+"""
+import re
+import sys
+import argparse
+
+import origens
+import carga_em_massa
+
+ARQUIVO_PADRAO = 'livro_dos_nomes.txt'
+MOTIVO = 'Extraído de Livro dos Nomes'
+
+# Início de verbete: "Nome - ...", com até 4 palavras no nome ("Cury ou Curi",
+# "Abia(s)", "Abdul-Hamide"). O traço separador pode vir colado ao texto
+# ("Ladislau -teutônico") e a linha pode começar com espaço.
+_VERBETE = re.compile(
+    r"^\s*:?(?P<nome>[A-ZÀ-Ý][\w'’().-]*(?: [\w'’().-]+){0,3}?)\s+-\s*(?P<resto>.*)$")
+# Rodapés e cabeçalhos de página do PDF original.
+_RUIDO = re.compile(r"^\s*(?:Retirado do site:|\d+ª\. Edição|\d+\s*$|LETRA\b)")
+# "(Origem) - significado", com ou sem o segundo traço.
+_ORIGEM_ENTRE_PARENTESES = re.compile(r"^\((?P<origem>[^)]*)\)\s*-?\s*(?P<significado>.*)$")
+# "Do árabe abbás, ...", "Do hebraico ...", "De origem latina ...".
+_ORIGEM_DO = re.compile(r"^(?:Do|Da|De origem)\s+(?P<origem>[\w-]+)", re.IGNORECASE)
+# "Hebraico . O iluminado", "Tupi (Iu-R-Ema). Espinheiro", "Antigo Francês (Juel)."
+_ORIGEM_NO_INICIO = re.compile(r"^(?P<origem>[\w-]+(?: [\w-]+)?)\s*(?P<significado>[.(].*)$")
+
+
+def verbetes(linhas):
+    """Agrupa as linhas em verbetes, juntando as linhas de continuação."""
+    atual = None
+    for linha in linhas:
+        if _RUIDO.match(linha):
+            continue
+        linha = linha.strip()
+        if not linha:
+            continue
+        if _VERBETE.match(linha) or atual is None:
+            if atual is not None:
+                yield atual
+            atual = linha
+        else:
+            atual += ' ' + linha
+    if atual is not None:
+        yield atual
+
+
+def interpretar(verbete):
+    """Converte um verbete em registros (um por grafia do nome).
+
+    Retorna lista vazia se o texto não tiver o formato "Nome - ...".
+    """
+    encontrado = _VERBETE.match(verbete)
+    if not encontrado:
+        return []
+    nome, resto = encontrado.group('nome'), encontrado.group('resto').strip()
+
+    origem, significado = '', resto
+    entre_parenteses = _ORIGEM_ENTRE_PARENTESES.match(resto)
+    if entre_parenteses:
+        origem = entre_parenteses.group('origem').strip()
+        significado = entre_parenteses.group('significado')
+    else:
+        do = _ORIGEM_DO.match(resto)
+        no_inicio = _ORIGEM_NO_INICIO.match(resto)
+        if do and origens.origem_conhecida(do.group('origem')):
+            # O texto inteiro é o significado ("Do árabe abbás, nome de ...").
+            origem = origens.origem_conhecida(do.group('origem'))
+        elif no_inicio and origens.origem_conhecida(no_inicio.group('origem')):
+            origem = origens.origem_conhecida(no_inicio.group('origem'))
+            significado = no_inicio.group('significado').lstrip('. ')
+    significado = significado.strip().strip('"“”').strip()
+
+    # "Cury ou Curi", "Erik e Erich": um registro para cada grafia.
+    return [(grafia.strip(), significado, origem, MOTIVO)
+            for grafia in re.split(r'\s+(?:ou|e)\s+', nome) if grafia.strip()]
+
+
+def ler_livro(caminho=ARQUIVO_PADRAO, ignorados=None):
+    """Gera os registros do livro, um verbete por vez.
+
+    Verbetes fora do formato são guardados em ignorados (lista), se fornecida.
+    """
+    with open(caminho, encoding='utf-8') as arquivo:
+        for verbete in verbetes(arquivo):
+            registros = interpretar(verbete)
+            if not registros and ignorados is not None:
+                ignorados.append(verbete)
+            yield from registros
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Carrega o livro_dos_nomes.txt no banco.")
+    parser.add_argument('arquivo', nargs='?', default=ARQUIVO_PADRAO)
+    parser.add_argument('--sqlite', metavar='ARQUIVO', help="carrega neste banco SQLite em vez do PostgreSQL")
+    parser.add_argument('--simular', action='store_true', help="só lê o livro e mostra os totais")
+    args = parser.parse_args(argv)
+
+    ignorados = []
+    registros = ler_livro(args.arquivo, ignorados)
+    progresso = carga_em_massa.Progresso(a_cada=1000)
+    if args.simular:
+        total = sem_origem = 0
+        for _, _, origem, _ in registros:
+            total += 1
+            sem_origem += not origem
+        print(f"{total} registros lidos ({sem_origem} sem origem).")
+    elif args.sqlite:
+        lidos, inseridos = carga_em_massa.carregar_sqlite(registros, args.sqlite, progresso)
+        print(f"{lidos} registros lidos, {inseridos} nomes inseridos.")
+    else:
+        lidos, inseridos = carga_em_massa.carregar_postgres(registros, progresso)
+        print(f"{lidos} registros lidos, {inseridos} nomes inseridos.")
+    if ignorados:
+        print(f"{len(ignorados)} trecho(s) fora do formato \"Nome - ...\" ignorado(s):", file=sys.stderr)
+        for verbete in ignorados[:10]:
+            print(f"  {verbete[:80]}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
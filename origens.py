@@ -0,0 +1,100 @@
+import re
+import unicodedata
+
+# Canonicalização das origens dos nomes.
+# O texto vindo da extração do PDF chega com espaços no meio das palavras
+# ("Hebr aico", "Lati m", "Ára be"), variações de gênero/grafia ("Hebraica",
+# "Latino") e origens compostas ("Grego e L atim"). canonizar_origem() reduz
+# tudo isso a um nome canônico, gravado uma única vez na tabela 'origens';
+# 'nomes' passa a referenciar a origem pelo id.
+
+CANONICAS = (
+    'Afro-brasileiro', 'Alemão', 'Anglo-franco-alemão', 'Anglo-saxão', 'Antigo persa',
+    'Aramaico', 'Árabe', 'Assírio', 'Asturiano', 'Babilônico', 'Basco', 'Brasileiro',
+    'Catalão', 'Celta', 'Escandinavo', 'Eslavo', 'Espanhol', 'Esperanto', 'Etíope',
+    'Etrusco', 'Fenício', 'Flamengo', 'Francês', 'Franco-latino', 'Galego', 'Gálico',
+    'Gaulês', 'Germânico', 'Gótico', 'Greco-latino', 'Grego', 'Guarani',
+    'Hebraico', 'Hispano-americano', 'Holandês', 'Ídiche', 'Inglês', 'Iraniano',
+    'Irlandês', 'Italiano', 'Latim', 'Líbio', 'Normando', 'Persa', 'Polonês',
+    'Português', 'Português antigo', 'Púnico', 'Quíchua', 'Sânscrito', 'Saxão',
+    'Siro-caldaico', 'Sueco', 'Suíço', 'Teutônico', 'Tupi', 'Yawalapiti', 'Yorubá',
+)
+
+# Variantes de grafia que não se resolvem só tirando espaços.
+SINONIMOS = {
+    'alemã': 'Alemão',
+    'anglo-saxônico': 'Anglo-saxão',
+    'antigoportuguês': 'Português antigo',
+    'arameu': 'Aramaico',
+    'astúrio': 'Asturiano',
+    'céltico': 'Celta',
+    'frnacês': 'Francês',
+    'germânica': 'Germânico',
+    'germãnico': 'Germânico',
+    'grego-latino': 'Greco-latino',
+    'hebraica': 'Hebraico',
+    'hebreu': 'Hebraico',
+    'híspano-americano': 'Hispano-americano',
+    'latino': 'Latim',
+    # Adjetivos usados no livro ("Do árabe", "De origem latina").
+    'espanhola': 'Espanhol',
+    'francesa': 'Francês',
+    'grega': 'Grego',
+    'inglesa': 'Inglês',
+    'italiana': 'Italiano',
+    'latina': 'Latim',
+    'portuguesa': 'Português',
+}
+
+# Separadores de origens compostas: vírgula, "e" e "ou" (às vezes "o u").
+_SEPARADOR = re.compile(r'\s*(,)\s*|\s+(e|o\s?u)\s+', re.IGNORECASE)
+
+
+def chave(texto):
+    """Chave de comparação: sem espaços, sem diferenciar maiúsculas."""
+    texto = unicodedata.normalize('NFC', texto or '')
+    return ''.join(texto.split()).casefold()
+
+
+_CANONICAS_POR_CHAVE = {chave(nome): nome for nome in CANONICAS}
+_CANONICAS_POR_CHAVE.update(SINONIMOS)
+
+
+def _canonizar_parte(parte):
+    canonica = _CANONICAS_POR_CHAVE.get(chave(parte))
+    if canonica is not None:
+        return canonica
+    # Origem desconhecida: só junta os espaços repetidos e capitaliza.
+    parte = ' '.join(unicodedata.normalize('NFC', parte).split())
+    return parte[:1].upper() + parte[1:]
+
+
+def origem_conhecida(texto):
+    """Nome canônico se o texto for uma origem conhecida ('grego' -> 'Grego'), senão None."""
+    return _CANONICAS_POR_CHAVE.get(chave(texto))
+
+
+def canonizar_origem(texto):
+    """Nome canônico da origem ('Hebr aico' -> 'Hebraico'), ou None se vazia
+    (inclusive só separadores, como ',' ou ', ,').
+
+    Origens compostas mantêm a ordem e o conectivo: 'Grego e L atim' ->
+    'Grego, Latim'; 'Latim o u grego' -> 'Latim ou Grego'.
+    """
+    if not texto or not texto.strip():
+        return None
+    pedacos = _SEPARADOR.split(texto.strip())
+    # re.split com grupos intercala: parte, vírgula, conectivo, parte, ...
+    # Cada parte não vazia leva o conectivo que vem antes dela.
+    conectivos = [None] + [', ' if virgula or (palavra or '').lower() == 'e' else ' ou '
+                           for virgula, palavra in zip(pedacos[1::3], pedacos[2::3])]
+    partes = [(conectivo, _canonizar_parte(p))
+              for conectivo, p in zip(conectivos, pedacos[::3]) if p and p.strip()]
+    if not partes:
+        return None
+    resultado, vistas = partes[0][1], {partes[0][1]}
+    for conectivo, parte in partes[1:]:
+        if parte not in vistas:
+            resultado += conectivo + parte
+            vistas.add(parte)
+    return resultado[:100]
@@ -1,2575 +1,12 @@
-import sqlite3
-from db import init_db, get_connection
+from db import init_db
+from carga_em_massa import carregar_sqlite
+import dados_nomes
 
 # Inicializa a tabela (caso ainda não exista)
 init_db()
 
-# Lista de nomes de exemplo
-nomes = [
-    ("	Aarão	", "	Aharon, o elevado, o sublime	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Abá	", "	Esper ança	", "	Afro- brasileiro	", "	Extraído de Livro dos Nomes	"),
-("	Abaçaí	", "	Homem de resp eito	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Abade	", "	Abba, pai, guia o u chefe de um  mosteiro. O pa i pela	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Abaeté	", "	Abá-et ê, homem de respeito	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Abanã	", "	Cabelo forte, cabelo duro	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Abaré	", "	Amigo do h omem	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Abati	", "	Cabelos dourad os, loiro	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Abayomi	", "	Nome feminino: encontro feliz 	", "	Yorubá	", "	Extraído de Livro dos Nomes	"),
-("	Abdala	", "	Abdallah, servo de De us. Sobr enome d e muitas famílias no	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-("	Abdão	", "	Aque le que serve	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Abdelcáde r	", "	Servo do Onipotente	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Abdelca rim	", "	Servo do Generoso. Fam oso guerr eiro m arroquino	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Abdelmáleque	", "	Servo do Rei	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Abdénago	", "	Ser vo do De us Nabo. Também usado Abdé nego	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Abder ramã	", "	Servo da Miseric órdia	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Abdias	", "	Obadi ah, servo de Deus	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Abdiel	", "	M eu ser vo é De us	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Abdir	", "	Poderoso	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Abdon	", "	Aquele q ue ser ve	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Abdul- Hamide	", "	Servo do Louvado	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Abeguar	", "	Comedor de ge nte	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Abel	", "	Heb-h el, sopro, hál ito, o qu e chora, esvanec imento. Segun do	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Abela rdo	", "	Adelhard, nobr e resoluto. V indo do francês Abeillard,	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Abella	", "	Bonita	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Abiéze r	", "	Meu pai é aux ílio	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Abigail	", "	Abigayil, fonte de pr azer; pai do cotenta mento. Meu  pai é	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Abíli o	", "	Abiliu, hábil, idôneo, capaz, que não é vingati vo, ou do greg o	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Abimeleque	", "	Meu Pai é rei	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Aboré	", "	O  venerável	", "	Afro- brasileiro	", "	Extraído de Livro dos Nomes	"),
-("	Abra	", "	Abrah am, m ãe das m ultidões. Mãe do Universo. Abra foi a	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Abraão	", "	Abrah am, pa i das mu ltidões. O verdad eiro fund ador do povo	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Abram	", "	Abraham, sublime é o pai	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Abreu	", "	Agradec imento, doaçã o. Do germânico. Avredo	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Absalão	", "	Ab-salom, pai da p az. Variação: Absalem	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Abu	", "	Pai, quand o precede n ome do filho: Abdallah, Abu Muha mmad	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Abud	", "	O mesmo que Abu	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Acabe	", "	Irmão do pa i, tio p aterno	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Acácia	", "	Akaki a, penoso, espi nhoso. A acáci a é uma árvore qu e	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Acciol i	", "	Derivado de acci aioli, instrum ento de aço p ara prod uzir fogo	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-("	Acemir a	", "	Faz do er, doloroso	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Achila	", "	Feminino de Aquiles	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Aci	", "	Mãe	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Acilino	", "	Acylinus ou gre go Ák ylos, bolota, glande d e carvalh o, cidade da	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Acindino	", "	Acindynus ou do greg o Akínd ynos, sem per igo. Feminino:	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Acir	", "	Abreviatura de Moacir 	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Aclima	", "	Irmã gê mea e m ulher de Ca im	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Acrísio	", "	Aquele qu e não disc erne, não disti ngüe	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Açucena	", "	Alvura,  branca com o a flor da pla nta. Variante de Susan a	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Ada	", "	Eada, feliz, próspero; ou he braic o - Adah, tiara, ornamento,	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Adail	", "	Addalil, gui a, caudilho, aquele que m ostra o	", "	Portug uês ou Árab e	", "	Extraído de Livro dos Nomes	"),
-("	Adair	", "	Athadara, passa gem a vau sobre carvalhos. No me de u ma	", "	Celta	", "	Extraído de Livro dos Nomes	"),
-("	Adala rdo	", "	Nobre e forte,  forte como a nobreza. Usa-s e também	", "	Ger Mãnic o	", "	Extraído de Livro dos Nomes	"),
-("	Adalbero	", "	Ad al, nobre, e bero, urso 	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Adalbero	", "	Urso d e nobreza. Fem inino Adalbéria	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Adalberto	", "	Adelbehrt, de Abel (nobr e) e Behrt (ilustre)	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Adalfr edo	", "	No bre e pacífico	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Adalgisa	", "	Lanç a de nobr eza	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-("	Adália	", "	Que vem de Adal, no bre, perfum ada	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Adalmiro	", "	No bre e brilhante, famoso	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Adalto	", "	Para o alto, em  sentid o espiritu al	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Adalvino	", "	Amigo no bre ou da no breza	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Adalzira	", "	Ornam ento no bre	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Adamâncio	", "	Duro co mo di amante	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Adamantina	", "	Muito amável, bo m. Form a feminina de Adamantino	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Adamantin o	", "	Adamas, adamantos,  indomável;  diamantin o, de	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Adamanto	", "	Adámas, Adámantos, dia mante, indomável. Usado ta mbém	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Adamastor	", "	Adamas, diamante, indomável, ind ômito, invencível	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Adamir	", "	Brilhante, famoso, riqu ezas. Nome de ho mem ou mulher	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Adamo	", "	Amo excess ivamente	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Adão	", "	Adham, h omem de terra vermelh a (referênci a ao solo	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Adauto	", "	Aumentado, acresc ido, ajuntado	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Adel	", "	Justo	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-("	Adelaide	", "	Adal-h eit, de linhagem nobr e. Do masculino Adalheida,	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-("	Adela rdo	", "	Adelheid, de estirp e nobre, de class e nobre	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Adelbar	", "	Ader Ba al (ador ador + deus fenício), adorador de Baa lemão	", "	Fenício	", "	Extraído de Livro dos Nomes	"),
-("	Adelelmo	", "	No bre el mo	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Adelfo	", "	Fraternal, ir mão	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Adélia	", "	Adal, nobre. Adela, Lina sã o diminutivos. Adelina, Adelino,	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Adelita	", "	Diminutivo de Adélia	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-("	Adelm ar	", "	Adal + Mari (nobr eza + célebre), de n obreza cé lebre	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Adelm arino	", "	No bre, célebre	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Adelmiro	", "	No bre, célebre	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Adelmo	", "	Abreviatur a de Adelelmo	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Adelson	", "	Ádel, justo	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Adeltrudes	", "	Adeltrud, pod er, força nobre	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Ademar	", "	Adhemar, guerr eiro gl orios o. De Adhe (g uerreir o) e Mar	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Ademir	", "	Revestid o de nobrez a, riqueza	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Adeodato	", "	Da do por De us. Variação de De odato; Deus dedit	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Aderaldo	", "	O  que governa	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Aderbal	", "	Athar Bal l, cultor do deus Baa lemão	", "	Fenício	", "	Extraído de Livro dos Nomes	"),
-("	Aderico	", "	Príncip e guerre iro	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Adi	", "	Aparec e na genealogia de Jesus	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Adib	", "	Educado, instruído	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Adiel	", "	Meu ornamento é De us	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Adíli o	", "	Fida lgo, nobre. Fem inino: Adília	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Adina	", "	Adni, voluptosa; estimada pe la sua figur a. Dina é di minutivo  e	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Adir	", "	Ilustre	", "	Fenício	", "	Extraído de Livro dos Nomes	"),
-("	Adira	", "	Sensív el	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Adlai	", "	Meu teste munho (da pa lavra de De us), meu ornamento	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Adler	", "	Adlar, águ ia. Claro d e mente e visão	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Admeto	", "	Admetus ou gr ego Admetos,  indomável	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Admin	", "	Citado na ge nealogia de Jesus	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Ado	", "	Que tem  prosper idade e beleza. Fem inino: Ada	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Adolfo	", "	Adalwolf, nobr e, lobo heró i, bravo guerr eiro. Ad, Do lf,	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Adom	", "	Rei de Gaza	", "	Aram aico	", "	Extraído de Livro dos Nomes	"),
-("	Adonai	", "	Senh ores meus. Um dos nomes de De us no Antigo	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Adonaide	", "	Nome poétic o da deus a Vênus	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Adônia	", "	Feminino de Adônis	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Adonias	", "	Deus é meu senh or. Foi um prínc ipe he braico, filh o do Rei	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Adoniram	", "	Adon + ram (sen hor + elevado).  O Senhor é excelso	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Adônis	", "	Adon ou do greg o Ádonis, senh or. Adônis na m itologia foi um	", "	Fenício	", "	Extraído de Livro dos Nomes	"),
-("	Adorabela	", "	Ador iabelle, dá diva form osa	", "	Franco-lat ino	", "	Extraído de Livro dos Nomes	"),
-("	Adorinda	", "	Adorável,  estimável	", "	Espera nto	", "	Extraído de Livro dos Nomes	"),
-("	Adozina	", "	Doce	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Adramale c	", "	Ad ar é conselh eiro	", "	Ba bilônico	", "	Extraído de Livro dos Nomes	"),
-("	Adraste a	", "	Aquela de que m nã o se pode fugir . Apelido de Nêmesis,	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Ádrasto	", "	O  inevitável,  de quem não se po de fugir 	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Adriana	", "	Da cida de de Ária, regi ão ban hada p elo ma r Adriático. Ádria	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Adriano	", "	Ater, aquele que é escur o; pess oa mo rena; ap elido entre os	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Adriel	", "	Da con gregaç ão divina	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Adroaldo	", "	Uodal + Wald, que governa as riquez as	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Aécio	", "	Aetos, águia	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Aegla	", "	Aígle, Aglaê, esp lendor	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Afif	", "	Hon esto,  casto	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-("	Afonso	", "	Nobre e di ligente, atencioso. V ariação de Alfonso	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Afra	", "	Feminino de afro	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Afrânio	", "	Afrani us, que vem de uma língua afric ana. Poeta côm ico lat ino	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Agamedes	", "	Arqu iteto que construi u o templo de Apolo, em  Delfos	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Agamenon	", "	Muito firme, pers everante, resistente	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Agápio	", "	Afeiçã o, caridade	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Agapito	", "	Agapitus ou do gre go Agapetós, amável, quer ido	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Agar	", "	Estrang eira. Agar foi concub ina de Abraã o	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Ágat a	", "	Agathé, boa, bondosa	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Agátocle s	", "	Boa fam a	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Agda	", "	Boa	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Agenor	", "	Bravo, soberbo, viril	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Ageu	", "	Alegre, festi vo, contente,  nasc ido e m dia de festa	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Agilberto	", "	Agil-bert, espada que br ilha ou espad a que tem  fama,	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Agild o	", "	Ofer ta dos d euses	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-("	Agliberto	", "	Espa da que bri lha	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Agnata ou  Agnato	", "	Parente por li nha pater na	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Agnelo	", "	Agnellus, cord eirinho	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Agnês	", "	Agne, pura, santa, cord eirinha, ovelh a nova	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Agostinh o	", "	Form a diminutiva de Augusto	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Agra	", "	Campo de fonte	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Agrécio	", "	Agreste, do ca mpo	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Agrícola	", "	Agric ultor	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Agripa	", "	Dado à lu z com dificuld ade. Grande ge neral ro mano	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Agripina	", "	Que foi dad o à luz com dificuldade	", "	Latin o	", "	Extraído de Livro dos Nomes	"),
-("	Agripino	", "	Der ivado d e Agripa: Agra + pous (p egar + pé), o que nasceu	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Aguiar	", "	Lu gar onde h abita m águ ias	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Aguilar	", "	Orig inário do portugu ês Aguiar	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-("	Aguinal do	", "	Aginald, aq uele q ue governa com a espada	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Agustine	", "	Augustin e, que pertence a Augusto. Agostinho, Austi n, são	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Aida	", "	Pud or, recato. Nome de u ma óp era de V erdi, repres entada pe la	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-("	Aída	", "	Derivam Aída, do an glo-s axão Eada (pr óspera, feliz)	", "	Et íope	", "	Extraído de Livro dos Nomes	"),
-("	Aidil	", "	Eid il, nobre, fida lgo. Ou do ár abe Aidel, justic eiro	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Ailson	", "	De sa grada fam a	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Aílton	", "	Variação do nome Ayrton	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Aimberê	", "	Dur o, inflexível; flauta im prestável ou lag artixa. Variação:	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Aimara	", "	Araçá do bre jo. Variação: Aymara	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Aimê	", "	Aimée, amada, quer ida	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Aimée	", "	Amada, querida. Particípi o passado fe minino d o verbo a imer	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Aimone	", "	Do g ótico Haims; ho me, em  inglês, casa	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Aimoré	", "	Hai + mb o' ré, o mordedor; do verbo mbor (ter)	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Airão	", "	M eu irmão	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Aires	", "	Ar, águia, prínci pe, senhor . Usado co mo so breno me	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Airumã	", "	Estre la D'a lva	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Aixa	", "	A vivente.  Nome da mu lher favorita de Maomé	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Airy	", "	Nome de u ma p almeira	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Aisó	", "	Form osa	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Aiury	", "	O socorro, a ajuda	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Aiyra	", "	Filh a	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Ajá	", "	Espírito benfaz ejo	", "	Afro- brasileiro	", "	Extraído de Livro dos Nomes	"),
-("	Ajagunã	", "	Guerr eiro forte	", "	Afro-bras ileiro	", "	Extraído de Livro dos Nomes	"),
-("	Ajax	", "	Que ge me ou l amenta, person agem mi tológico	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Ajuricaba	", "	Muito  irritável. Espéci e de abelha. Índio am azonense q ue,	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Ajyra	", "	Filh a do irm ão, sobri nha	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Alabá	", "	Espírito infanti l	", "	Afro- brasileiro	", "	Extraído de Livro dos Nomes	"),
-("	Aladino	", "	Subl imidade da rel igião	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-("	Adaíde	", "	Linhagem nobr e. Variação de Adelaide	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Alan	", "	Crescer , grac ioso, agra dável	", "	Germ ânico o u celta	", "	Extraído de Livro dos Nomes	"),
-("	Alana	", "	Li nda, bela	", "	Celta	", "	Extraído de Livro dos Nomes	"),
-("	Alaor	", "	Filho d e Abderram ã	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-("	Alarice	", "	Alhric, que governa todas as cois as, todo-p oderoso	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-("	Alarico	", "	Alhric, todo p oderos o, que governa tudo	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Alba	", "	Alva,  muito bra nca	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Albach	", "	Ri acho das e nguias	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Albano	", "	Nascid o na cida de de Alba, Itália. Variação masculina de Albino	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Albarino	", "	Reboc ador	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Albérico	", "	Rei dos m ontes	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Alberto	", "	Aethe lbert,  nobre e bri lhante ou i lustre. O me smo que	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Albin o	", "	Albinus, que vem de Albus, alvo, branco	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Albio n	", "	Alvo. Nome pelo qual também se co nhece a Ingl aterra	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Alboi no	", "	Alf + win (elfo + am igo), amigo de Elfos, os espíritos do	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Albornoz	", "	Origi nário d a tribo berber e. Usado co mo sobr enome	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Albuq uerque	", "	Alba + quercus, carvalho branco	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Alcaçova	", "	Do caste lo de Alcaçova  de L isboa	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Alcântara	", "	Al + kantara, po nte	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-("	Alcebíades	", "	Alkibiades, violento e generos o	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Alceste	", "	Alk, forte,  vigoroso. Figura m itológica ress uscitada por Quir on	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Alceu	", "	Alkaios, forte	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Alcides	", "	Variação de Alceu	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Alcídio	", "	O me smo que Alcídes, Alceu	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Alcina	", "	Alkinoé, de me nte forte;  capaz de transform ar poeira em ouro	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Alcindo	", "	Caráter forte.  Variação ma sculina d e Alcino, que vem de	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Alcione	", "	Maçarico, ave marinha. Nome de um a estrela d a constelaçã o	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Alda	", "	Eada, velha, sáb ia, rica	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Aldemiro	", "	V ariação de Adelmiro	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Alderico	", "	Sen hor de nobr eza ou príncip e venerável por sua id ade	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Aldevino	", "	Amigo da no breza. Fem inino: Aldevina	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Aldo	", "	Ald, velho e sáb io	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-("	Aldobrand o	", "	Espada velha	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Aldonca	", "	Doc e	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Aldonça	", "	Guerr eira no bre, guerre ira velha	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Aleardo	", "	Estrange iro que te m força	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Alécio	", "	Calda de peixe,  salmoura	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Alecrim	", "	No me de flor, usad o como sobren ome	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Aleixo	", "	Alexius, grego Aléxios,  que defend e e protege. V ariaç ão de	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Aleluia	", "	Louva ao Sen hor	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Alenc ar	", "	Templo dos Alanos. Derivado tam bém de Alenquer, vila	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Alessandra	", "	Que res iste aos homens. Adaptação ita liana do greg o para	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Alete	", "	Alada, se melhante a um  passar inho	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Alexandre	", "	Alexandros, defensor da es pécie h umana	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Alexandri no	", "	Form a diminutiva de Alexandrin a	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Aléxis	", "	Que se defend e. Variação de Alexandre	", "	Grego e L atim	", "	Extraído de Livro dos Nomes	"),
-("	Alfa	", "	Primeira l etra do alfabeto gre go. Alfa e Ôm ega: o princípi o e o fim	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Alfena	", "	Planta sem elhante ao ja smim, d e flores brancas	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Alfeu	", "	Alphéios, branco, alvo	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Álfio	", "	Derivado dos oscos. V ariaç ão de Alfeu	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-("	Alfonsina,  Alfonsine	", "	Fem inino de Alfonso	", "	Ale mão	", "	Extraído de Livro dos Nomes	"),
-("	Alfonso	", "	Adalfuns,  de espírito combativo , inclinado ao com bate	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Alfreda	", "	Co nselh eira dos e lfos	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-("	Alfredo	", "	Aelfraed, bo m ou pe quen o duende conse lheiro. Ou de	", "	Angl o-saxão	", "	Extraído de Livro dos Nomes	"),
-("	Ali	", "	Al ou el, sen hor, sublime, excelso	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Alice	", "	Aleth ia, a verdade ira; grega q ue não con hece a me ntira. Elsi e,	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Aligh ieri	", "	La nça velha ou lança estra geira. No me e so breno me d e	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Alilat	", "	O deus Ura no	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Alina	", "	Agulha	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Aline	", "	De linhage m no bre, gracios a, atrae nte. Variação francesa Adeline,	", "	Celta	", "	Extraído de Livro dos Nomes	"),
-("	Alípi o	", "	Alegre	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Alírio	", "	Natur a alemão d a Ilíria. Santo da Igre ja Catól ica	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Alison	", "	De sa grada fam a	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Allende	", "	Além, do lad o de lá, além da po nte	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-("	Alma	", "	Bon dosa, clemente. Substânc ia espir itual qu e governa o cor po	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Almada	", "	A mina (d e ouro ou prata)	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Almeida	", "	Al + ma ida, campo plano, chão pla no, mesa. Sobr enome	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-("	Alméria	", "	Princes a. Ou proce dentes da província espa nhola de Alméria	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-("	Almerinda	", "	Procede nte da cidade de Alméria	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-("	Almerind o	", "	V ariaç ão de Almério	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-("	Almério	", "	Prínci pe rico e traba lhador	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Almir	", "	Ilustrado p or nobreza	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-("	Almirante	", "	Alcunha pri mitiva usad a como nome e sobre nome	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Almiro	", "	O  prínci pe, celta, delicadeza	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-("	Alódia	", "	Herdeira	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Aloísio	", "	Inteir amente prud ente, esperto. Variação d e Luís	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Alpin o	", "	Albinus e Albus, alvo, branco	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Al-samir	", "	O  amigo enca ntador 	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-("	Altair	", "	A estrela qu e voa; da constelaç ão da águ ia	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-("	Altamir	", "	Velho, esperto, brilhante	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Altamiro	", "	Altmir, velho esperto ou bri lhante. Ou do topônimo	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Altéia	", "	Althaía, que cur a, sara	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Altino	", "	De estatura fora do com um	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Aluísio	", "	Aloysius, que vem de Lu dwig (Luiz) em  alemão, daí o no me	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Alvarado	", "	Conse lho dos e lfos, também der ivado d e Álvaro ou de	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Alvarenga	", "	Nascid o em Alvarenga	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Álvaro	", "	All + Wars, muito atento	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-("	Alvim	", "	Der ivado d e Albini (vila)	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Alvina	", "	Adal + win, nobre amigo	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Alvino	", "	No bre am igo	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Alzira	", "	Orna mento e beleza	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Amã	", "	Grande	", "	Persa	", "	Extraído de Livro dos Nomes	"),
-("	Amábile	", "	Amabile, amável	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-("	Amada	", "	Aimés, am ada. Significaç ão litera l	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Amadeu	", "	Ama a Deus	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Amado	", "	Amado, querido	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Amador	", "	Aquele que am a	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Amalberga	", "	Que pr otege os trabal hos da guerr a	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Amália	", "	Amala, aquela que é traba lhadora e ativa	", "	Gótico	", "	Extraído de Livro dos Nomes	"),
-("	Amaltrudes	", "	Ativa e querida	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Amana	", "	Chuva, nuvem	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Amanac y	", "	Mãe da chuva,  páss aro que an uncia a ch uva	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Amanar a	", "	Dia chuvoso	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Amanay ara	", "	O manda chuva,  o sen hor da chuva	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Amâncio	", "	Aquele qu e ama, a mante	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Amanda	", "	Amanda, dig na de ser am ada	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Amandi no	", "	Aquele qu e deve ser am ado	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Amândi o	", "	Aquele que deve ser a mado	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Amando	", "	Que é p ara amar, digno de ser a mado	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Amandy	", "	Água da chuva	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Amapola	", "	Bela flor , papou la	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-("	Amaral	", "	Onde há a maros, espécie d e salva, planta a marga	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Amarante	", "	Que não des merece, nome do a maranto (flor dos	", "	Latim o u grego	", "	Extraído de Livro dos Nomes	"),
-("	Amaranto	", "	Que n ão des merec e	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Amarílis	", "	Fresca, brilhante. Planta de gra ndes e bel as flores	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Amarino	", "	Um pouco a margo	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Amaro	", "	Amarus, am argo. O mesmo que M auro	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Amary	", "	Árvore da famí lia das rutáce as	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Amasia s	", "	Javé confirm ou	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Amata	", "	Amada	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Amato	", "	Amado	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Amazonas	", "	Amazónes, sem  seio	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Ambrósio	", "	Abrotos, o divino, o imortal	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Américo	", "	Prínci pe lab orios o. O mesmo que Amauri	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Amerino	", "	Amerinus, naturale mão da cid ade de América, Etrúria	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Amério	", "	Chefe de obr a	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Amiel	", "	M eu povo  é Deus	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Amílcar	", "	Ham Melkas, graça de Hérc ules	", "	Púnic o	", "	Extraído de Livro dos Nomes	"),
-("	Amin	", "	Fiel. Nome d a mãe de Maomé	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-("	Amina	", "	Fiel. Amina foi a mãe de Maomé (Mahomet) fundador d o	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-("	Aminabad	", "	M eu tio patern o é generos o	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Aminda	", "	Digna de ser a mada	", "	Espera nto	", "	Extraído de Livro dos Nomes	"),
-("	Aminon	", "	Digno d e confianç a	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Amintas	", "	Amyno, protetor , defensor 	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Amir	", "	Prínci pe	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Amiron	", "	Deus é sub lime	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Ammon	", "	Júpiter. Hebraico: filh o do meu povo, no me de u m rei d e Judá,	", "	Líb io	", "	Extraído de Livro dos Nomes	"),
-("	Amonati	", "	dista nte	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Amorin	", "	Origem de Gáliza	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Amós	", "	O forte, o robusto	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Amapro	", "	Manuparar e, dar a m ão ou proteger 	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Ampéli o	", "	Ampelius, grego Ampelos, v inhedo	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Ana	", "	Han nah, cheia de graça, a benéfic a	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Anabela	", "	Amável	", "	Inglês	", "	Extraído de Livro dos Nomes	"),
-("	Anacleto	", "	Chamado de novo	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Anael	", "	No ocultis mo é o a njo qu e governa as sa lamandras	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Anajá	", "	Palmeira alta	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Anajé	", "	Gavião	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Anami	", "	Nome de uma árvore	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Ananã	", "	Cheiros o, fruta cheiros a, ananás, abac axi	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Ananias	", "	Han aniah, o amado de De us	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Anápio	", "	Anapius, greg o Anapias, romano q ue salvou seus pais de u ma	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Anastácia	", "	Anastac ios, da ressurreiç ão	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Anatólio	", "	Anato lios, ho mem do or iente ou do le ste	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Anaxágoras	", "	Anax  + agor á (o primeiro + reu nião), o do minador d a	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Anaximandro	", "	Nascid o para governar , dominador	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Anchieta	", "	Topônimo de or igem basca	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-("	Ander son	", "	Filho d e Andr é	", "	Germ ânico, in glês	", "	Extraído de Livro dos Nomes	"),
-("	Andirá	", "	Vampiro, morcego	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Andrade	", "	Topônimo do reino d a Galiza	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	André	", "	Andr eas, forte, viril	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Andreoli	", "	Sobr enome ita liano derivado de André	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-("	Ándrocles	", "	Glória de ho mem, ho mem glorioso	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Aneci	", "	Cheia de graça, relativo a Nanci	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Anésio	", "	Ánesis, repous o	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Ângela	", "	Ángelos (leia-s e ânguelos), me nsag eiro	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Angélica	", "	Angelicus, puro com o um  anjo. Conceito da m ulher	", "	Greco-l atino	", "	Extraído de Livro dos Nomes	"),
-("	Ângelo	", "	Ângelos, anjo, daí o italiano Ângelo, anjo ou m ensageiro	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Angícia	", "	De usa dos enca ntam entos. Às vezes  confundi da com  sua irm ã	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Anhaia	", "	Irmã o	", "	Espan hol, basco	", "	Extraído de Livro dos Nomes	"),
-("	Anhangá	", "	Só alma	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Anhangüera	", "	O fantasm a, diabo consu mado, o esp ectro.  Variação:	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Aníbal	", "	Graça de Baa l, dádiva  de Baal	", "	Púnic o	", "	Extraído de Livro dos Nomes	"),
-("	Aniceto	", "	Invencí vel	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Anícia	", "	Filha d e Ana	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Anira	", "	Anel	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Anis	", "	Amável	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-("	Anísio	", "	Completo, perfe ito	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Anjos	", "	Sobren ome de orig em religiosa	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Ann, Anne	", "	Ana	", "	Ing lês, franc ês	", "	Extraído de Livro dos Nomes	"),
-("	Ansbe rto	", "	Bril ho dos de uses Asen	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Anselmo	", "	Ansh elm, e lmo divino	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Antelmo	", "	Co berto de flores	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Antê mio	", "	Anthos, flor 	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Antenor	", "	Lutador qu e toma lugar de outro; aqu ele qu e substitui outro	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Ante ro	", "	Cheio de flores	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Anteu	", "	Antai os ou Anthé us, que está na vangu arda, florid o. Giga nte	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Anthony	", "	Antônio	", "	Inglês	", "	Extraído de Livro dos Nomes	"),
-("	Antídi o	", "	Que está perante Zeus	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Antístene s	", "	Que é contra a força	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Antoine	", "	Antôn io	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Antônia	", "	Anton ia, inesti mável.  A que não tem  preço. Forma fe minina d e	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Antoni no	", "	Li gado a Antôni o	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Antôni o	", "	Antonius, in estim ável, o que nã o tem preç o. Tonho, Toninho,	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Aparício	", "	Apar ição. Antigamente, no Brasi l, os m eninos nasc idos no di a	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Apiúna	", "	Pinta do de preto	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Apoem a	", "	Aquele qu e enxerga longe	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Apoli nário	", "	Co nsagra do a Apolo, deus da pr ocriaçã o na mitologia greco-	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Apolo	", "	O ma is be lo dos deus es. Deus da procr iação	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Apolo doro	", "	Pres ente do deus gr ego Apolo	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Apolô nia	", "	Co nsagra da a Apolo	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Apolô nio	", "	Apollonius, grego Apélon, o pertencente a o deus Apolo, o	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Aprígio	", "	Caçad or de javali	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Aquias	", "	M eu irmão é Javé,  amigo de Ja vé	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Áquila	", "	Aquila, águ ia	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Aquiles	", "	Achiléus ou Achlys, lobo terrí vel. Homem de lá bios curtos e	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Aquil ina	", "	Aquila, águia	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Aquil ino	", "	Aquila, águ ia	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Aquin o	", "	Nasc ido e m Aquino, Itália (Sa nto Tomás de Aquino)	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Ará	", "	A que an da, caminha	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Arabela	", "	Ara-bel la, altar form oso	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Arabi	", "	Lindas lá grimas. Índia a mazonens e que segu ndo a le nda, chorou	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Aracaé	", "	Pássaro bri guento	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Aracê	", "	Despo ntar, auror a	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Aracéli	", "	Altar do céu	", "	tup i	", "	Extraído de Livro dos Nomes	"),
-("	Aracema	", "	Saída do d ia, aurora	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Araci	", "	Aracy, mão do dia, a aurora	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Aracné	", "	Aran ha, na mitologia	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Aracunda	", "	Papag aio arrufa do ou parru do, forte	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Aragão	", "	Aragó n, topô nimo de Aragón, proc edente de Aragó n	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-("	Araguarino	", "	A água ou rio da ba ixada dos papagaios	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Araíba	", "	Papag aio ou te mpo m au, tem pestad e	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Aramis	", "	Oriundo d e Aramits, uma localidade dos Baixos Pirineus, na	", "	Basco	", "	Extraído de Livro dos Nomes	"),
-("	Aranha	", "	Que tece,  tece lã perfeita. Alcunha q ue ma is tarde pass ou a ser	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Arani	", "	Tempo furioso	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Arantes	", "	De Arantes, topônimo	", "	Galeg o	", "	Extraído de Livro dos Nomes	"),
-("	Arão	", "	O montanhês, o el evado, o ilu minado, o inspira do	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Arapuã	", "	Abelha qu e faz o enxu redon do	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Araquém	", "	Pássar o ou tempo que dor me, dor minhoc o	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Ararê	", "	Amigo dos pap agaios, páss aros	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Arari	", "	Arara am arela, canindé. Nome de um a árvore e da tinta que del a se	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Araribóia	", "	Cobra do rio d as araras, cobra ronca deira	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Araripe	", "	Rio dos pap agaios	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Araruna	", "	Arara preta	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Aratama	", "	Terra dos pa paga ios	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Araújo	", "	Topônimo do galego, do castelo de Araúj a, perto do rio	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Arcádio	", "	Arcad ius, grego Arkádi os, homens ursos, vindos d a terra d os	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Arcângelo	", "	O pri meiro entre os anj os	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Arco-ve rde	", "	Muirau bi, madeira para arco (m uíra) v erde (u bi)	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Arduíno	", "	Homem forte  e au daz	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Arésio	", "	Agradável	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Argemiro	", "	Co mbatente,  guerreir o ilustre	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-("	Argeu	", "	Arge ios ou Aragaios, radiante, bri lhoso	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Argos	", "	Brilhante, luzidio, radiante. Person agem mi tológico	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Ari	", "	Arih, leã o. Tupi: homem vaidoso, o cachea do	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Ariadna	", "	Nome de pers onag em da mitologia greg a que deu a se u	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Ariadne	", "	Ariádne, ou ori undo da i lha de Cr eta. Ari M ágne, a mu ito	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Ariana	", "	Ares, nome do deus da g uerra na m itologia, eq uivalente a	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Ariberto	", "	E xército valoroso. No me d e reis da Lombardia	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Aricem a	", "	Palma que brota	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Arícia	", "	Princ esa ateni ense	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Arides	", "	Aridaios, latim Arideus, muito destruid or, guerr eiro	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Ariel	", "	Fogo de De us, leão de De us	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Arilda	", "	Lar , doméstica	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Arina	", "	Alegre	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Arion	", "	O  muito enérgico, o apressad o	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Ariosto	", "	Latin izado Ariovistus,  o fida lgo. Fam oso poeta ital iano, autor de	", "	Celta	", "	Extraído de Livro dos Nomes	"),
-("	Ariovald o	", "	Ariawald ou Heri + w aldan (exército +  comandar), o9	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Aristágoras	", "	O ótim o orad or, ótim o conse lheiro	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Aristar co	", "	Ótimo chefe	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Aristeu	", "	Ótim o, muito b om	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Aristides	", "	Bril hante pe la sua ascen dênc ia	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Aristip o	", "	O  melhor cavalo. Filósofo sensu alista	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Aristo	", "	O me lhor	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Aristocléa o u Aristocléia	", "	Ilustre.  Sacer dotisa do Templo de Apolo,	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Arístocles	", "	O  melhor e ma is rep utado	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Aristodemo	", "	O me lhor do povo	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Aristófanes	", "	O  que parec e ser o m elhor	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Aristófi la	", "	Amiga das coisas no bres ou me lhores	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Aristófi lo	", "	Amigo do melhor, do puro, do be m esco lhido	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Ariston	", "	O me lhor	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Aristóteles	", "	E xcelente confide nte, ótimo co nselh eiro	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Aritana	", "	Nome de u m fam oso caci que da tribo	", "	Yawalapiti	", "	Extraído de Livro dos Nomes	"),
-("	Arlene	", "	Gara ntia, penhor 	", "	Celta	", "	Extraído de Livro dos Nomes	"),
-("	Arlete	", "	Airleas, (pe nhor) atra vés do francês Arlette	", "	Celta	", "	Extraído de Livro dos Nomes	"),
-("	Arlindo	", "	Poderoso co mo a águia, escu do da águ ia	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Armando	", "	Homem do e xército, homem de armas	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Armênio	", "	Natural d a Armênia, terra dos m ontes az uis	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Armina	", "	Har imann, guerr eira	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-("	Arminda	", "	Doc e	", "	Germ ânica	", "	Extraído de Livro dos Nomes	"),
-("	Armind o	", "	Har imann, ho mem de g uerra	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-("	Armíni o	", "	Forte, poderoso. Nome de u m heró i germânico, uma	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Arnaud	", "	Arna ldo	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Arnóbio	", "	Vida de C ordeiro	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Arnold	", "	Arnaldo	", "	Ing lês, alemã	", "	Extraído de Livro dos Nomes	"),
-("	Arnoldo	", "	Arwald, forte co mo u ma á guia	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Arnolfo	", "	Combatente co m a cora gem da águ ia e do lob o	", "	teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Arnon	", "	Topôn imo, Armôn, rio que d eságu a no Mar Morto	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Arns	", "	Mais usad o como sobren ome	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Arnulfo	", "	Hari + wald (exército + comandar), o co mandante, o chefe	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Aron	", "	Luz ou il uminado	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Arouche	", "	Procede nte de Arouche, Andaluzia	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-("	Arquelau	", "	Guia, chefe do povo, governador do p ovo	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Arquias	", "	Governo, mando	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Arquibald o	", "	Erch an-bo ld, sagrad o, nobre e ousad o	", "	An glo-franc o-ale mão	", "	Extraído de Livro dos Nomes	"),
-("	Arquimede s	", "	O  que pens a muito. Nome de um  dos ma is cél ebres	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Arrais	", "	Ch efe de embarcaç ão	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Arriaga	", "	Pedras enxutas,  pedras estreitas	", "	Basco	", "	Extraído de Livro dos Nomes	"),
-("	Arrieta	", "	Pedreg al, pedreira	", "	Basco	", "	Extraído de Livro dos Nomes	"),
-("	Arrigo	", "	Variação de He nrique	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-("	Arriola	", "	Lugar d e pedras, oficin a de pedras	", "	Basco	", "	Extraído de Livro dos Nomes	"),
-("	Arroyo	", "	Arroio	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-("	Arruda	", "	Nome de pl anta, lugar on de há arru da	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Arsênio	", "	Forte, viril	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Arsinoé	", "	De forte  caráter. Nome de pr incesas egípc ias	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Arsíone	", "	Arsin oé, Arsínoos, espírito, ânimo varonil	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Artaxerxer	", "	Artahs hasa, que rei na com  justiça, que te m arte	", "	Iran iano	", "	Extraído de Livro dos Nomes	"),
-("	Artemidoro	", "	Presente de Artemis, deusa da mi tologia	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Ártemis	", "	Frescor , saúde, sad ia. Irmã de Apolo e fil ha de Zeus. Deusa	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Artemis a	", "	Perfeita. No me de ra inhas	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Artigas	", "	Ártiga, Órtiga, castiga da, ensinada, para o basco si gnific a	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Artur	", "	Arth-w r, o no bre, o generos o	", "	Celta	", "	Extraído de Livro dos Nomes	"),
-("	Arturo	", "	Artur 	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-("	Aruana	", "	Jeitoso, hábil	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Asael	", "	Deus fez	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Asariel	", "	Meu Deus li ga, meu Deus luta	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Ascânio	", "	Campo flor ido. Planície n a Frígia. Ascânio, na m itologia, é	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Ascári	", "	Sen hor de frei xo	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Ascendi no	", "	Que sobe, que se e leva	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Ascenso	", "	Aquele que sub iu, que se elevou	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Asdrúbal	", "	O auxiliar de Baa l	", "	Púnic o	", "	Extraído de Livro dos Nomes	"),
-("	Asélia	", "	Ju menti nha	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Aselma	", "	Divina proteç ão	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Aser	", "	Tesouro. Um dos doze filhos d e Jacó	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Asileu	", "	Deus qu e presidia ao refúgi o que Rô mulo abr ira em  Roma. Seu	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Aspásia	", "	A carin hosa, aqu ela qu e recebe co m ternura	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Assad	", "	Mais feliz	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Assis	", "	Proc edente de Assis na Itália. No me d e origem religiosa, São	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Assuero	", "	X erxes , form a persa dess e nome greg o, famoso rei d a Pérsia	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Assunção	", "	Nome de m ulher, por inf luênc ia da Assunção de Maria,	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Assunta	", "	Sub ida, elevada	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Assurbaní pal	", "	O  deus Asur de u um filho	", "	Assírio	", "	Extraído de Livro dos Nomes	"),
-("	Astéria	", "	Brilhante como um astro	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Astério	", "	Bril hante co mo u m astro	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Astolf o	", "	Lob o combatente, aquele que co mbate como lobo	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-("	Astor	", "	U ma ave  de rapina	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Astride	", "	Amazon a de lança, amazona proteg ida por d euses. Nome de	", "	Su eco	", "	Extraído de Livro dos Nomes	"),
-("	Astrogi ldo	", "	Brilhante e digno d e sacrifício	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Ataíde	", "	Pai l uta. Derivado do germânico Athanagild	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Átala	", "	Ternura	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Atalanta	", "	Pod eroso suporte. Fem inino de Atlas, o her ói que carr egou o	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Atália	", "	Elevado a Javé ou a bri lhante. Form osa rain ha de Jud á, filha	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Ataliba	", "	Ave de fel icidade. Forma si mplificada do no me Atabal iba,	", "	Quíchua	", "	Extraído de Livro dos Nomes	"),
-("	Átalo	", "	Alegre, divertid o	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Atanagi ldo	", "	V aloroso	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Atanásia	", "	Im ortal	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Atanásio	", "	Aquele qu e não mo rre, o imortal	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Ataualpa	", "	Atahua lpa, a ve da fel icidade, o galo	", "	Quíchua	", "	Extraído de Livro dos Nomes	"),
-("	Ataúlf o	", "	No bre como o lobo, nobre guerr eiro	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-("	Atibaia	", "	Ave sadi a. Nome de cida de de São Pau lo	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Átila	", "	Atta, pai, peq ueno p ai	", "	Gótico	", "	Extraído de Livro dos Nomes	"),
-("	Atlas	", "	Lavar , carregar , sustentador 	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Atos	", "	Intacto, ileso, incólume, livre.  Nome de um  dos Três	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Atreu	", "	Que nad a teme, mi tológico	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Augusta	", "	Nobre, gl orificad a	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Augustin ho	", "	Glorificad o, nobre. Gran de doutor de Igre ja	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Augusto	", "	Augustus,  dignidade m agestática,  sagrado, sub lime	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Aulest e	", "	Re i dos Etruscos,  irmão de Ocno e fundad or de Perúsia, cid ade	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Aura	", "	Sopr o leve, perfum e. Ambiente espiritual qu e envolve cada	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Áurea	", "	Feita ou coberta de our o	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Aurélia	", "	Dourada ou filh a do ouro. Deusa romana da m adrugad a	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Aurelian o	", "	Filh o do ouro	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Aurélio	", "	Úsi l, sol	", "	Etrusco	", "	Extraído de Livro dos Nomes	"),
-("	Aurora	", "	O  romper do dia, ma drugada q ue anu ncia novo dia	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Auspício	", "	Augúrio, pro messa	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Aust ragésilo	", "	Austr + gisa l, brilhante + refé m	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Auto	", "	Auctus,  aumentad o, acresc ido	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Autodemonte	", "	Autode monte, do gre go Automédon: autós: própr io, e	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Autódico	", "	Autód ikos, que te m juris dição própria, indepe ndente 	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Autólico	", "	Autol ycus, do gr ego Autólykos: autós: própr io, lykos: lobos ,	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Avaré	", "	Homem am igo	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Avatí	", "	Herói de um mito indígen a	", "	Guara ni	", "	Extraído de Livro dos Nomes	"),
-("	Avelin o	", "	No me de cidade italiana	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Aviano	", "	Avinus, nome de um  fabul ista latino	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Avito	", "	Avitus, de avô, que vem do avô ou dos ante passad os	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Áxel	", "	Espada, defensor p oderos o	", "	Esca ndinavo	", "	Extraído de Livro dos Nomes	"),
-("	Ayacá	", "	Cesto de vime, taquara	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Ayala	", "	Sen hores de Bisc aia	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-("	Ayoacy	", "	Jovem, mo ça, rapari ga	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Ayra	", "	Sobr inho, filh o do irmão	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Ayrosa	", "	Ai-rosa	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-("	Ayssó	", "	Belo, form oso, lindo	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Azael	", "	Deus v iu	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Azaiel	", "	M inha força é D eus	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Azair	", "	Ricco	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Azaléia	", "	Azálea, seca. Flor que nasc e na terra seca	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Azarias	", "	Aquele q ue o Senhor a judou	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Ázem	", "	Reso luto, decidido	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-("	Azer	", "	Auxílio	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Azeredo	", "	Ázer e sufixo  edo, ou da Galiza, Aceredo. No me p ortuguês de	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Azim	", "	Aziz, caro, estim ado, bem amado	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Aziz	", "	Caro, esti mado, querid o	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-("	Azor	", "	Ajudante	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Bárbrio	", "	Babrius, do gre go Bábri os (ao lado de Babrias)	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Bacela r	", "	De orig em portugues a, lugar ond e se planta m barc elos	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Bach	", "	Padeir o, morador da rib eira	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Bachir	", "	Alviçareiro	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Bachmann	", "	Morador ju nto à ribeira	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Baco	", "	Bacch us, do gr ego Bákchos. Baco (e m gre go Dionísio, o deus de	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Bacuar a	", "	Sábio, ho mem de preparo, inte ligente	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Badi	", "	Badi h, formoso	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-("	Bádui	", "	Beduíno, ho mem do deserto	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Baena	", "	Proce dente de Bae na, Córdova na Espanh a	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-("	Baepeba	", "	O limpo, a clareira, a aberta	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Baepend i	", "	O que q ueres? Que cois a queres ?	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Baeta	", "	Pan o de lã, algodão felp udo	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Bagé	", "	Sozinh o, solidário	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Bagófanes	", "	Bag opha nes, nome de um  persa	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Baiardo	", "	Cabelos ruços	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Baio	", "	Baius, do greg o Baios, um dos companheiros de Ulisses	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Baíra	", "	Deus criador e civiliz ador	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Balaão	", "	Bal aham, sem povo , estrangeiro	", "	Hebreu	", "	Extraído de Livro dos Nomes	"),
-("	Bálacro	", "	Bal acrus, nome de ho mem	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Balbílio	", "	Bal bilius, nome de ho mem	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Balbo	", "	Bal bus, de fala im compre ensível, aqu ele qu e balbucia	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Balboa	", "	Vale bo m	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-("	Balderico	", "	Baldér ic, depois Ba udry, do germânico: baldo: audaci oso,	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Baldin	", "	Audac ioso	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-("	Baldomar	", "	Famoso, brilhante	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Baldomero	", "	Ba ld: audaz, e me ro: famoso, brilahnte	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Balduíno	", "	Bal dwin, amigo ousa do e protetor 	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-("	Baleeiro	", "	Pescador de b aleias	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Bálio	", "	Bál ios, mosqueado  ou fogos o. Nome de u m dos cavalos de	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Baltar	", "	Balth ari, soldado audac ioso	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Bambi	", "	Bambino, menino	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-("	Bambuí	", "	Muito  corrente e sinuos o	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Bandeira	", "	Alcunha da da por Do n Afonso V ao gu erreir o Gonç alves	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Banôbal	", "	Ban o Ba'al, a quem Ba al escuta	", "	Fenício	", "	Extraído de Livro dos Nomes	"),
-("	Baptistela	", "	Diminutivo de Batista	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-("	Baquílides	", "	Bacch ylides, do grego Bakc hylides	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Báquio	", "	Bacchius, do gre go Bákchi os	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Báquis	", "	Bacchis, do greg o Bakchis, nome de m ulher	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Baraquias	", "	Bar akiah, que Deus a benço ou	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Barata	", "	Rixa, desavença. Usado como sobren ome	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-("	Baraúna	", "	Madeir a preta	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Barbac ena	", "	Aquele que tem  muita barba	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Barbácio	", "	Barb atius,  nome de homem	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Barbalho	", "	Barb a de alho	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Bárbar a	", "	Estrange ira, estra nha, que ba lbucia, que gag ueja p or	", "	Greco-l atino	", "	Extraído de Livro dos Nomes	"),
-("	Bárbaro	", "	Barbarus, estrangeiro (que n ão é grego n em ro mano)	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Barbe	", "	Bárbara	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Barbosa	", "	Lugar on de há mu itas árvores com b arba de bo de ou	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Barcas	", "	Fulg or, relâmpago, raio	", "	Fenício	", "	Extraído de Livro dos Nomes	"),
-("	Barcelos	", "	Barca pequena. Sobre nome de famí lias bras ileiras e nome de	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Bárea	", "	Bare a, sobr enome ro mano	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Bariri	", "	Água ag itada, água corr edeir a	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Bark	", "	Bênçã o	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-("	Barleta	", "	Rec ipiente de águ a	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-("	Barnabé	", "	Bar nebu ah, filho da exaltação, filho da co nsolaç ão	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Barrabás	", "	Bara bbas, este do hebraico que, por sua vez , tirou do siríaco	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Barreiros	", "	Lugar de o nde se e xtrai barr o	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Barreto	", "	Sobr enome usa do no Brasi l e deriva  do n ome de várias	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Barry	", "	Lança, arpã o	", "	Irla ndês	", "	Extraído de Livro dos Nomes	"),
-("	Barros	", "	Sobr enome qu e proced e da família do solar d e Barros,  do	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Barroso	", "	Lu gar onde h á muito barro, ou espi nhas no rosto	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Barsine	", "	Barsi ne, nome de mu lher persa	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Bartimeu	", "	Filh o de Timeu	", "	Aram aico	", "	Extraído de Livro dos Nomes	"),
-("	Bartira	", "	Flor . Nome da filha d e Tibiriçá, cacique guainá, casada co m Joã o	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Bartinik	", "	Colmeeiro	", "	Polo nês	", "	Extraído de Livro dos Nomes	"),
-("	Bartolo	", "	Adaptaç ão de Bartolo meu	", "	Italiano, espanho l	", "	Extraído de Livro dos Nomes	"),
-("	Bartolomeu	", "	Bar-T almai, filho fos sulcos	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Baruc	", "	O  abençoa do, o bendito	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Baruel	", "	Bar wel, fabricante de pe neiras, pa diola	", "	Francês, in glês	", "	Extraído de Livro dos Nomes	"),
-("	Basileu	", "	Basileus, rei	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Basilia no	", "	Ch eio de re aleza	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Basílic o	", "	Basi likós, real	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Basilina	", "	Sob erana	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Basílio	", "	Basi leous, régio, real	", "	Grego-l atino	", "	Extraído de Livro dos Nomes	"),
-("	Basilissa	", "	Ra inha	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Bassiano	", "	Bassi anus, do greg o Bassian ós, um dos epítetos de	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Basso	", "	Bassus, sobre nome rom ano	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Bastos	", "	Nome de u m lugar habitado por mu ita ge nte da família	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Batalha	", "	Guerr a, batalha	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Batilde	", "	Boa filha	", "	Angl o-saxônico	", "	Extraído de Livro dos Nomes	"),
-("	Batilo	", "	Bath yllus, do grego Báth yllos, provavelm ente da ra iz bath, que dá	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Bástis o u Bátide	", "	Battis,  mulher de Cós, can atada pel o poeta Filetas	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Batista	", "	Baptista, batiza dor, aquele de b atiza. Sobreno me de São João	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Bato	", "	Battus, do greg o Báttos, fala co nfusa	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Batuel	", "	Ho mem de D eus	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Bauer	", "	Lavrador 	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Baur	", "	Lavrador	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Bauru	", "	Cesto d e frutas	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Bávio	", "	Bavius, mau poeta, ini migo de V irgílio e de H oráci o	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Bayer	", "	Vindo da Baviera	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Beata	", "	Beata,  feminino de b eatus,  feliz, bem-aventurado	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Beato	", "	Beatus, feliz, bem-aventurado	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Beatriz	", "	Beatrix, aquela que faz os outros felizes	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Bebian o	", "No me masculino de Viviana, fada das le ndas eur opéias	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Bébio	", "	Baebius, nome de famí lia ro mana, freqüente mente citada na	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Becker	", "	Padeiro	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Beckmann	", "	Homem da padaria	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Beethoven	", "	O do qu intal das beterrabas	", "	Holandês	", "	Extraído de Livro dos Nomes	"),
-("	Bela	", "	Bel la, linda.Diminutivo de Isabe la., Isabe l	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Belami	", "	Bel-amy, belo a migo. Grafia franc esa Bellamy	", "	Gál ico	", "	Extraído de Livro dos Nomes	"),
-("	Belarmino	", "	Belo Armino. Feminino: Belar mina, Belar minda	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-("	Belchi or	", "	Corrupte la de M elquior , Belquior	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Beleno	", "	Sol ou Apolo. Da mitologia	", "	Escand inavo	", "	Extraído de Livro dos Nomes	"),
-("	Belfort	", "	Bela fortaleza	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Belien o	", "	Bel lienus, nome de homem	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Belina	", "	Persona gem de Molière, feminino de Belin, carn eirinho	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Belisário	", "	Arremess ador de dar dos, guerre iro	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Belito	", "	Bel litus, de bellus, bonito, encantador , elegante	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Bellamy	", "	Bo m am igo	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Belmira	", "	Que tem be la visão	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-("	Belmiro	", "	Afam ado, il ustre	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Belmonte	", "	Bel o monte	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Belo	", "	Bellus, li ndo, bon ito, nome masculino	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Belquis(se)	", "	Balk is, Belk is, derivado de Belka, cid ade e pla nalto da	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-("	Beltrão	", "	Beorhthra m, negro e br ilhante, o corvo  brilhante	", "	An glo-saxão	", "	Extraído de Livro dos Nomes	"),
-("	Belmiry	", "	A carre ira, corrida	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Ben	", "	Ben, filho. Diminutivo  de Benjamin e de Bene dito	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Benedit o	", "	Ben edictus, abenç oado, lo uvado	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Benevenuta	", "	Benevenuta,  benvinda	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-("	Benevenuto	", "	Bem vindo	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-("	Benevides	", "	Abdb en, filho de escravo.  De origem esp anho la da	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Benévola	", "	A que d eseja b em a o utrem	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Ben-Hur	", "	Ben Hur, filho de Hur	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Beni	", "	Béni (ao la do de Ben y e Bén it), abençoado	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Beniamin o	", "	Variaçã o de Benjamin	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-("	Benícia	", "	Muito bondoso	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Beníci o	", "	O  que vai be m	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Benigna	", "	Bon dosa, gentil, grac iosa	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Benita	", "	Ben dita, abenço ada	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-("	Benjamin  ou Benjamim	", "	Bin yamin, filho da m ão di reita, filho da	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Bennato	", "	Bem n ascido	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Beno	", "	Filho d e uma família nobre d a Saxônic a. Padr oeiro da Baviera e	", "	Sa xão	", "	Extraído de Livro dos Nomes	"),
-("	Benoit	", "	Benoni, filh o de minhas tristezas	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Bensabat	", "	Nascido n o sábad o	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Benta	", "	Abenço ada	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Beraldo	", "	O do mador de urso	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Beramim	", "	Parecer 	", "	Guara ni	", "	Extraído de Livro dos Nomes	"),
-("	Berdine	", "	Brilhante, vitoriosa	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Berenice	", "	Benen ike, portadora d e vitória	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Berghman	", "	Mineir o, homem que trabal ha nas m inas, montan hês	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Berilo	", "	Beryllos,  a jóia verde do m ar	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Bermondo	", "	Bermond, do ger mânico: ber: urso, e mu nd: proteção	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Bermudes	", "	Desc ende ntes de Cristóvão  Bermudes, que serviu a	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Bernadete	", "	Bernad ette, diminutivo de Bern arda	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Bernard	", "	Variaçã o de Bernard o	", "	Inglês, francês	", "	Extraído de Livro dos Nomes	"),
-("	Bernarde s	", "	Filho de Bern ardo ou d a família de Bernard o	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Bernardo	", "	Beri nhard, bravo  como u m urso, forte como um urso, um	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-("	Beroso	", "	Beros us, do gr ego Berosos, Beross os, histor iador b abilônico	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Bersabé	", "	Filha do jur amento	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Berta	", "	Perahta, brilhante,  glorioso	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Bertagnol i	", "	Espécie d e bacalhau	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-("	Bertário	", "	Berth o: brilhante, célebre, e harjis: exército	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Bertilda	", "	Guerre ira brilhante	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Bertino	", "	Belo	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Bertold o	", "	Bercht ald, governador br ilhante ou ilustre	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-("	Bertolfo	", "	Berth o: brilhante, célebre, e wulf: lobo	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Bertrando	", "	Bertrand, do ger mânico Ber ht-hramm: b erht: brilhante,	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Besse	", "	For ma red uzida d e Elizabete	", "	Ing lês	", "	Extraído de Livro dos Nomes	"),
-("	Beta	", "	Seg unda l etra do alfabeto gre go	", "	Grego, aramaico	", "	Extraído de Livro dos Nomes	"),
-("	Betânia	", "	Casa do pobr e	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Betenfeld	", "	Ca mpo de beterra bas	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Beth	", "	Cas a. Diminutivo de Elisa beth	", "	Aram aico	", "	Extraído de Livro dos Nomes	"),
-("	Betim	", "	Amarra, freio	", "	Fla mengo	", "	Extraído de Livro dos Nomes	"),
-("	Betsabé	", "	M ãe de Sal omão	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Beverli	", "	Prado do castor 	", "	An glo-saxão	", "	Extraído de Livro dos Nomes	"),
-("	Bezerra	", "	Alcun ha de bezerr o, novilho	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-("	Bianc a	", "	Bra nca, alva	", "	Ger mânico, latim	", "	Extraído de Livro dos Nomes	"),
-("	Bianor	", "	Homem violento	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Bião	", "	Bione, do gre go Bión, no me d e homem	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Biara	", "	Presa d e caça, de guerra	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Bias	", "	Força, potênci a. Um dos sete sáb ios da Grécia, céle bre pel o seu	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Bibáculo	", "	Bibacu lus. Era sobreno me das famílias Furius e Se xtius	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Bebério	", "	Biberius, apelido irôn ico dad o ao imperador Tibério, por caus a	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Bíbula	", "	Bibula, feminino de Bíbu lo	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Bíbul o	", "	Bib ulus, de bi bulus, que beb e bem, qu e é bom bebedor	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Bicha ra	", "Alvíssima, boa-nova", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Bionda	", "	Bionda, loura	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-("	Birigui	", "	Mosquito	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Bismarck	", "	Fronte ira do bis pado	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Bispo	", "	Epi + scopé o, aquele que supp ervisiona, supervisor 	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Bitão	", "	Bitone, do greg o Bíton. Biíton era irmão de Cl éobis e filho de	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Bitencourt	", "	Bethenco urt, terreno das ac elgas	", "	Nor mando	", "	Extraído de Livro dos Nomes	"),
-("	Bítias	", "	Methiah, homem de Deus	", "	Fenício	", "	Extraído de Livro dos Nomes	"),
-("	Bito	", "	Bito	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Bituíto , Bitu ito	", "	Bituitus, rei dos avernos	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Bizas	", "	B yzas, do greg o Byzas	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Blanc k	", "	Bra nco, brilhante	", "	Ger mânico, inglês	", "	Extraído de Livro dos Nomes	"),
-("	Blanda	", "	Agra dável, cari nhosa, am ável	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Blandícia	", "	Meiguice, can dura	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Blandina	", "	Afável, cari nhosa	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Blandino	", "	Afável, carinhoso	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Blando	", "	Blandus, brando, carinhos o, meigo	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Blásio, Brásio	", "	Blas ius, nome do chefe dos Sa lapinos	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Blenda	", "	Enca ntadora, glor iosa	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Bleso	", "	Blaesus, do gre go Blais os, este do a djetivo  blaisós, d e pés	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Bloch	", "	Estrang eiro	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Bloem	", "	Flor 	", "	Hol andês	", "	Extraído de Livro dos Nomes	"),
-("	Blumenau	", "	Campina florida	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Boabdil	", "	Abu'Abd Allah, pai de Abda la, pai do servo de Deus	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-("	Boadcéia	", "	Bou dicea, do céltic o Bodicca, vitória	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Boamorte	", "	Orige m rel igiosa. N. Sra. da Boa Mor te	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Boanerges	", "	Filhos de Zebed eu: Tiago e João; filho do tro vão	", "	Ara meu	", "	Extraído de Livro dos Nomes	"),
-("	Boaventura	", "	Boa sorte	", "	Latim, ital iano	", "	Extraído de Livro dos Nomes	"),
-("	Bocácio	", "	Boccac io, aumentativo  de bocca, boca	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-("	Bocage	", "	Boca ge, bosquezinho. No me d e uma região da Normandia	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Bocaina	", "	Sobr enome, depr essão nu ma serr a	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Bocaiúva	", "	Palmeira	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Bócar	", "	Boccar , nome d e African o	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Boccacio	", "	Bocarra, de boca gr ande	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-("	Bocco	", "	Bocchus e o greco Bókch os, do feníci o Mokh,  sínco pe de mo lek,	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Bocóris	", "	Bocchoris, rei do Eg ito	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Boécio	", "	Boethius, de roi gem grega: bó ethos,  derivado de boethós	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Bogdã	", "	Presente de De us	", "	Esl avo	", "	Extraído de Livro dos Nomes	"),
-("	Boges	", "	Bóges, nome de u ma pers a	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Bogumil	", "	O que ama (mil) a De us (Bogu), amado de D eus	", "	Eslavo	", "	Extraído de Livro dos Nomes	"),
-("	Boguslau	", "Sl au: glória, Bogu: de Deus. Variação Bog uslavo,	", "	Eslavo	", "	Extraído de Livro dos Nomes	"),
-("	Bohn	", "	Que l ida co m feij ão, fava	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Boiardo	", "	Hard: forte,  bogo: como arco	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Bolano	", "	Bolanus, nome de homem	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Boleslau	", "	Slau: gl ória, bol e: maior, ou glória m ais forte	", "	Esl avo	", "	Extraído de Livro dos Nomes	"),
-("	Bolívar	", "	Moin ho da ribe ira	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-("	Bomílcar	", "	Milkar , petição de Milcar	", "	Fenício	", "	Extraído de Livro dos Nomes	"),
-("	Bompeixe	", "	O que vende bo m pe ixe	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Bona	", "	Mensage iro	", "	Céltic o	", "	Extraído de Livro dos Nomes	"),
-("	Bonafide	", "	Boa fé	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Bonami	", "	Bom a migo	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Bonapart e	", "	Boa parte	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-("	Bonar	", "	Bom	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Bonelli	", "	O bondos o, o bo m	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-("	Bonfil ho	", "	Bo m filho	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Bonfim	", "	Senhor do Bo nfim. Orige m religiosa	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Bonifácia	", "	Bo m sem blante	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Bonifácio	", "	Bonifaci us, aquele que faz o bem	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Bonifante	", "	Bom infante	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Bonil ha	", "	Margar ida dos pra dos	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-("	Bonjy	", "	Rio bar ulhento,  rumoroso	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Bony	", "	Di minutivo  de b onita(o)	", "	Inglês	", "	Extraído de Livro dos Nomes	"),
-("	Booz	", "	Bíblic o Booz, de origem he braic a, alvoroço, grande al egria	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Borba	", "	Bor va: fontes,  nasc entes	", "	Celta	", "	Extraído de Livro dos Nomes	"),
-("	Borelli	", "	Do bore llo, al mofa da	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-("	Borges	", "	Proce dente de Bour ges	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Borghi	", "	Do Borgo	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-("	Bóris	", "	Bóris, batal hador , forte gu erreiro, que p ersegu e os tiranos	", "	Eslavo	", "	Extraído de Livro dos Nomes	"),
-("	Borístenes	", "	Bor ysthenes, do grego Bor ysthénes,  em qu e parece e ntrar	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Borja	", "	Desce ndentes do so lar de Borj a em Valença de Aragã o,	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-("	Borromeu	", "	Bom romeiro	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-("	Boscardin i	", "	Morador o u guarda d e bosqu e	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-("	Bosco	", "	Bosq ue	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-("	Boso	", "	Comandante	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Botto	", "	Grosse iro, preguiçoso, que rep ele	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Botucatu	", "	Bons ar es, bom clima ou bom vento	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Boudica	", "	Bou dicca, rainha dos Icenos	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Boyd	", "	Loiro	", "	Céltic o	", "	Extraído de Livro dos Nomes	"),
-("	Boyrá	", "	Colar de contas, jó ias, coisa preci osa	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Bragança	", "	Caste lo, fortal eza, monte. Sobr enome de fa mílias br asileiras	", "	Celta	", "	Extraído de Livro dos Nomes	"),
-("	Braham as	", "	Filho de Abraã o. O mesmo que Abrahams	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Brambila	", "	Amora si lvestre	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-("	Brancaflor	", "	Bla nchefle ur, branca flor	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Branco	", "	Blank, luminoso, brilhante	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Brandão	", "	Brend anus. O co mbate nte. Nome de um santo	", "	Germ ânico, celta	", "	Extraído de Livro dos Nomes	"),
-("	Branderico	", "	Brand: espada e rik: chefe,  príncipe	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Brando	", "	Que tem br andur a	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Branislau	", "	Glóri a (slaw) da g uerra (bran)	", "	Eslavo	", "	Extraído de Livro dos Nomes	"),
-("	Brás	", "	Tocha, tição.Italiano di aleta l Biagio	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Brásilas	", "	Brasílas	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Brasileira	", "	Filh a do Brasil	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Brasiliana	", "	Filha do Bras il	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Brasilian o	", "	Filho do Bras il	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Brasiliense	", "	Natural d o Brasil	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Brasilina	", "	Que diz resp eito ao Brasi l	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Bráuli o	", "	Ra diante, resp landecente	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Brenda	", "	Espad a ou brase iro	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-("	Brener	", "	Carvoeiro, ol eiro, fabrica nte de cal, fabricante de	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Brenna	", "	Corvo	", "	Ídic he	", "	Extraído de Livro dos Nomes	"),
-("	Breno	", "	Dir igente, cabeç a, chefe	", "	Gaulês	", "	Extraído de Livro dos Nomes	"),
-("	Bretas	", "	Rápido com o peixe	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Briana	", "	Variação d e Brenna	", "	Ídic he	", "	Extraído de Livro dos Nomes	"),
-("	Brígida	", "	Guia, elevada, a sub lime, forte	", "	Celta	", "	Extraído de Livro dos Nomes	"),
-("	Brígido	", "	Gui a, pate nte	", "	Céltic o	", "	Extraído de Livro dos Nomes	"),
-("	Briseu	", "	Brisé us. Pai de Briseis. Era sum o-sacer dote de Júp iter em	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Bríson	", "	Bryson, nome de homem	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Britald o	", "Bret: bri, britânico, e weald: forte	", "	Céltico	", "	Extraído de Livro dos Nomes	"),
-("	Brites	", "	Sensata	", "	Angl o-saxão	", "	Extraído de Livro dos Nomes	"),
-("	Brizola	", "	Grisal ho	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-("	Brochado	", "	Fabricante ou n egoci ante de cântaros, v asos	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Brogítaro	", "	Brogitarus, genr o de Dejótaro,  rei da Galáci a (Ásia Menor)	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Bronberg	", "	Mon ta de a moras silvestres	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Bronislav a	", "	Predestina da à glór ia	", "	Esl avo	", "	Extraído de Livro dos Nomes	"),
-("	Brossa rd	", "	Fabricante de esc ovas	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Brotto	", "	Bruto, feio	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-("	Brown	", "	Moreno	", "	Ing lês	", "	Extraído de Livro dos Nomes	"),
-("	Bruce	", "	Procede nte de Braose, hoje Bri euse	", "	Frnacês	", "	Extraído de Livro dos Nomes	"),
-("	Bruna	", "	Escur o, pardo	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Brunilda	", "	Brun i-childis, guerre ira arm ada ou guerre ira com	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Bruno	", "	Escuro, pard o	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-("	Brunsw ick	", "	Lug ar escuro	", "	Inglês	", "	Extraído de Livro dos Nomes	"),
-("	Brunulda	", "	A que combate proteg ida por u ma co uraça	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Bruto	", "	Brutus - Pesa dão, molerão, bronco, acanh ado	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Buda	", "	Budd hás, o esperto,  o desperto	", "	Sânscrito	", "	Extraído de Livro dos Nomes	"),
-("	Budant	", "	Alcunh a de pesso a gorda, fabrica nte ou vende dor de frios	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Budeu	", "	Bud é, nome de um célebre humanista (1 467-1 540)	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Bueno	", "	Bom	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-("	Bulbáquer	", "	Abú bakr , pai da menina (virgem)	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Bulhões	", "	Sobr enome de fa mílias br asileiras, deriva da cidade de	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Búpalo	", "	Bupalus, célebre escu ltor grego, de Quil os	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Burcardo	", "	Burkhard: burk, burgo, hard, forte	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Burchardo	", "	Burch ard, o mesmo q ue Burcard o	", "	Ale mão	", "	Extraído de Livro dos Nomes	"),
-("	Burgos	", "	Vindo de Burgos, cida de espa nhola. Árvore da vida, na	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-("	Buriti	", "	Nome de u ma p almeira, coqueiro	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Burnier	", "	Morador e m cab ana de pastor 	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Burton	", "	Burhton, habitante d e cidade fortifica da	", "	An glo-saxão	", "	Extraído de Livro dos Nomes	"),
-("	Busíris	", "	Busiris, do greg o Bousir is. Nome de um rei len dário d o Egito, e	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Busmeyer	", "	Barque iro de pesca	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Bust amante	", "	Procede d e Juan Sánch ez de Bustam ante	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-("	Bute s	", "	Butes, nome de ho mem	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Byuron	", "	V aqueiro	", "	Angl o-saxão	", "	Extraído de Livro dos Nomes	"),
-("	Caápuã	", "	Capão de mat o, morador do ma to	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Caapotyraguá	", "	Flor do vale, da ma ta	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Caássyca	", "	Nome de uma pla nta resinosa, oleosa	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Caátia	", "	Planta qu e segrega u m suco l ácteo	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cabayba	", "	Vespa ruim, venenos a	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cabral	", "	Lugar on de há cabr as	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Cabreira	", "	Topônimo de Galiza	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Cabuçu	", "	Vespa gra nde	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Caçapav a	", "	Travessia do mat o	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cáceres	", "	Castris, acampamento militar	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cacilda	", "	Gail + hi lt, lanç a de combate	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Caco	", "	Cac us, do gr ego Kakos, de kaío, queimar	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Caetano	", "	Gaetanum , natural de Gaeta	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-("	Caeté	", "	Mata verdadeira	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Caetet é	", "	Mata verdade ira, mata m uito densa	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cahy	", "	Macaco	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Caia	", "	Ca ia, nome de mu lher	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Caiado	", "	Usar tinturas p ara parec er alvo, caiar o rosto	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Caiçuara	", "	O que am a, o amante	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Caifás	", "	Kaifá, baixeza, hu milhação	", "	Sir o-cald aico	", "	Extraído de Livro dos Nomes	"),
-("	Caim	", "	Cain, adq uirido, possuído. Primeiro fil ho de Adão e E va e que	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Cainã	", "	Morador do ma to	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cainana	", "	Mulher ado idada, enfurecid a	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Caio	", "	Gaius, feliz, contente,  alegre	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cairé	", "	Auxiliar de Ru dá (Deus d o mar), lu a cheia	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cairu	", "	Árvore d e folha escura	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Caiuá	", "	Morador do ma to	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Caiubi	", "	Folh as azuis	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cajary	", "	Rio do cajá	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cajati	", "	Árvore gr ande	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cajuru	", "	Boca d o mato, entrad a do mato	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Calado	", "	Sil encioso, tacitur no	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Calandra	", "	A coto via	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Calanta	", "	Form osa flor 	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Calazanz	", "	Abrig o santo	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-("	Caldas	", "	Águ as termais	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Caldeira	", "	Caldereiro, traba lhar co m um a cal deira	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Caleb	", "	Cão	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Calhamar es	", "	Canhameiral, lugar on de há cânh amo	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Calheiros	", "	O  que trabal ha com calha	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Cali	", "	Kali, negra. Nome de um a deus a da Índia	", "	Sânscrito	", "	Extraído de Livro dos Nomes	"),
-("	Calidora	", "	Dádiva formosa	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Calígula	", "	Borzegu im, boti na, sapato de mi litar	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Calímaco	", "	Kal límachos, o que com bate be m, be lo combatente	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Calimero	", "	Kal límeros:  hemére a: dia, kálos: belo", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Calina	", "	Espirituos a	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Calinico	", "	Callinicus, do grego Kal línikos: ka lós: belo, nike: vi tória", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Calino	", "	Espirituos o	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Calíope	", "	Bon ita voz. Musa  da e loqüência e da poesia heróic a	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Calipso	", "	Kal ypsó, aquela que encobre. Nome da ni nfa que deteve	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Calistene	", "	Bel eza e força	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Calístenes	", "	Força bel a, belo e forte	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Calisto	", "	Homem muito be lo	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Calistrato	", "	Que com anda	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Calixto	", "	Kalistos, belíssi mo	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Calógeras	", "	O  que tem u ma b oa velhice	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Calógero	", "	Kols +  gheron, be lo velho	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Calpúrnio	", "	Calpurnius, nome de uma família rom ana	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Calvin o	", "	Ca lvino, o calvo	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Cam	", "	Cha m, quente, por ex tensão, queimado pelo sol, negro	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Camacho	", "	Descend entes de um a famíl ia francesa q ue conqu istou	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-("	Camapuã	", "	Seio red ondo, em pinado, col ina arre dond ada em  form a de	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Câmara	", "	Homem da câ mara. Sobr enome de fa mílias br asileiras	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Camarão	", "	Traduçã o do tupi Poti. Nome de u m crustáceo	", "	Bras ileiro	", "	Extraído de Livro dos Nomes	"),
-("	Cambaúba	", "	Nome d eu ma árvore	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cambuci	", "	Cas o de águ a	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cambuq uira	", "	Planta brotada	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Camby	", "	Líqu ido do pe ito, leite	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cambyç ara	", "	Ama, m ulher que a mamenta	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Camélia	", "	No me de uma flor	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Camila	", "	Ca milla, jovem  criada, atend ente de ceri monial	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Camilo	", "	De Ca milla, jovem aten dente de cer imônia	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Caminha	", "	Sobren ome que surg iu na Galícia	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-("	Caminh oá	", "	O peitinho liso	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Camirim	", "	Folh inha, pl antinh a	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Camocim	", "	Vaso de á gua	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Camões	", "	Camonius. Há ainda do gal ego Cá mos, ou ár abe Ca muesa,	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Campelo	", "	Campo	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Campesina	", "	Que v ive no ca mpo ou na zona rur al	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Campesino	", "	Que vi ve no cam po ou n a zona rural	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Campos	", "	Ca mpos dos godos	", "	Gótico	", "	Extraído de Livro dos Nomes	"),
-("	Camury	", "	Peixe,  nome do roba lo	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Canabarro	", "	Canabarro, vasilh a de beber vinho	", "	Anti go portugu ês	", "	Extraído de Livro dos Nomes	"),
-("	Canace	", "	Canac e, do gr ego Kan áke, filha de Éol o	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Canará	", "	Planta que se asse melha a cana	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cancian o	", "	Ca ntianus, der ivado de C antius	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Câncio	", "	Canto, encanto	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cândace	", "	Kan dáke, provavelm ente do etíope, pois é no me de uma	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Candal	", "	Pedra	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Candéa	", "	Perfeito,  limpo, bon ito	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cândida	", "	Fem inino de Câ ndido	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Cândido	", "	Candidus, puro, inoc ente	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Canedo	", "	Kanetu, tem perad o, prudente	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-("	Canet	", "	Ca navial	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Canguçu	", "	Cabelo gran de	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Canídia	", "	Ca nidia, nome de um a feitice ira	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Canindé	", "	Arara d e belas p enas azu is escuras	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cantidiano	", "	Cantid ianus, no me d e um mártir natur al do Egito	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cantídio	", "	Cantid ius, ou do etrusco Ca ntini, significado i gnora do. Santo	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cantílio	", "	Cantílius, secretári o de um  pontífice,  açoitado até mo rrer	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Canut o	", "	Knutr, de raça, de descen dênc ia comprovada	", "	Esca ndinavo	", "	Extraído de Livro dos Nomes	"),
-("	Caoby	", "	Folh a azul, o anil	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Capanema	", "	Mato que n áo presta, mato se m caça	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Capela	", "	Lugar in iciado por um a cap ela	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Capitolino	", "	Glorioso, do Ca pitólio	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Capitu	", "	Caapitu, nome de um a pla nta da flora brasi leira. Perso nage m de	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Capivari	", "	Rio das ca pivaras	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Capotyra	", "	Flor silvestre, flor do cam po, flor do mat o	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Caput o	", "	Sabido, esperto	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-("	Caraça	", "	Aque le que tinh a uma cara gran de	", "	Portug uês antig o	", "	Extraído de Livro dos Nomes	"),
-("	Caracala	", "	Car acalla, de origem ga ulesa, manto com ca puz", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Caraguatá	", "	Planta espinhosa qu e produz frutos amarelos em cac hos	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Caraguatatuba	", "	Mato de gravatás	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Caraí	", "	Espéc ie de ma cacos	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Carampã	", "	Curvado, arcado	", "	Guara ni	", "	Extraído de Livro dos Nomes	"),
-("	Carayba	", "	Anjo da guar da	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cardenas	", "	De cárde no, referente à planta cardo	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-("	Cardim	", "	Jard im, horta	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Cardoso	", "	Terreno abu ndante e m card os	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Caribé	", "	Alimento prep arado co m po lpa de a bacate	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Caricléia	", "	Ch aríkleia, ilustre pe la sua graça ", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Caridade	", "	Car itas, de si gnific ado liter al	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Carijó	", "	Desc ende nte de branco	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Carina	", "	Querida	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-("	Carinhan ha	", "	Rio qu e corre rápi do	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Carino	", "	Carinus, diminutivo de carus, querido, caro, estimado	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Carioca	", "	Casa de br anco	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Carísio	", "	Charis ius, do greg o Charísios, que tem ou que dá graça", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cariri	", "	Pacífico, taciturn o	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cárita	", "	Caridade	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Caritina	", "	Caridade, graça	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Carlberg	", "	M onte de Car los	", "	Suíço	", "	Extraído de Livro dos Nomes	"),
-("	Carlo	", "	Variação de Ca rlos	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-("	Carlomano	", "Karl: Carlos, e mann: homem", "	Ale mão	", "	Extraído de Livro dos Nomes	"),
-("	Carlos	", "	Kart;  fazen deiro	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-("	Carlota	", "	Ch arlotte	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Carloto	", "	Karlot,  nome do filho d e Carlos Magno	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Carma	", "	Destino	", "	Sâ nscrito	", "	Extraído de Livro dos Nomes	"),
-("	Carmela	", "	Kar mel, jardim, jard im de Deus, jard im divino	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-("	Carmelo	", "	Karm el, jard im ou vinha de Deus	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Carmem	", "	Poema	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cármen	", "	Carmen, poe ma	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cármine	", "	Car mine, o mesmo que Car men	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-("	Carmo	", "	Karm el, vinha de Deus, jar dim de Deus. O  mesmo q ue	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-("	Carmona	", "	Topônimo	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-("	Carneiro	", "	Primitivamente era alcunha	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Carnev ali	", "	Nascido no carnaval	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-("	Caro	", "	Queri do	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Carola	", "	Carola, hi pocorístico de Car olina	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-("	Caron	", "	Cabeça rasp ada	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-("	Carreiro	", "	Que trabal ha ou faz carro	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Carriel	", "	Bolsa de co uro	", "	Híspan o-am ericano	", "	Extraído de Livro dos Nomes	"),
-("	Carrilho	", "	Parte carnosa do rosto	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-("	Caruana	", "	Na mitologia in dígena, gên io que h abitava  o fund o dos rios	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Caruso	", "	Cabeç a raspad a	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-("	Carvajal	", "	Lugar d e muitos carvalhos	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-("	Carvalho	", "	Árvore da famí lia das Fagác eas	", "	Esp anho l, portu guês	", "	Extraído de Livro dos Nomes	"),
-("	Casadei	", "	Cas a de Deus	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Casagr ande	", "	Cas a grande	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-("	Cascudo	", "	Ho mem grosseiro	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Casimiro	", "	Kazatimiru, com anda a paz	", "	Esl avo	", "	Extraído de Livro dos Nomes	"),
-("	Cásper	", "	O  que fiscaliz a	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Cassandra	", "	Kassandr a, auxili ar do homem	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Cassandro	", "	Ho mem distinto, homem que se disti ngue	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Cássia	", "	Nome de u ma pl anta	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cassiana	", "	Descen dente de Cáss io, filha de C ássio	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cassiano	", "	Muito  eqüitativo 	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Cassilda	", "	Guerr eira de l ança	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Cássio	", "	Disti nto, ilustrado	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Cassiod oro	", "	Cass iodor us, do grego Kassi ódoros. Der ivado d e Cássio	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Castanheda	", "	Lugar das castanh eiras	", "	Astúri o	", "	Extraído de Livro dos Nomes	"),
-("	Castela r	", "	Do caste lo, também nome de pl anta	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-("	Castilh o	", "	Castillo, castel o, castel o fortifica do	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-("	Casto	", "	Ho nesto,  puro	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Castor	", "	O que se destac a, distinto.  Irmão de Pó lux	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Castro	", "	Castelo, fortaleza, forte	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cataia	", "	Erva medicinal, folha qu e queima	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cataldo	", "	Que governa a guerra	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Catalina	", "	Pura. Em portug uês e espan hol, o me smo que Catar ina	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Cataline	", "	Puritana	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Catão	", "	Cato, Caton is, provavelm ente do sabi no catus,  agud o, sagaz,	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Catanduva	", "	Mato ralo	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Catão	", "	Circ unspecto	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Catarina	", "	Kátharos, pur o	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Catulo	", "	Astuto, sagaz	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Cátulo	", "	Catu lus, filhote de animalcãozinho	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Catumbi	", "	O mato verde	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Catyba	", "	Mata cerrada, espess a	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cavalheiro	", "	Genti l, galante ador	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Caxangá	", "	Mato estendido	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cayari	", "	Rio dos cajás	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Ceci	", "	Minha m ãe. No me de mulher	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cecília	", "	Caecilia, de ceg o	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cecrope	", "	Cecr ope, do greg o Kécrops, o primeiro rei de Atenas	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Céculo	", "	Caecu lus, diminutivo de caecus, de olhos pequeninos	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cedric	", "	Chefe gu erreir o	", "	Céltico	", "	Extraído de Livro dos Nomes	"),
-("	Cefas	", "	Cephas, este do ara maico Kép hâs, rocha, pedra	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cegytar a	", "	O carreg ador, o que faz transp orte	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Célado n	", "	Ce ladon, do grego Kél adon, de Ké lados, grito, chamado	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Celena	", "	U ma das ir mãs de Atlas	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Celeste	", "	Caelestis,  do céu, celeste,  divina	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Celerino	", "	Celerinus, célere, rápido	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Célia	", "	Celesti al, celeste. Anagrama do n ome Alice, ou do greg o Aleth ia, a	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Célico	", "	Próprio o u natural do cé u	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Celidônio	", "	Chelidónios, de chel idón, andorinha	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Celimena	", "	Cé limère, criaç ão de M olière no Misantropo	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Celina	", "	Filha do céu; di minutivo  de Célia	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Celínia	", "	Filh a do céu; variaçã o de Célia	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Celino	", "	Filho do céu; di minutivo  de Célio	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Célio	", "	No me de uma das sete colinas de Ro ma	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Celosia	", "	Flor que nasce	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Celso	", "	Alto, elevado	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cendi	", "	A luz	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cendira	", "	Irmã	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cendyi	", "	Luz, claridade	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cerayma	", "	Sem no me, não b atizado, pag ão	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cereal	", "	Cerealis, de Ceres, a deus a das cearas, da agr icultura	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cerqueira	", "	Cervo,  muitos cervos.  Sobr enome de fa mílias brasileiras	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	César	", "	Ca esar, de cab eleira lon ga	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Casária	", "	Ca esaria, der ivado d e Caesar 	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Cesarino	", "	Ca esarin us, derivado de César	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Césio	", "	Caesius, de caesius, esverdeado	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cesira	", "	Koisyra, pomposa	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Cesônia	", "	Caeso nia, no me da es posa de Ca lígula	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Casôni o	", "	Ca esoni us, nome de famíl ia rom ana	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Ceuci	", "	Mãe  do pranto	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Chaga s	", "	De orig em religiosa, e vocaç ão das chag as de Cristo	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-("	Chamberlain	", "	Camareiro	", "	Inglês	", "	Extraído de Livro dos Nomes	"),
-("	Chape có	", "	Caminho tril hado freq üente mente	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Chara	", "	Alegre	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Charlotta	", "	(Sueco) - Car lota	", "	Sueco	", "	Extraído de Livro dos Nomes	"),
-("	Charlotte	", "	Carlota	", "	Inglês, francês	", "	Extraído de Livro dos Nomes	"),
-("	Chaves	", "	Der ivado d e uma cidade de Portuga l	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Chede	", "	Dád iva de De us	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-("	Chermont	", "	Que pr ocura mo nte	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Chiar a	", "	Cl ara	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Childerico	", "	C hilde, hilde: combate, e rik: príncip e", "príncip e	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-("	Chiqu ita	", "	Meni ninha	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-("	Christine	", "	Cristin a	", "	Inglês, Francês	", "	Extraído de Livro dos Nomes	"),
-("	Churi	", "	Ema	", "	Guara ni	", "	Extraído de Livro dos Nomes	"),
-("	Ciaxares	", "	K yaxáres,  nome de um rei dos M edos	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Cibele	", "	A Gran de Mãe dos De uses. É a gra nde deus a da Frígia	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Cícero	", "	Cic ero, grão de bic o	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Cicno	", "	C ycnus,  do gr ego K yknos , cisne	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Cid	", "	Seid, senhor . Nome do her ói espa nhol El C id	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-("	Cimon	", "	Ci mone, do greg o Kimon, negro, pardo, sombrio	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Cinar a	", "	Alcachofra, cardo	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Cincinato	", "	Que te m cabe lo encar acola do ou cach eado	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cinderela	", "	Dedrillon, garota do borralho	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Cinders	", "	Variação d e Cinderela	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-("	Cinira	", "	Lira que se toca va no tem plo de Jerusa lém; q ue geme,	", "	Hebr aico, greg o	", "	Extraído de Livro dos Nomes	"),
-("	Cíniras	", "	Cinyras, do gre go Kin yras, rei d e Chipre, pai de Adônis	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cinosura	", "	Cynosura,  do gr ego K ynóura:  kyon, cão, e ourá, cauda	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cíntia	", "	Cynthia, natura l de Cinto. Um  dos no mes da d eusa Di ana	", "	Latim, gre go	", "	Extraído de Livro dos Nomes	"),
-("	Cintra	", "	Os  Celtas davam a lu a o nome de C YNTHIA , e desta palavra é	", "	Celta	", "	Extraído de Livro dos Nomes	"),
-("	Cipião	", "	Scipio, Scip ionis, bastão	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cipoú na	", "	Cipó preto	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-("	Cipriano	", "	Cyprius, natura l de Ch ipre, cipriota	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cípselo	", "	C ypselus, do greg o Kypselos, um  tirano d e Corinto, pai d e	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Cirano	", "	Kyrene, de Cire ne, cidade da Cirenaica n o norte da África	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Circe	", "	Filha do so l. Perso nage m da Odiss éia de H omero	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Cirene	", "	Kire ne, de Cirene, ninfa raptada p or Apolo e levada para o	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Cireneu	", "	Natural d e Cirene. Simão nasceu e m Cirene, mo rava em	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Cirênia	", "	Derivado de C yrenaeus, natural da cidade de Cirene	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cirênio	", "	Masculino d e Cirênia	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Ciríaco	", "	Homem do Senh or	", "	Grego, latim	", "	Extraído de Livro dos Nomes	"),
-("	Cirilo	", "	K yrillos, de ple na autori dade	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Cirino	", "	Quiri nus	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Cirne	", "	O  cisneiro, criador de cisn es	", "	Português	", "	Extraído de Livro dos Nomes	"),
-("	Ciro	", "	Kur ush, o So l, deus do Sol	", "	Antigo pers a	", "	Extraído de Livro dos Nomes	"),
-("	Clair e	", "	Cl ara	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Clara	", "	Clara, bri lhante, il ustre	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Clarêncio	", "	Ilustrado	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Claret	", "	Clarinho, di minutivo de cl aro	", "	Catal ão	", "	Extraído de Livro dos Nomes	"),
-("	Clarice	", "	Cl aridade	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Clarimun do	", "	Clara proteç ão, proteção da la nça	", "	Lati m, germânico	", "	Extraído de Livro dos Nomes	"),
-("	Clarinda	", "	Diminutivo de Cl ara	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Clark	", "	Cl érigo, em pregado	", "	Inglês	", "	Extraído de Livro dos Nomes	"),
-("	Claro	", "	Clarus, claro, brilhante	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Claudete	", "	De Clá udio, diminutivo  de Cláudia	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Cláudia	", "	Fem inino de Cl áudio	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Claudinete	", "	Cl audinette,  diminutivo de Claudine	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-("	Cláudio	", "	Claudius, o co xo, o manco	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Claudio nor	", "	Aquele que ho nra Cláudio. Ou fusão de Cláudio e Leonor 	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Clayton	", "	Aldeia barrenta	", "	Inglês	", "	Extraído de Livro dos Nomes	"),
-("	Cleandro	", "	Kleandros: kléos: gl ória, e anér: andr ós homem", "ho mem	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Cleanto	", "	Flor da glória	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Clearco	", "	Cl earchus, do gre go Kléarc hos: kléos: glória, e árcho:	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Clebe r	", "	Padeir o	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-("	Cléia	", "	Formosa e também n obre	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Clélia	", "	Cloelia, fam osa, ilustre, nobr e	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-("	Clélio	", "	Glor ioso, filho d e cliente	", "	Grego, latim	", "	Extraído de Livro dos Nomes	"),
-("	Clemência	", "	Cl emência, bondade, clemência, suavidade	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Clemente	", "	Cl ementis, gentil, bondoso	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Cléo	", "	Cleo, gl ória, fam a	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Cleóbul o	", "	Cl eobu lus, do greg o Kleóbulos: kléos: glória, e bou lé:	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Cleodoro	", "	Dádiva gloriosa	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Cleófa s	", "	Bril hante de gl ória	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Cleóm aco	", "	Cl eomachus, do gr ego Kló machos: kléos: glória, e má che:	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Cleômbroto	", "	Cl eombrotus, do gre go KLeóbr otos:  kléos: glór ia, e brotós:	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-("	Cleom ênia	", "	Lua gl oriosa	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Cleon	", "	Fam a, glória	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Cleonice	", "	V itória gloriosa	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Cleônides	", "	Feiçã o que den uncia g lória	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-("	Cleópatr a	", "	Cl eopatra, il ustre por seu pai, gl ória de seu p ai	", "	Grego	", "	Extraído de Livro dos Nomes	")
-# # ("	Cleoptólemo	", "	Kleoptó lemo: kléos: glória, e ptóle mos: guerra": "g uerra	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Cleto	", "	Chamado, eleito	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Cléver	", "	Taipeiro	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Clície	", "	Famosa, célebre	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Clíma co	", "	Escada do céu	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Clímene	", "	Clymen e, do gr ego Kl yméne,  célebre	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Climênia	", "	Klymene, renovada	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Clíni o	", "	Kle inías, celebridade, fama	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Clístene s	", "	No me de um político ateni ense	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Clitar co	", "	Kleítarchos: kleitós: famoso, e arch: raiz de árcho, governar	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Clítia	", "	O  girassol	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Clito	", "	Ilustre	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Clitômaco	", "	Clitomachus, do grego Ke itómachos: kl eitós:  famoso,	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Clódi o	", "	Clodius, form a pop ular de C laudius	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Clodoal do	", "	Gran de chefe	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Clodomiro	", "	Famoso, de gr ande fam a	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Clodorico	", "	Muito  famoso	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Clodovico	", "	Chiodowig, guerre iro famoso	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Clodu lfo	", "	Hlodwolf , lobo afam ado	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Cloe	", "	A verdeja nte	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Clorinda	", "	Chloris, deusa gre ga das flores	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Clóris	", "	Verde claro, deusa d as flores	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Clotária	", "	Derivada de Lotár io	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Cloro	", "	Ch lorus, do greg o Chlrós, verde, amarelo claro	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Clotário	", "	Hlodohari: hlot: fama, e gót: harjs exército ", "afamado	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Clotil de	", "	Chlodhilde, afamada no co mbate	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Clóvis	", "	Chlodowig, guerre iro famoso	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Cluêncio	", "	Cluentis, derivado de cluere, ser chamado, il ustrar-se	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Clyde	", "	Purific ado, limpo	", "	Escocês	", "	Extraído de Livro dos Nomes	"),
-# ("	Cneu	", "	Cnaeus ou Cneus. Variação Gneu	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Coaraci	", "	Co-ara-c y, a mã e do di a, o So l	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Coaraciaba	", "	Cabelos do Sol, loira	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Coaracyraá	", "	Muito  Sol, verão,  verme lho	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Coceio	", "	Coccei us, nome de um  amigo d e Augusto e de Horáci o	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Codomano	", "	Codomannus, no me de prínc ipe pers a que subi u ao trono	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Coelho	", "	Sobr enome freqü ente no Brasil e e m Portug al	", "	Português	", "	Extraído de Livro dos Nomes	"),
-# ("	Coema	", "	Manhã, primeira parte do dia	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Coembiyá	", "	Estre la D'Alva	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Coemitã	", "	Auror a, manhã vermelha	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Cohen	", "	Sac erdote	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Côiguara	", "	Morador da roça, roceir o	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Coimbra	", "	Caste lo, fortal eza	", "	Celta	", "	Extraído de Livro dos Nomes	"),
-# ("	Colaço	", "	O  que foi criado com o le ite da me sma mu lher	", "	Português	", "	Extraído de Livro dos Nomes	"),
-# ("	Colar es	", "	Outeiro	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-# ("	Colatina	", "	Co llatinus, habitante da C olácia. Deusa das co linas	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Colatino	", "	Que vi ve de coleta	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Colberto	", "	Marinhe iro bril hante, elmo que brilha	", "	Ing lês, germânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Coleta	", "	Colette, abreviatura de Nic olette,  derivado de Nico le ou	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Colomano	", "	Significand o bibliógrafo	", "	Hún garo	", "	Extraído de Livro dos Nomes	"),
-# ("	Colomba	", "	Co lumbus, po mbo, pomba	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Colombe	", "	Co lomba	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Colombi na	", "	Pomba	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Colombi no	", "	Co lumbinus, pombinho	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Colombo	", "	Columbus, pombo, pomba	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Columba	", "	Colomba	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-# ("	Cômodo	", "	Co mmodus, cômodo, benévolo, agradável	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Conceiç ão	", "	Conce ptio, concepçã o	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Concórdia	", "	Har monia	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Concórdio	", "	Concor dius, derivado de conc ors, concordis, co ncorde, que	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Confúcio	", "	Kung-fu-tsé, filósofo e mo ralista chinês	", "	Chi nês	", "	Extraído de Livro dos Nomes	"),
-# ("	Coniã	", "	Re i dos festins guerre iros	", "	Timbiras	", "	Extraído de Livro dos Nomes	"),
-# ("	Conrado	", "	Kuora et, conse lheiro prud ente	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Consolação	", "	Co nsolativo,  associad o a Nossa Senh ora da Co nsolaç ão	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Consolació n	", "	Consolação	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-# ("	Constância	", "	Constanti a, constâ ncia, firmeza	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Constanciano	", "	Co nstantian us, derivado d e constans, constantis,	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Constâncio	", "	De fir me caráter 	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Constantino	", "	Constanti nus, constante,  firme	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Consuelo	", "	Consuelo, conso lo	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-# ("	Contardo	", "	Gundhard: hard: forte, gund: no combate, na batalha 	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Cora	", "	Kore, a criad a, a virgem	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Corália	", "	Virgem dos m ares	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Coralina	", "	Car allina, derivado do gre go Korál lion, coral	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Corbinian o	", "	Cor binien, derivado de corb in, nome de ave aparentada	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Cordeiro	", "	No me de animal	", "	Português	", "	Extraído de Livro dos Nomes	"),
-# ("	Cordélia	", "	Do lat im Corde, do coraçã o	", "	Celta	", "	Extraído de Livro dos Nomes	"),
-# ("	Cordo	", "	Cor dus,pren ome romano	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Cordovil	", "	Couro de Córdoba, da cidade de Córd oba	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-# ("	Córdula	", "	Cor , cordis, coração	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Coré	", "	Calvície	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Cori	", "	Pinheiro	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Corimbaba	", "	Valente,  corajoso	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Coriolano	", "	Coriolanu, de C oriolos, da cidade de Coriolos	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Corissa	", "	Cor issa, a criada do nzela	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Cornélio	", "	Cornelius. De corn u, corn o, chifre, para signific ar duro co mo	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Cornuto	", "	Cor nutus,  de cornutus, chifruo	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Correia	", "	Lu gar onde h á corriol as, correias	", "	Português	", "	Extraído de Livro dos Nomes	"),
-# ("	Cortere al	", "	Ho mem da corte	", "	Português	", "	Extraído de Livro dos Nomes	"),
-# ("	Coruncânio	", "	Corunc anius, no me d o primeiro pontífice plebeu	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Cósimo	", "	Cos imo, o mesmo que Cos me	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Cosme	", "	Kosmos, mundo, harmonia, universo. V ariação de Cos mo	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Cosmo	", "	Kosmos, mundo, universo	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Cost a	", "	Costa, lad o, flanco	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Cost anza	", "	Constânc ia	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Cotrim	", "	Do interior 	", "	Ing lês	", "	Extraído de Livro dos Nomes	"),
-# ("	Couto	", "	Terra coutad a, privilegiada, defesa	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-# ("	Cramer	", "	Ne gocia nte, comerc iante	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Cranau	", "	Cra naus, do greg o Kranaós, de kran aós, duro, áspero ", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Crasso	", "	Crassus, gordo, gra nde	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Cratão	", "	Crato, Cratonis, do greg o Kráton,  vigor	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Crátero	", "	Craterus, nome de u m cél ebre mé dico	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Crates	", "	Crates, do gre go Krátes,  da ra iz de krátos,  "forç a"	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Crátilo	", "	Krátylos, da raiz de krátos, força	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Craveiro	", "	Lu gar onde h á cravos (flores)	", "	Português	", "	Extraído de Livro dos Nomes	"),
-# ("	Crecência	", "	Cre issant,  criar, aumentar	", "	Antigo francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Cremes	", "	Chr emes, do grego Ch rémes, tossir, ascarr ar	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Cremilda	", "	A que co mbate com ca pacete	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Crescêncio	", "	Crescente	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Crescente	", "	Cresc ente,  de crescente, "que cresc e"	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Crescenti no	", "	Cresc entinus, di minutivo  de Cr escente	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Crescenzia	", "	Cresc ência	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Crescenzi o	", "	Crescênc io	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Creso	", "	Último rei d a Gréci a	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Crespi	", "	O de cab elos cresp os	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Creusa	", "	Rainha, princes a	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Crisântemo	", "	Chr isanthos, flor de folh as dourad as	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Crisanto	", "	Chrysanthus,  do gr ego Chr ysánthas: chysós: ouro, e anthos:	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Crisip o	", "	Chr ysippus, do gre go Chr ysippos: chr ysós: ouro, e hípp os:	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Crisóg ono	", "	Gera do do our o, raiz d o ouro	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Crisól ito	", "	Pedra de our o	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Crisóstomo	", "	Boca de ouro	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Crispim	", "	Cris pus, de cabelo encresp ado	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Crispi na	", "	Crispina, crespo	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Crispi no	", "	Crispinus, "o que te m os cabe los crespos "	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Crispo	", "	Crispus, de cris pus, "que tem  cabelos crespos "	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Críspu lo	", "	Crispu lus, "frisado"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Cristália	", "	Bril hante co mo cristal, clar a	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Cristin o	", "	Un gido d o Senhor 	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Cristo	", "	Christôs, ungido com  o óleo sagrado	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Cristod oro	", "	Chr istódoros, "pr esente, dádiva de Deus "	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Cristóforo	", "	O que l eva Cristo cons igo, o que levou Cristo no o mbro	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Cristóvão	", "	Chr istophor os, o porta dor de Cristo	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Crítias	", "	Cr iitias, do gre go Kritías,  "separar , julgar"	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Critolau	", "	Crito laus, do greg o Kritólaos, kr itós: esco lhido, eleito, e laós:	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Críton	", "	Crito ne, do grego Kríton, derivado de Kritós, "eleito"	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Cruz	", "	Refere-se à cruz de Cr isto	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-# ("	Cubas	", "	V asilha, pipa	", "	Português	", "	Extraído de Livro dos Nomes	"),
-# ("	Cuiabá	", "	Farin heiro, o ho mem qu e faz farin ha	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Cumari	", "	Pimenta	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Cunegun da, Cunegun des	", "	"g unde: gu erreira, e kuni: de estirp e"	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Cunha	", "	Rocha em  form a de cunha	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-# ("	Cunhambebe	", "	Língua qu e corre rasteira, que fal a mansamente, devagar 	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Cupelo	", "	Colméia	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Cúrcio	", "	Vindo do Lago C úrcio	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Curi	", "	Cura, traduz ido tam bém com o padr e	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-# ("	Curiácio	", "	Curiati us, nome de um  orador ro mano	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Curitiba	", "	Pinheiral, mu itos pi nheir os	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Cursino	", "	Corr edor, campeão de corr idas	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Curt	", "	Peque no, curto	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Cururupeba	", "	Sap o (kururu) chato (pe ba)	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Custódia	", "	Custó dia: "guarda, proteção "	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Custódio	", "	O que g uarda, o anj o-da-g uarda	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Cyeíma	", "	Sem mã e, órfão	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Cymeím a	", "	Áspero, não liso	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Cypara	", "	O alisador, o po lidor, o debastad or	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Dã	", "	Juiz	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Dácia	", "	D akoi, da Dác ia, antigo país do le ste europe u	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dácio	", "	Dádiva	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Dadaô	", "	Divind ade da famí lia rea l de Dao mé, e m alguns cultos	", "	Afro- brasileiro	", "	Extraído de Livro dos Nomes	"),
-# ("	Dafné	", "	Da phne, lo uro, loureiro. Ninfa da m itologia gr ega	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dagmar	", "	Dagomar, glória do dia, di a glorioso ou do teutôn ico Dank-	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Dagoberto	", "	Brilhante como o dia	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Dagom	", "	Trigo	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Daher	", "	Fortuna, sorte	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-# ("	Daisy	", "	Daegeseag e, olho do di a, miniatura si mbólica do sol	", "	An glo-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Dalacosta	", "	Da costa, que te m orig em na beira d o mar	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Dalbert	", "	Dealbeorth, orgulhoso, bril hante	", "	An glo-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Dália	", "	Dalr, do valoe, ou nome da flor d ália	", "	Antigo nor uegu ês	", "	Extraído de Livro dos Nomes	"),
-# ("	Dalila	", "	Del ilah, mulher fraca,  dócil	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Dalegrave	", "	Dos sa ibros	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Dalmácio	", "	Origi nário d a Dalmácia	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Dalmiro	", "	No bre, ilustre	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Dalton	", "	Aldeia do vale	", "	Ing lês	", "	Extraído de Livro dos Nomes	"),
-# ("	Damarina	", "	M ulher pequena	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Dâmaris	", "	Im plora da pel o povo	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Damasceno	", "	Natural d e Damasco, capita l da Síria	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Damásio	", "	Do mar, dominar	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dâmaso	", "	Variação de Damásio	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Damião	", "	Pop ular	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dâmocles	", "	Afam ado co mo o povo, glória do povo	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dan	", "	Juiz. Diminutivo de Da niel	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Dandara	", "	Nome de u ma das m ulheres d e Gamba-Zum ba,	", "	Afro-bras ileira	", "	Extraído de Livro dos Nomes	"),
-# ("	Daniel	", "	Dan ivel, Deus é m eu juiz	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Daniele	", "	Daniel	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Danilo	", "	O dinamarquês	", "	Escand inavo	", "	Extraído de Livro dos Nomes	"),
-# ("	Dantas	", "	Das antas	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-# ("	Dante	", "	Abreviação de "d urante ", permanente, durável	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Danto n	", "	De Antôni o, filho de Antônio	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Danuta	", "	Dada por D eus	", "	Litua no	", "	Extraído de Livro dos Nomes	"),
-# ("	Daomé	", "	País africano, de on de foram  trazidos mu itos escravos	", "	Afro- brasileiro	", "	Extraído de Livro dos Nomes	"),
-# ("	Dara	", "	Coraç ão da sabe doria	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Darci	", "	D'Arc y, da fortaleza ou d o gaélico-ir landês Dorcha idhe,	", "	Antigo francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Dardano	", "	Dardanus, da cidade de Dard ânia, no Teleponto	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Dares	", "	Dar es, do gr ego Dar és, nome de um atleta troiano	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Dario	", "	Dareious, o rico, o poderos o	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Darlene	", "	Darei-ene, a querid inha	", "	Anti go franco-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Daros	", "	Gran de, elevado, alto	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dassuen	", "	Pássaro de pe nas azuis e roxas	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Datã, Datan	", "	Dathan, "homem da fonte "	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Dátis	", "	Dátis, do pers a, nome de um general	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dativa	", "	Que é dad o	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Dauno	", "	Da unus, do greg o Daûnus, nome de um rei da Apúlia	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Davi	", "	David, o amado	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	David	", "	Davi	", "	Inglês, francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Davide	", "	Davi	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Dávila	", "	Natur al de Á vila	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-# ("	Davis	", "	Davidson, filho de David	", "	An glo-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Davo	", "	Davus,  nome de um escravo rom ano	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Déa	", "	Deusa	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Deane	", "	M orador do vale	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Débora	", "	Debora h, a ab elha	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Décio	", "	Decem, dez. Era o n ome dado a o décimo filh o	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Dédalo	", "	Daidallos, traba lhar en genh osam ente, o inventor , o engenheir o	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dedan	", "	Querid o	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Déa	", "	Deusa	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# # ("	Deidamia	", "	De idamia, do grego De idámeia, de "deís, dáis: com bate, e	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Deífile	", "	Deiphíle: "deís: combate, e phíle: amiga": "amiga de co mbate"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# # ("	Deífobo	", "	Deípho bos: "deís:  combate, e ph obo: horror ", "que tem  horror	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# # ("	Deiopéia	", "	De iopea, grego De iópea: "deís: combate, e po iéo: fazer", "a	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Deise	", "	Adaptação do no me inglês Daisy	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-# ("	Dejanira	", "	A que vence os heróis	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Delama re	", "	Do ch arco,  do mar	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Delano	", "	De la  nova, do local das nogueiras	", "	Antigo francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Delbert	", "	No bre	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Delfim	", "	Golfinho	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Delgad o	", "	Antig a alcunha portugu esa	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-# ("	Delgau dio	", "	Da a legria	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Déli	", "	Peque no brejo	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Délia	", "	Delos; De lia, visível. Deus a da mitologia greg a	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Delícia	", "	Deliciae, de lícias	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Delma	", "	Delmar, do mar 	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-# ("	Delmar	", "	Do mar 	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-# ("	Delta	", "	De lta, a qu arta letra do alfab eto grego. Porta ou tenda	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Delwin	", "	Amigo de Deus	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Demade s	", "	De mádes, orador aten iense	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Demas	", "	Form a reduz ida de De métrio	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# # ("	Demarato	", "	De maratus,  grego De máratos:  "dêmos: povo, e ardomai:	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Demerval	", "	Da a ldeira de Amerval	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Demét rio	", "	Demetrios, que p ertence a De méter , deusa gre ga da	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Demócr ates	", "	Dirigente do povo	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Demócrito	", "	Ele ito do povo	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Demódico	", "	Demódikos, "o dire ito do povo"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# # ("	Demódoco	", "	Demódokos:  "dêmos: povo , e doké o: parecer be m", "o q ue	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Demófil o	", "	De móphilos: "philos: amigo, dê mos: do povo"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Demóstenes	", "	A força do p ovo	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Denilson	", "	Filho d e Denis	", "	Inglês	", "	Extraído de Livro dos Nomes	"),
-# ("	Denis	", "	Deus do vinho	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Denise	", "	De nise, ade pto de Dionísi o, deus grego d o vinho	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Deocleciano	", "	Glória de De us	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Deoclécio	", "	Glória a De us	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Deodato	", "	Dado a De us	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Deodoro	", "	Prese nte de Deus	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Deográcias	", "	Deo grati as, "graças a Deus "	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Deolindo	", "	Serpente ad orada d o povo, escudo do p ovo	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Deolinto	", "	Aquele qu e gosta de atividades do méstic as	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Derek	", "	Theo doric, chefe da tribo	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Desdêmona	", "	De m á estrel a, a qu e teme a De us	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Desiderato	", "	Des ideratus, "d eseja do"	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Desidério	", "	Desiderium, dese jo	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Detrich	", "	Príncipe do p ovo	", "	Gótico	", "	Extraído de Livro dos Nomes	"),
-# ("	Deucalião	", "	Deuca lion, do gr ego De ukalíon, "d oce"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Deusded it	", "	Da do por De us	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Diacira	", "	Favo de mel	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Diacuí	", "	Flor do ca mpo	", "	Kala pagos	", "	Extraído de Livro dos Nomes	"),
-# ("	Diade ma	", "	Cor oa ou insígn ia	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Diamantin o	", "	Indo mável,  duro com o o dia mante	", "	Grego, lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Diana	", "	Brilhante, a divina. Deus d a caça	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Diaurum	", "	Onça preta	", "	Ca maiurá	", "	Extraído de Livro dos Nomes	"),
-# ("	Dib	", "	Lobo	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-# ("	Dicéa	", "	Justiça	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dick	", "	Hipocorístico d e Ricard o	", "	Ing lês	", "	Extraído de Livro dos Nomes	"),
-# ("	Dickson	", "	Filho d e Dick	", "	Inglês	", "	Extraído de Livro dos Nomes	"),
-# ("	Dídaco	", "	Didacus, do grego di dachos, "i nstruído"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Dídia	", "	Di dia, tal vez da expressão Di dia L ex, "Lei de Díd io"	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Dídimo	", "	Gêm eo	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dido	", "	Amor	", "	Fenício	", "	Extraído de Livro dos Nomes	"),
-# ("	Diéne ces	", "	Dienékes, "contínuo, e xtenso ". Nome masculino	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dífilo	", "	Diphilus, greg o Díphilos, "duplamente a migo"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Diler mando	", "	Homem de ar mas	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Dilza	", "	Ni nfa, ondina	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Dimas	", "	Nome de u m dos cri minosos qu e foram cruc ificados co m Jesus	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Diná	", "	Din ah, julgada	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Dinam ene	", "	D yaméne, nome de u ma ner eida da Ilíada, de Homero	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dinam ese	", "	Poderos a	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dinart e	", "	Guerr eiro, heró i forte	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Diniz	", "	De us do vinho. Variação de Di onísio	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dinorá	", "	Julg ar. Corru ptela de El eonor a, através  de D ionora	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Diocleciano	", "	Dios, Deus e Kl etos,  glória; glór ia de De us	", "	Grego-l atim	", "	Extraído de Livro dos Nomes	"),
-# ("	Dioclécio	", "	Glóri a de Júpiter 	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Diocléia	", "	Di ókleia, feminino d e Díocles	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Diocles, Díocles	", "	Di oklês. O  mesmo qu e Dioclécio	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Diodoro	", "	Presente de De us	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Diofanto	", "	Dióphantos, "o que mostra Zeus "	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Diógenes	", "	Gerado p or Deus, de orig em divina	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Diogo	", "	Didacus, instruído	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Dioma r	", "	Afam ado, po pular 	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Diomede s	", "	Pens amento de Zeus, claro à divinda de	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Diomiro	", "	Célebre entre o povo,  de cons elho d ivino	", "	Ger mênico	", "	Extraído de Livro dos Nomes	"),
-# ("	Dion	", "	Divino	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dione	", "	A espos a de Zeus	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dionéia	", "	V ariação de Di onea	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dionísi o	", "	Di onys-os, deus do vinho	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dióscoro	", "	Dioscor us, grego Di óskoros, "menino de De us"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Diotimo	", "	Di ótimos, "a honr a de Deus"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dirce	", "	Fonte. No me d e uma ninfa da m itologia grega	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dirceu	", "	Dirk aios, fonte.  Variação de D irce	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Diva	", "	Diva,  deusa	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Divacíaco	", "	Diviciac us, prenome na anti ga Ro ma	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Dizawr a	", "	Onça	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Djalm a	", "	Hjal + mâ ri, elmo + céle bre; célebr e pelo e lmo	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Dolabela	", "	Machadin ho, enxó peq uena	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Dolan	", "	Que tem cab elos ne gros	", "	Céltico	", "	Extraído de Livro dos Nomes	"),
-# ("	Dolores	", "	Dolores, dores, pesares	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-# ("	Domênico	", "	De d omingo, nasc ido no d omingo	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Domícia	", "	Deusa d o lar	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Domician o	", "	Ho mem domado, ho mem manso e de gênio brando	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Domício	", "	Do mus, casa. De us que os rom anos i nvocavam n a celebração	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Domingos	", "	Dominicus, nascid o no dia de d omingo	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Domno	", "	Do mnus, forma abr eviatura d e Dominus, "Senhor "	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Don	", "	Mes tre	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Donaciano	", "	Do natian us, derivado de Donatus (D onato)	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Donaldo	", "	Do mhnall, que governa tudo, governa nte de tudo	", "	Gaélic o-escocês	", "	Extraído de Livro dos Nomes	"),
-# ("	Donária	", "	Donum, prese nte, dádiva	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Donário	", "	Dá diva, prese nte	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Donatelo	", "	Donate llo, derivado de D onato	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Donatila	", "	Do natilla, diminutivo de Don ata	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	DOnato	", "	Do nato,  dado, presente ado	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Donga	", "	O  pretinho d e Angola	", "	Qui mbundo	", "	Extraído de Livro dos Nomes	"),
-# ("	Donzíl ia	", "	Donzíli a, "donze la"	", "	Açoria no	", "	Extraído de Livro dos Nomes	"),
-# ("	Dora	", "	Dor on, presente	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dorcas	", "	Gamo, gaze la	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dória	", "	De Ória, de famí lia ge novesa	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Doriano	", "	Dor ios, de Dória; foram os antig os habita ntes helênicos da	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Dóris	", "	Doris, filha d e Ocea no, deus do ma r	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Doro	", "	Dorus, grego D ôros - Relativo aos dóri os	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Dorotéia	", "	Dorothe a, dádiva de D eus; também é a nagra ma d e Teodora	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Doroteu	", "	Dorothe us, mascu lino d e Dorotéi a	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Dorval	", "	Natur al de or val, topô nimo	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Dositeo	", "	Dosithe u, grego Dosítheos: "d ósis, ação de dar , e thé os, deus",	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Douglas	", "	Duubhglas, da ág ua escura ou pr eta	", "	Gaé lico-esc ocês	", "	Extraído de Livro dos Nomes	"),
-# ("	Dourival	", "	Do vale dour ado	", "	Português	", "	Extraído de Livro dos Nomes	"),
-# ("	Drisana	", "	O sol	", "	Sâ nscrito	", "	Extraído de Livro dos Nomes	"),
-# ("	Druso	", "	Drusus: sobren ome da antig a Roma	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Duana	", "	Poe ma	", "	Gaélic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Duane	", "	Canção p oética	", "	Céltic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Duarte	", "	Ed ward,  guardi ão prósp ero	", "	Inglês	", "	Extraído de Livro dos Nomes	"),
-# ("	Duíli o	", "	Rebelde, in imigo, guerr eiro. No me de a ntiga famí lia ro mana	", "	Latino	", "	Extraído de Livro dos Nomes	"),
-# ("	Duiruna	", "	Divindad e indíge na	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Dulce	", "	Dulcis, doce	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Dulcelina	", "	Ch eia de d oçura	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Dulcídi o	", "	Mais  doce que o me l	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Dumont	", "	Do m onte, do m orro	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Duprat	", "	Do prad o	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Durval	", "	Thorwald, o que governa sob Thor ou sacer dote de Thor	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Dutra	", "	Hurtere De  Van Hurtere, que rece beu em  doaç ão a ilha de	", "	Fla mengo	", "	Extraído de Livro dos Nomes	"),
-# ("	Dvorak	", "	Palaciano	", "	Polo nês	", "	Extraído de Livro dos Nomes	"),
-# ("	Eadr ed	", "	Conse lho feliz	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Êaco	", "	Aecus, do gre go Aiakós, person agem mi tológico	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Eane s	", "	Filh o de João	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Earl	", "	De inteligênc ia aguç ada	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Ebe	", "	Hebé, juventude	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Ebenéze r	", "	Pedra do socorro	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Éber	", "	Javali	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Eber ardina	", "	Eber hardi na, derivado de Eberh arda	", "	Ale mão	", "	Extraído de Livro dos Nomes	"),
-# ("	Eber ardo	", "	Forte como um javali	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Eber arto	", "	Eber hart, variação de Eber ardo	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Éberle	", "	Peq ueno javali	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Ebraim	", "	Foi chefe de um a das doz e tribos de Israel	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Eça	", "	Da Vila de Eça,  em Gal iza	", "	Gal ego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eçabara	", "	O que procur a, que busca	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Eçaí	", "	Risonh o, alegre	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Eçaraia	", "	Esqu ecido, esq uecimento	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Eçaúna	", "	De o lhos pretos	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Ecléa	", "	Eukl éia, a famosa, a cé lebre	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Ecoat eyma	", "	Avarento, mi serável	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Acocuaba	", "	Compreensão, conh ecimento, enten der	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Ecoe ma	", "	Manhã	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Ecomonhanga	", "	O que governa, dirige	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Eda	", "	Ethe im m ão ou avó, Segund o alguns autores provém d e ead,	", "	Gótico	", "	Extraído de Livro dos Nomes	"),
-# ("	Edberto	", "	Eadbeor ht, prósp ero	", "	An glo-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Eddy	", "	Inquieto	", "	Esca ndinavo	", "	Extraído de Livro dos Nomes	"),
-# ("	Edelbert	", "	Nobre il ustre	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Edelmira	", "	"Ed el: nobre, mi r: famosa ou brilhante"	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Edeline	", "	Nobre e che ia de bo m hu mor	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Edelma r	", "	Aethel maer e, nobre, famoso	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Edelmira	", "	No bre e brilhante	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Edeltrudes	", "	No bre fé	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Éden	", "	Lu gar da felic idade	", "	Assírio ba bilônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Edênica	", "	Que diz res peito ao Éde n. Lugar da felic idade	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Edênico	", "	Que diz respe ito ao Éden. Lug ar de felicidade	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Éder	", "	Belo	", "	Basco	", "	Extraído de Livro dos Nomes	"),
-# ("	Edésia	", "	Edere, comer. Deusa que pres idia as refe ições	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Edgar	", "	Ead-gar , próspero l anceir o	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Edgardo	", "	Lanç a da fidal guia, la nça para prote ger os bens	", "	Angl o-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Édina	", "	Ead-wina,  amigo prósper o	", "	Angl o-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Édip o	", "	Oida o + pous, inchar + pés; que tem os pés i nchad os	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Edite	", "	Eadgyth: "gyth: combate e ead: pelas ri quezas "	", "	An glo-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Edla	", "	Nobre pr incesa	", "	An glo-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Edme a ou Edm éia	", "	Edmea, este do francês Edmée, feminino de	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Edmond o	", "	Edmundo	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Edmund o	", "	Ead-mu nd, prósp ero protetor 	", "	An glo-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Edna	", "	Ednah, rejuvenesci mento; a qu e conhec ia o segred o da	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Édnie	", "	Príncipe egípc io	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Edoardo	", "	Edu ardo	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Edom	", "	Vermelho	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Edsel	", "	Prósper o da casa; rico benfe itor do seu povo 	", "	Angl o-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Édson	", "	Eadw ard-so ne, filho de Edu ardo	", "	Angl o-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Eduardo	", "	Eadw ard, prósper o guardião	", "	Angl o-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Eduvig is	", "	Hath u-wig, guerreiro b atalha dor	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Edvaldo	", "	Ead-weal,  prós pero governo	", "	Angl o-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Edvina	", "	Valiosa amiga	", "	An glo-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Edvino	", "	Amigo da pros perid ade	", "	Angl o-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Edwi ges	", "	Ed + vig, bens + luta; guerreir a rica	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Efialtes	", "	Ephiáltes, de e phiáltes, "pesad elo"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Efraim	", "	Frutí fero	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Éfrem	", "	Efrem, o m esmo qu e Efraim	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Egas	", "	Espa da	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Egbald o	", "	Ousa do pel a espad a	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Egberto	", "	Espada luz idia, brilhante	", "	An glo-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Egeo(n)	", "	Aegageo n, "lançar-s e", "impetuoso"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Egéria	", "	Ninfa das fontes na mi tologia grec o-lati na	", "	Grego, latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Egíd io	", "	Protetor , aquele q ue protege	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Egina	", "	Ninfa, filha de Éso po, amada por Zeus	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eginardo	", "	"Eg in: espad a, e har d: forte", "forte na espa da"	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Egisto	", "	Aix, aigos, cabr a, criado por cabr a	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Egla	", "	Fulg or, esplendor 	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eglanti na	", "	Églanti ne, roseira si lvestre	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Elge ou Eglé	", "	Aiglé, nome de pers onag em mitológica	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Egma r	", "	Espada cé lebre, bri lhante	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Egmon	", "	Egmont, espada protetora, o que pr otege pe la espad a	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Égon	", "	Agon, conte nta, luta o u aigon, lutador, atleta, pastor 	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eguivald o	", "	"Eg: espad a, ward: que governa"	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Eidil	", "	Nobre, fida lgo	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Eiguara	", "	Plebeu, v ulgar	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Einar	", "	O que luta só, guerre iro escolhido	", "	Escand inavo	", "	Extraído de Livro dos Nomes	"),
-# ("	Einstein	", "	Cerc o de pedras	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Eira	", "	Abelha	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Eirantã	", "	Mel  crista lizado, açucarad o	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Eirapuã	", "	Abelha que faz a colméia no alto das árvores;  estrel a	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Eiratí	", "	Abelhinha	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Eiret ama	", "	Lontra. Tupi: colméia	", "	Na mbiquar a	", "	Extraído de Livro dos Nomes	"),
-# ("	Eirós	", "	No me de uma enguia	", "	Português	", "	Extraído de Livro dos Nomes	"),
-# ("	Eirubi	", "	Abelha roxa, escura	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Elá	", "	No me do q uarto rei de Israel	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Elam	", "	E'la m, "oculto ou moço"	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Elaine	", "	Form a antig a de Helena	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Elba	", "	Da ilha de Elba, na costa da Itália	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Elcana	", "	Elqa nah, "que Deus crio u", ou "qu e Deus ad quiriu"	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Élcio	", "	Corda de p uxar	", "	Grego, latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Élder	", "	V elho	", "	Inglês	", "	Extraído de Livro dos Nomes	"),
-# ("	Eleaz ar	", "	El'azar, para quem Deus é u m socorr o	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Eleáz aro	", "	Eleazar o, o mesmo qu e Eleazar 	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Elect ra, Eletra	", "	Electra, greg o Eléktra,  de eléktor , "brilhante"	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Eledá	", "	Do na da vida	", "	Afro- brasileiro	", "	Extraído de Livro dos Nomes	"),
-# ("	Elemi	", "	Ori xá, protetor 	", "	Afro- brasileiro	", "	Extraído de Livro dos Nomes	"),
-# ("	Eleonor	", "	M eu De us é luz	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-# ("	Eleonora	", "	Elienor , luz	", "	Gal ês	", "	Extraído de Livro dos Nomes	"),
-# ("	Elesbão	", "	Bend ito	", "	Grego, lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Eleta	", "	Electra,  "escol hida"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Eletr a	", "	Elektra, respl andec ência ou eléktron, âm bar. A resplandecente	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eleu	", "	Ele us, "da Élid a"	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Eleutéria	", "	Livre; deusa d a liberdade	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eleutério	", "	O  libertad or	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Elfrida	", "	Elf + thr yt, elfo + trude; a Trude de Elfos	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Elga	", "	Sagra da	", "	Gótico	", "	Extraído de Livro dos Nomes	"),
-# ("	Eli	", "	Eli, Jeová ou o Altíssi mo	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Elia	", "	Pertenc ente a Deus	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Eliabe	", "	Meu Deus é pai	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Eliade	", "	Meu Deus sabe	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Eliana	", "	Hé lios, sol, solar , de beleza resplandec ente	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eliaqu im	", "	Deus estab elece	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Elias	", "	Jeová  é meu De us, Jeová é Deus	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Elice	", "	Jeová  é o sen hor	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Elício	", "	Elicius, epíteto pel o qual Jú piter era ador ado sobr e o Monte	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Elidi	", "	Dá diva do so l	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Elifas	", "	Tesouro de Deus	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Elígio	", "	Eli gere, ele ger, esco lher, o esco lhido, o eleito	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Elika	", "	Purifica da por De us	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Élis	", "	Variação de Alice	", "	Gal ês	", "	Extraído de Livro dos Nomes	"),
-# ("	Elisabeta	", "	Elisabetta, o mesmo q ue Elisa bete	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Elisabete	", "	Elish e-ban co nsagra do a Deus	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Eliseu	", "	Elisha, Deus é a sua sa lvação	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Elísio	", "	Elysios, "céu d os heróis "	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eliú	", "	M eu De us é ele	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Elki	", "	Urs o	", "	Ing lês	", "	Extraído de Livro dos Nomes	"),
-# ("	Elma	", "	Elmo, amigável	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Elma r	", "	Tudo br ilhante	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Élme r	", "	Nobre e fam oso	", "	Ing lês	", "	Extraído de Livro dos Nomes	"),
-# ("	Elmo	", "	Helm, elmo, capac ete	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Eloá	", "	Deus	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Elói	", "	O ele ito	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Eloim	", "	Javé é o Deus e nã o há outro senão El e	", "	Ara maico	", "	Extraído de Livro dos Nomes	"),
-# ("	Elpenor	", "	Homem de esp erança	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Elpídio	", "	Elpis, esper ança ou o qu e tem esper ança	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# # ("	Elpinice	", "	Elpiníke: "é lpo: esper ar, níke: vitórioa", "a q ue esper a a	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Elpino	", "	Elpín es, "espera nça"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Elsa	", "	Elsa, a nobre. Nome de u ma n infa da mitologia	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Elsie	", "	A nobre virgem. V ariação de Elza	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Élson	", "	Filho de El i	", "	Hebr aico, ang lo	", "	Extraído de Livro dos Nomes	"),
-# ("	Élton	", "	Antigo e hab itado	", "	Angl o-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Elva	", "	Fada, duende	", "	Angl o-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Elvia	", "	Conse lheira dos alfos	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Elvina	", "	Favorita dos duendes	", "	An glo-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Elvino	", "	All + win, tudo + amigo; com panheir o, companhe iro em	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Elvira	", "	Albinia, loura, branca	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Élvis	", "	Alviss, sábi o	", "	Antigo nor uegu ês	", "	Extraído de Livro dos Nomes	"),
-# ("	Elza	", "	Virgem das ág uas, divindade d as águas e dos cis nes	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Elzeá rio	", "	Socorro de D eus	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Ema	", "	Im ma, aq uele q ue é universal	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Emanuel	", "	Im manu-el, De us conosco; Deus está nos cor ações dos	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Emarã	", "	Falar m al, m exerique ira, maledicênci a	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Emélia	", "	Melod ia	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Emerenciano	", "	Que mu ito me rece; que te m mu ito mé rito	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Emérico	", "	Emerico, do ale mão Em merich, o mesmo que Américo	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Emerita	", "	Emerita, "a que tem  mérito"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Émerson	", "	Amalric, governador in dustrioso	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Emetério	", "	Em er, vomitar 	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Emi	", "	Flor de licada, ou afro-b rasileiro, vida,  alma, resp iraçã o	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Emídio	", "	Aemygdius ou ae mi + dios, semi + deus; semideus	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Emígdio	", "	Em igdio	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-# ("	Emil	", "	Amal, industrios o	", "	Gótico	", "	Extraído de Livro dos Nomes	"),
-# ("	Emiliano	", "	Da famíl ia de Emí lio. Form a masculina de Em iliana	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Emílio	", "	Solícito, zel oso, trabalhador com  bronze	", "	Etrusco,  latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Emily	", "	Emí lia	", "	Inglês	", "	Extraído de Livro dos Nomes	"),
-# ("	Emir	", "	Prínci pe	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-# ("	Emoema	", "	Mentira,  metiros o	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Empéd ocles	", "	Empedos + kléos, constante + glória, glória permanente	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Enca rnação	", "	Incarnati o, encarnaç ão	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Endi	", "	Brilho, luz	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Endimião	", "	Endymio ne, do grego End ymíon.  Nome de um pastor da	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Endiyá	", "	Lampejar, chamejar, relâmpago	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Endy	", "	Luz, luzir, brilhante	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Endyra	", "	Prima d o homem, ir mã	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Enéa s	", "	O  glorioso, o terrív el	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Enedina	", "	Enedynêln, "ser co mplacente "	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eneida	", "	Aeneida, nome de um a epopéia do poeta lati no Virgílio	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Engelmaro	", "	"En gel: anj o, e mar: cavalo"	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# # ("	Engrácia	", "	Engrac ia, derivado do lati m in grati a, "em graça (do	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-# ("	Enguel berto	", "	Anjo bri lhante	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Eni	", "	Purez a imaculada	", "	Gal ês	", "	Extraído de Livro dos Nomes	"),
-# ("	Enide	", "	Alma e espírito	", "	Celta	", "	Extraído de Livro dos Nomes	"),
-# ("	Ênio	", "	Natural d a Trácia	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Enód io	", "	Enn odius, santo da Igrej a Católica	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Ênomo	", "	Enn omus, prínc ipe da M ísia	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Enoq ue	", "	Khan ok, delicado, consagra do	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Enoré	", "	De us suprem o dos par ecis	", "	Pareci	", "	Extraído de Livro dos Nomes	"),
-# ("	Enos	", "	Homem	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Enzo	", "	Heinz, abreviaçã o de Hei nrich	", "	Alemão	", "	Extraído de Livro dos Nomes	"),
-# ("	Eolo	", "	Aiólos, que se move co m facil idade	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Épafo	", "	Epa phus, filho de Jú piter	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# # ("	Epafrodito	", "	Epaphr oditus, do greg o Epaphró ditos, "favoreci do por	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Epaminon das	", "	O que está aci ma do melhor, o ótimo	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Epeu	", "	Epe us, do gr ego Epeíos, nome do construtor do fa moso cavalo de	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Epi	", "	Epy, fund amento, princípi o	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Epícaris	", "	Muito graciosa	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Epicuro	", "	Caritativo	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Epíd io	", "	No me de person agem da m itologia ro mana	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Epifanes	", "	Epi phan es, do gr ego Epi phan és, "ilustre, bril hante "	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Epifâni o	", "	Epi + pha inomai, no alto + apareço; re velação, manifestaçã o	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Epíg one	", "	Nasc ido de pois	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Epíg ono	", "	Epígonos, "nasc ido de pois"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Epímaco	", "	Epimachus, do gr ego epí mach os, "fácil de atacar "	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Epimênides	", "	Cérebr e por sua gran de pie dade	", "	Cretense	", "	Extraído de Livro dos Nomes	"),
-# ("	Epitácio	", "	O que co manda, chefe im perioso	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Epíteto	", "	Gran de possu idor	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# # ("	Eracitrato	", "	Erasitratus, greg o Erasístratos: "érasis: amor e stratós:	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Eraldo	", "	O que governa	", "	An glo-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Erapuã	", "	Nome de uma estrela	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Erasmo	", "	Erasmios, amável, di gno de a mor	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Erasto	", "	Di gno de a mor	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Erastus	", "	Amado	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Erberto	", "	Variação de He riberto	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Ercílio	", "	Másculo, viril,  potente	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Erê	", "	Brincad eira, jog o	", "	Afro-bras ileiro	", "	Extraído de Livro dos Nomes	"),
-# ("	Ercteu	", "	Erechthé us, basead o em eréchto,  "quebr ar"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# # ("	Eremild o	", "	"Erme, por irmin: forte,  e hild: combate": "forte no	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Erertáquio	", "	Frutífero ou saud ável	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eriberto	", "	Aquele que bri lha	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Eric	", "	Poder oso com o um a águia	", "	Escand inavo	", "	Extraído de Livro dos Nomes	"),
-# ("	Erichsen	", "	Filh o de Erich	", "	Escand inavo	", "	Extraído de Livro dos Nomes	"),
-# ("	Ericina	", "	Erycina, grego Er ykíne, "do monte Érix", epíteto  de Vê nus	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Érico	", "	Elrik-r, pod eroso co mo u ma ág uia, rico e m honr as e	", "	Antigo nor uegu ês	", "	Extraído de Livro dos Nomes	"),
-# ("	Erina	", "	Erinna o u Erinne, do gre go Erínne, nome de um a poetisa de	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Erla	", "	Sen hora, dama	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Ermelin da	", "	Serp ente do deus Irm in	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Ermenegil do	", "	Proteg ido pe lo deus Irm in, o grande, o forte,  o	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Ermesindo	", "	Co mpanheiro, caminho na com panhia do d eus Irmi n	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Ermín io	", "	Ermínio, o mesmo q ue Hermínio	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Ermírio	", "	Águ ia céle bre	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Ernân i	", "	Cor ajoso, v alente	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Ernesto	", "	Earnest, combatente ded icado	", "	Angl o-saxão o u teutô nico	", "	Extraído de Livro dos Nomes	"),
-# ("	Erondina	", "	Andorinh a	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Eros	", "	Deus do a mor	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Erotides	", "	Diminutivo de Eros, amor	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Erotildes	", "	Amorzinh o	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Erval	", "	Mata de erva  mate	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-# ("	Ervino	", "	Amigo do exército	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Esaú	", "	Ho mem pe ludo	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Escobar	", "	Nome de um a pla nta	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-# ("	Escolástica	", "	Estudios a, sábia	", "	Grego, lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Escolástico	", "	Scholastic us, "estudios o, simples, ingênuo"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Escribô nio	", "	Scribonio, relacionad o a scribere, "escr ever"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Esculápio	", "	Deus da me dicina	", "	Grego, latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Esdr as	", "	Soc orro	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Ésio	", "	Feliz	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Esmeralda	", "	Esm eraud, o verde brilhante, a gema verde	", "	Antigo francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Esméria	", "	Nome de u ma pl anta	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Espá rtaco	", "	Nasc ido na ci dade d e Trácia	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Espiridião	", "	Sopro de De us	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Essoby	", "	De o lhos verdes ou azuis	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Estácio	", "	O que está firm e, de pé	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Estanislau	", "	Glória da naç ão	", "	Esl avo	", "	Extraído de Livro dos Nomes	"),
-# ("	Estefânia	", "	Croro a, diadema	", "	Grego, lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Estefani o	", "	Stepha nius, greg o stephánion, diminutivo de stepha nos:	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Estéfano	", "	Stephanós, coro ado de lá urea ou vitorioso	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Estela	", "	Stell a, estrel a	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Estênio	", "	Força	", "	Grego, lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Estentor	", "	Stentor , de sténeo, "gemer"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Ester	", "	Estrela	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Estêvão	", "	O  coroado	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Estrabão	", "	Strabon is, "vesgo "	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# # ("	Estratonice	", "	Stratonice, gre go Strato níke:  "stratós: exército, e níke:	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Etel	", "	Aethel, nobre	", "	Angl o-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Etelvina	", "	No bre amiga	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Etelvino	", "	Adal + win, nobre + amigo, nobre a migo	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Etenia	", "	Afortun ada	", "	Inglês	", "	Extraído de Livro dos Nomes	"),
-# # ("	Atéocles	", "	Eteokl es: "eteós: verdade iro, e kléos: glória", "verd adeir a	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Ethan	", "	O forte	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Êubi o	", "	Eub ius, nome de histor iador ro mano	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Eubu lo	", "	Eub ulus, grego: Eúb oulos, "b om conselho"	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Eucadia	", "	O  melhor, bonda de	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eucá rio	", "	Euchári os, "eu: bom, char is: graça": "a mável, agradável"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Êuca ris	", "	O  mesmo q ue Eucári o	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eucléia	", "	A famosa, a célebre	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eucles	", "	Euklés, de eukl eés, "ilustre,  glorios o"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Euclides	", "	Glori oso, ilustre	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eudamo	", "	Eúd amos, "bom povo , boa raç a"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eudes	", "	Ilustre	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Eudia	", "	Esclareci da, iluminada	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eudora	", "	Eud ora, generos o	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eudoro	", "	Liberal	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eudóxia	", "	Eudoxos , de bo a reputação, de bo a fama	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eudóxi o	", "	O  que pens a bem	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eufêmia	", "	Feminino de Eufêm io	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eufêmio	", "	Eup hémios, "p alavra  de bom agouro"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Euforbo	", "	Eúphjorbos, "bem nutri do"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eufranor	", "	Euphrá nor, "que ale gra, que enca nta"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eufrá sia	", "	Eup hrasía,  "alegria."	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eufrá sio	", "	Alegria	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eufrone	", "	Bo m conse lheiro	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eufrosina	", "	Alegria, jovialidade	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eufrosino	", "	Euphros ynus, "alegre, jovial"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Eugâmio	", "	Eúgamos, "qu e fez casa mento feliz"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eugêni o	", "	Eug enios, "b em nascid o, nobre"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Euládi o	", "	V oz suave	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eulália	", "	Eulalos, bem fal ante	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Euláli o	", "	Que fala be m, be m falante	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eulâmpia	", "	Eul ampés, "brilhante "	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eulina	", "	De boa li nhagem	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eulino	", "	Masculino d e Eulina	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Euler	", "	Oleir o	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Euló gio	", "	Homem de bo a razão, discreto	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eumene s	", "	Eu menés, "benévolo, ben igno"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eumênides	", "	Eu meníd es, "as benévolas "	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eumênio	", "	Eumenés, "be névolo, bom"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eumênis	", "	Fácil, doce	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eunápi o	", "	Que tem m uitos bosques	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eunice	", "	Eu-n iké, bela vi tória, vitorioso	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eunico	", "	Eunicus, "b ela vi tória"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Euno	", "	Eunus, "que tem bons se ntimentos"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Eunômia	", "	Eunomía, "boa l ei, boa orde m"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eunômi o	", "	"R egido por boas l eis, bem governado"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eupória	", "	"Facilidade para fazer qua lquer co isa"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Êuporo	", "	"Enge nhoso, inventi vo"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Euquéria	", "	"D estreza, agilidade das mã os"	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Euquério	", "	Masculi no de Euq uéria	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Euríalo	", "	"Que tem ár ea vasta"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Euribíades	", "	"Fi lho de Euríbi o"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Euríbi o	", "	"Muito forte"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Euricléia	", "	Der ivado d e Euricles	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Euricles	", "	Eurýklês: "eurys: largo, e kléos: glória"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Euriciclia	", "	O  mesmo q ue Euricl éia	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Eurico	", "	Defens or da lei, mu ito correto	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Eurides	", "	Eu + ripé, bem + ímp eto; impetuoso, muito agita do	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eurídice	", "	Amante da justiça	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# # ("	Euríma co	", "	Eurýmachos: "eur ýs: largo, e mâche: combate", "combatente	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eurípedes	", "	V ento que sopr a	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# # ("	Eurístene s	", "	Eur ýsthénes, de eurýtsthenés: "eurýs: largo, e sthén os:	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Euristeu	", "	Vriação de Eurístenes	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Europa	", "	Grande o lho	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eusébia	", "	Euse bia, de eusé beia, "p iedade"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eusébio	", "	Piedos o	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eustáquio	", "	Carreg ado de be las esp igas	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eustátio	", "	O  mesmo q ue Estácio	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eustórgio	", "	Eustórgios, de eústorg os, "cheio de ternura"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eutálio	", "	Euthalés, "q ue se desenvol ve be m, floresce nte"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eutico	", "	Eútychos,  "feliz"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Euticrat es	", "	Euth ykratés, "bom vigor"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eutímio	", "	Euthymius, "bondoso, gen eroso"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Êutiq ues	", "	Eutychés,  "feliz, afortunado "	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eutíq uio	", "	Aquele qu e tem bo a sorte	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eutrópi o	", "	Eutrop ius, "versátil, ág il"	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Euvaldo	", "	Corajoso no cum primento da lei	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Euzélia	", "	"Bo a rivalidade"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Eva	", "	Chavva, viver. Mãe  da humanidade	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Évagon	", "	E vágon, "obtid o em co mbate glorioso"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Evandro	", "	Homem valente, homem varoni l	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Evânge la	", "	A boa notícia	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Evange lista	", "	O que l eva as boas novas,  o qu e evang eliza	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Evânge lo	", "	Eua ngelus, "que traz uma boa notícia "	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Evaristo	", "	O  ótimo, o me lhor de todos	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Evê	", "	Foha que o v ento leva	", "	Afro-bras ileiro	", "	Extraído de Livro dos Nomes	"),
-# ("	Evélio	", "	Eué lios: "eu: bo m, e hélios: sol"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Evêncio	", "	E venti us, "aconteci mento, evento,  efeito "	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Everardo	", "	Eburh ardt, "bravo javali "	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Everdina	", "	Ewerdin a, derivado de Everhard (Eb erardo)	", "	Ale mão	", "	Extraído de Livro dos Nomes	"),
-# ("	Evergo	", "	Eúergos, "q ue faz b em, fa vorável"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Evete	", "	E vette,  diminutivo de Eve	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Evilásio	", "	Aquele que aca lma	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Evódio	", "	Euodius, variação de Eu odus	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Évodo	", "	Euodus, greg o; Eúodos, "que ca minha se m obstác ulos"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Expedito	", "	Desembaraçad o, esperto	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Exuper âncio	", "	E xuperantius, "o qu e supera, v ence "	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Exupério	", "	Aquele que sup era	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Ezequias	", "	A força de De us	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Ezequiel	", "	Yekhezqel, força de Deus; Ezeq uiel, gra nde profeta	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Ézer	", "	Edz er, "tesour o"	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Ézio	", "	Aetos,  águia	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Ezra	", "	Ezra, socorro	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Fáber	", "	Fabricante	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fábia	", "	Fa va	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Fabian	", "	Lento	", "	Inglês	", "	Extraído de Livro dos Nomes	"),
-# ("	Fabiano	", "	Fabianus, fava que cresc e, feijão crescen do	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fabre	", "	Ferre iro	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Fabrício	", "	Artífice, ferreir o	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fabron	", "	Um mecânico	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Facó	", "	Alegria	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Facundo	", "	Facu ndus, "qu e se expri me co m facil idade", "eloqüe nte"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fádel	", "	Virtuoso	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-# ("	Fadio	", "	Fadius, nome de famí lia ro mana	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fádua	", "	Redentor a, a qu e redime	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-# ("	Faetonte	", "	Pha etonte,  "brilhante"	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Fagun do	", "	O me smo que Fagu ndes	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fahir	", "	Magnífico	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-# ("	Faiçal	", "	Esp ada qu e corta m aravilh osam ente	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-# ("	Faivr e	", "	Ferreir o	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Fálaris	", "	Phalar is, "galinha d a água"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Falcídi o	", "	Falci dius, de fal x, "foice"	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Faleco	", "	Phá laikos, pre nome da Grécia anti ga	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Fane	", "	Alegre	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Fanor	", "	Cl aro	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Faon	", "	Pháon, "br ilhante"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Farah	", "	Alegria, praz er	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-# # ("	Faramund o	", "	"fara: raça, munt: proteção, am paro", "o que pr otege	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Fares	", "	Cavaleiro	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-# ("	Fahát, Farahat	", "	"Alegr ia"	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-# ("	Farid	", "	Único, ímp ar	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-# ("	Farida	", "	Pérol a	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-# ("	Faro	", "	Presídio, refúgi o	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-# ("	Faros	", "	Pulg a	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Faruk	", "	Se vero	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-# ("	Fascínio	", "	Que e ncanta	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fátima	", "	A que de ixou de m amar, mulher perfe ita	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-# ("	Faustinia no	", "	Faustin ianus, derivado de Faustin us	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Fausto	", "	Faustus, auspic ioso, feliz	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Fáustulo	", "	Faustu lus, diminutivo de Faustus,  Fausto	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fáuzi	", "	V encedor 	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-# ("	Fávaro	", "	Ferreiro	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Favônio	", "	Favonius, pri mitivam ente, nome de vento  que sopra do	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Favor eto	", "	Comunicativo	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Fearnot	", "	Fear + not, sem  temor	", "	Inglês	", "	Extraído de Livro dos Nomes	"),
-# # ("	Febe	", "	Phoeb e, do gr ego Phoíbe, "ra diante ", brilhante"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Febo	", "	Phoibos, resp landecente	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Fedalto	", "	Faia l do alto	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Fedato	", "	Fiel, confiante	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Fedra	", "	Brilhante, claro	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Fedro	", "	Pha edrus, "brilhante "	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Feijó	", "	Feijão. Sobre nome de famí lias br asileiras	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Feio	", "	Foedus, feio	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Feitosa	", "	Terra de m uitas pl antas	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-# ("	Felênio	", "	Divindad e adorad a pelos h abitantes de Aquiléia	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Felice	", "	Felix	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Felicida de	", "	Felicitas, felicidade	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Felipe	", "	Aquele qu e gosta de cavalos	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Felisberto	", "	M uito il ustre	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Felisbi no	", "	Muito  ilustre	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Félix	", "	Felix,  feliz	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Felo	", "	Phélios, "carvalho", "cortiça "	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Fênix	", "	Púrp ureo, vermelh o escuro	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Ferdinand o	", "	Fairho nanth, desafia dor do mu ndo, aventureiro	", "	Gótico	", "	Extraído de Livro dos Nomes	"),
-# ("	Ferecides	", "	Pher ekydes : "phéro: levar, e kydos : glór ia"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Ferécrates	", "	Pherekrátes: "ph éro: levar, e krátos: força"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Feres	", "	Cavaleiro	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-# ("	Fernando	", "	Ousa do, alto	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Ferrari	", "	Ferreir o	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Ferreira	", "	Ferrar ia, mina de ferro	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Ferrer	", "	Ferre iro	", "	Catal ão	", "	Extraído de Livro dos Nomes	"),
-# ("	Fessônia	", "	Fessus, cansad o	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Festo	", "	Festus, "alegre, divertido"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Festus	", "	O ale gre	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fiácrio	", "	Puro	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Fialh o	", "	Fialho, fiapo	", "	Anti go portugu ês	", "	Extraído de Livro dos Nomes	"),
-# ("	Fidel	", "	Fidelis, fiel, sinc ero	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fidél is	", "	Fiel. Variação d e Fidel	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fidênci o	", "	O  de fé, confia nte, fiel	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Fídias	", "	Econômico	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Fidípes	", "	Phidippis, greg o Pheidippídes, "fil ho de Fidi po"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# # ("	Fídipo	", "	Pheidíp pos: "pheído mai: poupar, e híppos: cavalo", "o que	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Fidon	", "	Tirano de Argos. Inventou a bal ança e ma ndou cunh ar moedas	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Fígaro	", "	Picaro, "velhaco, astuto,  maroto"	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-# ("	Figueira	", "	Lugar da figue iras	", "	Galeg o	", "	Extraído de Livro dos Nomes	"),
-# ("	Figueiredo	", "	Loc al ond e há mu itas figue iras	", "	Anti go portugu ês	", "	Extraído de Livro dos Nomes	"),
-# ("	Figueiró	", "	Figu eira pe quen a	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Figueiroa	", "	Figu eira pe quen a	", "	Galeg o	", "	Extraído de Livro dos Nomes	"),
-# ("	Filadelf o	", "	Amigo do ir mão	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Filaletes	", "	Phi lalethes,  "amigo d a verdad e"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Filareto	", "	Que am a a v irtude	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Filéas	", "	Que am a	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Filemão	", "	O  amigo, aquele que a ma, o am ante	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Filen o	", "	Phíla inos: "phílos: amigo, e aíne: louvar", "a migo do l ouvor"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Fileto	", "	Philetós, "d igno d e ser amado, amável"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# # ("	Filiberto	", "	Filibert: "filu: mu ito, e bert: ilustre,  brilhante", "muito	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Filinto	", "	Amigo	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Filipe	", "	Phi los-hi ppos, o que gosta d e cavalos	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Filira	", "	Philýra, "tília (p lanta) "	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Fílis	", "	Phyllis, grego Ph yllís, nome de u ma p lanta	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# # ("	Filodemo	", "	Phi lodemus, grego: Philódemos: "phílos: amigo, e demos:	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Filogônio	", "	Philos + me los, am igo + canto; amigo do canto	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# # ("	Filolau	", "	Philólaos: "p hílos:  amigo, e laós: povo",  amigo do povo"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Filólogo	", "	Phi lólogos, "amigo de falar "	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# # ("	Filomela	", "	Philoméla: "phíl os: amiga, e mélos: melodia", "a miga da	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Filomena	", "	Philoménes, "que continu a amiga, am ada"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Filomeno	", "	Amigo da m úsica, do canto; amável	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Fílon	", "	Phílo n, "amante"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Filonice	", "	Phi lóneike, feminino de Philóneik os (Filonico)	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Filonico	", "	Philóneikos, "que gosta de di scutir"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Filopólemo	", "	Philopólemos, "que gosta da g uerra "	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Filópono	", "	Phi lóponos: "amigo do trabal ho"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# # ("	Filotrato	", "	Phil'stratos: "philós: am igo, e stratós:  exército", "a migo do	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Filoteu	", "	Phi lótheos: "p hílos: amigo, e théos: Deus", "a migo de D eus",	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Filóxeno	", "	Phi lóxenos, "que gosta de estra ngeir o, hospitaleiro"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Fineu	", "	Phineús, nome de person alidades m itológicas	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Finis	", "	Conclusão	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fioravante	", "	Amigo das flor es, amigo da prud ência	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Firmato	", "	Firmatus, de firm atus, "firmado, fortificado (p ela fé cristã)"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Firmiano	", "	Firmianus, derivado de Fir mius, "firme"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Firmino	", "	Firm in, o forte, firm e	", "	Antigo francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Firmo	", "	Firm e, fiel	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Fitzgerald	", "	Filho de Geral do	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Fiúza	", "	Fidúcia, confia nça	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Flamínia	", "	Flamens, sopro, espírito	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Flamíni o	", "	Fla mens, sopr o, espírito	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Flausina	", "	Alegre, jovial	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Flavian	", "	Co m cab elos a marelos	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Flavina	", "	Flavius,  diminutivo de Flavius	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Flávio	", "	Flavius, de cabe los lour os ou fulvos	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fleury	", "	Florido	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Floberto	", "	Flod bert "frod, prudent: sensato, e bert: brilhante "	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# # ("	Flodoald o	", "	"wald: que governa, e frode: prudênc ia": "qu e governa	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Flora	", "	De usa da pri mavera	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Florence	", "	Que floresce	", "	Ing lês, franc ês	", "	Extraído de Livro dos Nomes	"),
-# ("	Florência	", "	Abundânc ia de flores	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Florêncio	", "	Florescentes, que floresc e	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Florenza	", "	Florênci a	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Flóreo	", "	Floreus, "coberto de flores,  florescente"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Florestano	", "	Da floresta da selva	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Flori	", "	Florido	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Florian o	", "	Da flor 	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Flori da	", "	Que está florescen do	", "	Português	", "	Extraído de Livro dos Nomes	"),
-# ("	Flóri da	", "	Esplêndido	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Flori do	", "	Que está floresc endo	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-# ("	Flóri do	", "	Espl êndido	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Flori ndo	", "	Florens, florescente	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Flori pes	", "	Alegre, amável	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Florismun do	", "	M undo das flores, protetor das flores	", "	Germ ânico, lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Florisval	", "	V ale das flores	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Floro	", "	Florido	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fogaça	", "	Pão, bolo gra nde	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-# ("	Folco	", "	V olk, povo; lenda do povo 	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Fonseca	", "	Fonte seca	", "	Antigo portu guês	", "	Extraído de Livro dos Nomes	"),
-# ("	Fontai nha	", "	Peq uena fonte	", "	Anti go portugu ês	", "	Extraído de Livro dos Nomes	"),
-# ("	Fontana	", "	Alargamento da fonte	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fontes	", "	Das fontes	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-# ("	Font oura	", "	Fonte aura, fonte d e ouro	", "	Antigo portu guês	", "	Extraído de Livro dos Nomes	"),
-# ("	Forbeck	", "	Ri beiro do pântan o	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Forco	", "	Phórk os, "de cabelo grisalho"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Formião	", "	Phor míon, no me d e filósofo da Grécia anti ga	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Forste r	", "	Gura da florestal	", "	Ing lês	", "	Extraído de Livro dos Nomes	"),
-# ("	Fortes	", "	Forte	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fortuna	", "	Deus da bo a ou má  sorte	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fortunata	", "	Afortun ada	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Fortunato	", "	Afortunad o, homem de sorte	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fóscoli	", "	Fusco, moreno	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Fragoso	", "	Lugar on de há mu itas fragas ou p edras	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-# ("	Franc es	", "	Franc isca	", "	Ing lês	", "	Extraído de Livro dos Nomes	"),
-# ("	Franc esca	", "	Francisc a	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Francis co	", "	Franc iscus, francês	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Franco	", "	Franc, homem livre	", "	Antigo francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Françoise	", "	Franc isca	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Frank enstein	", "	Roc ha dos francos	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Franklin	", "	Propri etário de u m alódio	", "	Inglês	", "	Extraído de Livro dos Nomes	"),
-# ("	Franquelim	", "	Frankli n	", "	Inglês	", "	Extraído de Livro dos Nomes	"),
-# ("	Franz	", "	Ho mem franc ês	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Fraterno	", "	Fratern us, "de irm ão, fraterno"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Frazão	", "	Adestrado e m longas ma rchas	", "	Português	", "	Extraído de Livro dos Nomes	"),
-# ("	Freda	", "	Pacífica	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Fredegá rio	", "	"frid, paz, e lança ", "lança d a paz"	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# # ("	Fredegund o	", "	"frid: paz, e gunt: combate nte", "o que co mbate pela	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Frede rico	", "	Fridurik, dirigente da paz	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# # ("	Frede svinda	", "	"Svinda, pronta, frede, para a paz ", ou "poderosa da	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Frediano	", "	Frid, paz. Variação d e Frederico	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Fredulfo	", "	"U lf: lobo, e fred: que pr otege"	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Fréia	", "	Freyja, irmã de Freyr	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Freita s	", "	Lugar on de há fragas, pedr as quebra das	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-# ("	Frias	", "	De á guas frias	", "	Português	", "	Extraído de Livro dos Nomes	"),
-# ("	Frida	", "	Variação de Elfrida	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Frido lino	", "	Pacífico	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Frieda	", "	Frid, "paz"	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Friné	", "	Phr yné, do gr ego Phr yne, "sapa"	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Frínico	", "	Phrynichos,  "sapo"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Froes	", "	De Froes	", "	Português	", "	Extraído de Livro dos Nomes	"),
-# ("	Fróis	", "	Frol, flor 	", "	antigo portug uês	", "	Extraído de Livro dos Nomes	"),
-# ("	Fomosin do	", "	Interpretad o como "distinto"	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Frontão	", "	Fronto ne, "que te m testa  grande "	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fronti n	", "	Que tem testa larg a	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Fronti niano	", "	Fronta nianus, "que tem  testa lar ga"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fronto	", "	Com ampla so brance lha	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Frota	", "	Flotte, da frota	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Frutuoso	", "	Que d á muitos frutos	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fruto	", "	Fructus,  de fructus, "fruto"	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Frutuosa	", "	Fructuosa, "que produz m uitos frutos"	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Fuad	", "	Coraç ão	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-# ("	Fuchs	", "	Rapos a	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Fúfio	", "	Fufius, nome de famí lia ro mana	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Fulberta	", "	Fulberta, feminino de Fulberto	", "	Alemão	", "	Extraído de Livro dos Nomes	"),
-# ("	Fulberto	", "	V olk: povo, e bert: brilhante	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Fulco	", "	"O que co mbate pelo povo"	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Fulgêncio	", "	Brilhante, que brilha, que fulge	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fulton	", "	Cidade das folhagens	", "	Escoc ês	", "	Extraído de Livro dos Nomes	"),
-# ("	Fúlvia	", "	Fulvia, fulva, loura	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Fúlvi o	", "	Fulvios,  fulvo,  louro	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Funchal	", "	Do Funch al	", "	Português	", "	Extraído de Livro dos Nomes	"),
-# ("	Furlan	", "	Friul ano	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Furqu im	", "	Forch eim, nome de um a cid ade da Alemanha	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Furtado	", "	Sobr enome de fa mílias br asileiras	", "	Português	", "	Extraído de Livro dos Nomes	"),
-# ("	Fusco	", "	Fuscus, "escuro "	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Gabael	", "	O me smo que Gabr iel	", "	Ara maico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gabín ia	", "	Gabinia, feminino de Gab inius	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Gabin o	", "	Natur al de Gabius	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Gabriel	", "	Enviado d e Deus	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Gad	", "	Feliz	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Gadelha	", "	Que te m mu ito cabe lo	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-# ("	Gaia	", "	Alegre, divertida	", "	Português	", "	Extraído de Livro dos Nomes	"),
-# ("	Gaio	", "	Gaius. Gaio e Gaia, nomes romanos anti gos, atribuídos ao n oivo e	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Gaioso	", "	Gayu, alegre	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Galatéia	", "	Leitosa, branc a como leite	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Galba	", "	Gord o	", "	Celta	", "	Extraído de Livro dos Nomes	"),
-# ("	Galdi	", "	Do Gal do	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Galdi no	", "	Dominador, poss uidor	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Galdo	", "	Der ivado de Geraldo	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Galeno	", "	Gael an, peque no ilustre;  grego: sereno, tranqüilo	", "	Irland ês	", "	Extraído de Livro dos Nomes	"),
-# ("	Galéria	", "	Feminino de Galério	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Galério	", "	Galer ius, nome de um  orad or romano	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Galhardo	", "	Ele gante, bizarro	", "	Português	", "	Extraído de Livro dos Nomes	"),
-# ("	Galiano	", "	Natural d a Gália	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Galileu	", "	Galil, reg ião	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Galin do	", "	Divertida serp ente	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Galli	", "	Origi nário da Gália	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Galo	", "	Gallus, habitante da Gália	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Galvão	", "	Gau vain, do galês G walwanus, falcão branc o	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Galve as	", "	Das Gal veas	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-# ("	Gam a	", "	Fêmea do gamo	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-# ("	Gam aliel	", "	Gamalyel, recom pensa de Deus	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Gamba rota	", "	Perna fraturada	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Gamboa	", "	Variedad e de ma rmelo	", "	Espan hol, portugu ês	", "	Extraído de Livro dos Nomes	"),
-# ("	Gam eiro	", "	Lu gar dos ga mos	", "	Português	", "	Extraído de Livro dos Nomes	"),
-# ("	Gândara	", "	Terreno esteri l, pedregos o	", "	Português	", "	Extraído de Livro dos Nomes	"),
-# # ("	Gando lfo	", "	"Gun dea: guerra, e w ulf: lobo", "l obo na gu erra, lobo	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Ganimedes	", "	Que ac onsel ha com  alegria	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Garcez	", "	Der ivado de Garci a	", "	Ara gonês	", "	Extraído de Livro dos Nomes	"),
-# ("	Garcia	", "	Orig em co ntroversa	", "	Ibér ico, basco, aragon ês	", "	Extraído de Livro dos Nomes	"),
-# ("	Gardênia	", "	Nome de um a flor 	", "	Bras ileiro	", "	Extraído de Livro dos Nomes	"),
-# ("	Garib	", "	Excêntrico, romântico	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-# ("	Garibald	", "	Príncipe da g uerra	", "	Lati m, teutô nico	", "	Extraído de Livro dos Nomes	"),
-# ("	Garibaldi	", "	Que m aneja a la nça com  valentia	", "	Ítalo-ger mano	", "	Extraído de Livro dos Nomes	"),
-# ("	Garnier	", "	E xército de defes a	", "	Germ ânico, francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Garry	", "	Portador de l ança	", "	Inglês	", "	Extraído de Livro dos Nomes	"),
-# ("	Garret	", "	Lug ar de refúgio, torre de vigia	", "	Inglês	", "	Extraído de Livro dos Nomes	"),
-# ("	Garrido	", "	Elegante, v istoso	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-# ("	Gaspa r	", "	Kans bar, tesouro	", "	Pers a	", "	Extraído de Livro dos Nomes	"),
-# ("	Gast aldi	", "	Administrador d e uma região	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Gast ão	", "	Gasco n, nascido n a Gasco nha, o país dos bascos	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Gaudência	", "	Fem inino de Gaud êncio	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Gaudênci o	", "	Que se regoz ija	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Gaudian o	", "	Co ntente	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Gavino	", "	Gavinus, de gavia,  "gaivota".  Ou, do ger mânico Ga win,	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Gayne	", "	Proveitoso	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gedeão	", "	Gede hon, o quie desped aça, o matador	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Geisel	", "	Fiador, refém, criador d e cabras	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gelásio	", "	Ghels o, sorri dente	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Gelsius	", "	O  sorridente	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Gelert	", "	V igoroso	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gélio	", "	Gellius, no me d e família da Ro ma anti ga	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Gelmiro	", "	Alegre e fam oso	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gem a	", "	Gem ma, pedra prec iosa	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Geminiano	", "	Que g eme; ou de geminus, "gêmeos"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Gemínio	", "	Geminius, "g êmeo"	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Genar a	", "	Gennara, o me smo que Jan uária	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Genarina	", "	Gennari na, diminutivo de Gennar a	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Genarino	", "	Genn arino, di minutivo  de Gen naro	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Genaro	", "	Der ivado de Január io	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Gêncio	", "	Genti us, "gente "	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Generoso	", "	No bre, corajoso	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Genésia	", "	Criadora	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Genésio	", "	O  que nasce, relativo ao nasci mento	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Genito	", "	O  mesmo qu e Genésio	", "	itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Genil do	", "	Aglutinação de Geni e Ni ldo	", "	Brasil eiro	", "	Extraído de Livro dos Nomes	"),
-# ("	Genival	", "	Nascid o para governar 	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Genoveva	", "	Tecelã de grinalda enfe itiçada	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gentil	", "	Gens, evidente	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Genuí no	", "	Nativo, verdad eiro	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Genulf o	", "	Lobo de raç a	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	George	", "	Faze ndeir o. Form a rom ena de Jorge	", "	Grego, latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Georgete	", "	Geor gette,  feminino di minutivo  de Geor ges	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Georgio	", "	Geór gios, "cu ltivador , agricu ltor"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Geraldo	", "	O que g overna co m a la nça	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gerardo	", "	Gerhard: "h ard: forte", e "ger: com a la nça"	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# # ("	Gerbe rto	", "	"Ger: lança", "berth: ilustre ", "brilhante ou fam oso na	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gerda	", "	Fina co mo u ma vara,  esbelta	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Geremaro	", "	Afam ado n a lança	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gerião	", "	Geryon, "de fala har moniosa"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# # ("	Gerlinde	", "	"Ger: lança", e "linde: serpente ", "lança em, form a de	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Germano	", "	Natura l da Germ ânia	", "	Germ ânico, celta	", "	Extraído de Livro dos Nomes	"),
-# ("	Germinal	", "	Germe, gér men	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Gerólamo	", "	Gerol amo ou Girola mo, o m esmo qu e Jerôni mo	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Gerôncio	", "	Velho	", "	Grego, latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Gersam	", "	Guer , "hosped e"	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gerson	", "	Peregr ino, estrange iro	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gertrudes	", "	Força da l ança, feiticeir a da lança	", "	Ger mânico, latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Gervásio	", "	Impetu oso na lanç a, potente no combate	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Geslinda	", "	Serp ente de nobr eza, guerreir a	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gesualdo	", "	Gisal + w ald, refém + rein ar; o refé m do rei, devotado	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gesuíno	", "	Puro, legíti mo	", "	Português	", "	Extraído de Livro dos Nomes	"),
-# ("	Getúlia	", "	Feminino de Getú lio	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Getúli o	", "	Natura l de Getú lia, país da África	", "	Latim, Fenício	", "	Extraído de Livro dos Nomes	"),
-# ("	Giani	", "	Abreviação de Giovani, forma ita liana de João	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Giann i	", "	O me smo que Gia ni	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Gibrail	", "	V indo do m ar, de Gibr altar	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gideo n	", "	O ceifador 	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Gil	", "	Gill es, cheio de juventude	", "	Antigo Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Gilbert	", "	Promessa bril hante	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gilberto	", "	Gisel beorht, refém br ilhante	", "	Angl o-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Gilda	", "	Valorosa	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gildão	", "	Ghildhon, "forte, robusto"	", "	Se mítico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gildásio	", "	Gild, "valor "	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gilipo	", "	Gylippos, g yliós: "espéc ie de saco usa do por sol dados ", e	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Gilmar	", "	Espa da brilhante	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gilso n	", "	Filho de Gil, Gilberto	", "	Ing lês	", "	Extraído de Livro dos Nomes	"),
-# ("	Ginete	", "	Hi pocorístico francês de Geneviève 	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Ginevra	", "	Gwinever, "tecelã"	", "	Céltic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Gioco nda	", "	Giocond a, alegre, sorrid ente	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Giorg io	", "	Jorge	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Girão	", "	Giron, retalh o	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Giscon	", "	Gískon, "debatedor "; ou hiskon, "vigoroso "	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Gisela	", "	Refém, pr isioneira de g uerra, bastão, vara	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Giselda	", "	Guerr eira de n obreza	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gisele	", "	O  mesmo q ue Gisela	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Glade	", "	Polido, brilhante	", "	Ing lês	", "	Extraído de Livro dos Nomes	"),
-# ("	Gladir	", "	Jovem lo ura	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gladys	", "	Gladíol o, flor; ing lês: princes a	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gladney	", "	Polido	", "	An glo-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Glafira	", "	Afável, civiliza do	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Glase r	", "	Vidrac eiro	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gláuber	", "	Crente, aquele que te m fé	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gláucio	", "	Verde-azul ado, luze nte	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Glauco	", "	Verde-azul ado	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Gleide	", "	Princ esa	", "	Celta	", "	Extraído de Livro dos Nomes	"),
-# ("	Glena	", "	Do vale	", "	Gaé lico	", "	Extraído de Livro dos Nomes	"),
-# ("	Glêni o	", "	Vale	", "	Celta	", "	Extraído de Livro dos Nomes	"),
-# ("	Glice	", "	Doc e, afável,  amável	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Glícera	", "	Glycera,  "doce "	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Glicéria	", "	Amável, doce	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Glicério	", "	Amável,  doce	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Glicí nia	", "	Que tem doç ura	", "	Grgo	", "	Extraído de Livro dos Nomes	"),
-# ("	Glíco n	", "	Gl ykon , "doce, agradável"	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Glória	", "	Bem-aventura da	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Glorian(a)	", "	Glorian, der ivado do l atim glória	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Goar	", "	Goar: "haris, senhor", e gavua:  "da região"	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Godesin do	", "	Sin do: "caminho", e Gode: "de De us"	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Godinho	", "	Bom , bonito	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Godiva	", "	Presente d e Deus, divindad e	", "	Angl o-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Godofredo	", "	Gold: "Deus ", e Frie d: "paz". Paz de Deus	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Godolias	", "	Godo liáh, "grandeza de Ja vé"	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Goduíno	", "	Uin, win: "amigo", e God: "Deus"	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Goes	", "	Ca minho da re gião	", "	Visigodo	", "	Extraído de Livro dos Nomes	"),
-# ("	Goiana	", "	Nome de uma pla nta semelhante ao anil	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Goiás	", "	Gente da mesma raça, gente igual	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Golda	", "	No me feminino: "o uro"	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Goldmann	", "	Joalheiro, ourives	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Goldwin	", "	Amigo do ouro	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Golias	", "	Goliath, passa gem, m udança	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gomide	", "	Gum i, homem	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gonçalo	", "	Gundis alvo, "invulnerável na guerra "	", "	Visigodo	", "	Extraído de Livro dos Nomes	"),
-# ("	Gondolfo	", "	Gondulf: Olf: "lobo", e Gond: "da gu erra"	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gontrão	", "	Gunthra mn: Gunthis: "combate ", e Hr amn: "corvo"	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gordian o	", "	Gordi anus, derivado de Gordi us, cidade da Frígia	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Gordi o	", "	Górdi os, nome de um rei da Frígia e de um a cida de desse p aís	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Goreti	", "	Mártir Maria Goretti	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Gorki	", "	Amargo m ontanhês	", "	Russo	", "	Extraído de Livro dos Nomes	"),
-# ("	Gotardo	", "	Forte para D eus	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Goulart	", "	Gritad or, guloso, comedor	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Gouveia	", "	Nome de u ma lo calidade e m Portug al	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-# ("	Govin da	", "	Supre ma felicidade	", "	Sânscrito	", "	Extraído de Livro dos Nomes	"),
-# ("	Graça	", "	Graça, dom	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Grace	", "	Graça	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Graciema	", "	Saída do so l	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Graciete	", "	Amável, graciosa	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Gracila	", "	Esbe lta, grac iosa	", "	Espera nto	", "	Extraído de Livro dos Nomes	"),
-# ("	Gracílio	", "	Elegante, grac ioso	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Grácio	", "	Gratius: agr adável,  agradec ido	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Graco	", "	Muito antigo, tend ilhão	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Grajaú	", "	Pássar o comedor	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Grassi	", "	Gordo	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Gravataí	", "	Rio dos gr avatás	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Gravino	", "	Barranco, desp enha deiro	", "	Itali ano	", "	Extraído de Livro dos Nomes	"),
-# ("	Grazia	", "	Gratia, grac iosa	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Graziela	", "	Grazia, graça	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Gregory	", "	Vigilante	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Gretchen	", "	V indo de Grete	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Grimaldo	", "	Que governa com  o elmo	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Griselda	", "	Greis + held, velha + heró i; velha heroín a	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Grof	", "	Rude	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Grou	", "	Nome de u ma ave	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-# ("	Guacira	", "	Talo aguç ado, cortante	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guadalu pe	", "	Ci dade d o México	", "	Me xicano	", "	Extraído de Livro dos Nomes	"),
-# ("	Guaiani	", "	Mulher v elha	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guaíba	", "	Águ a da baía	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guaicuru	", "	Veloz corre dor	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guaíra	", "	Intransitável,  não se pode atravessar 	", "	Guaran i	", "	Extraído de Livro dos Nomes	"),
-# ("	Guairá	", "	Abreviatura de Guairac á	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guairac á	", "	Lobo d a água	", "	Guara ni	", "	Extraído de Livro dos Nomes	"),
-# ("	Guajará	", "	Penc a de frutas, no me de u ma árvore	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Gualberto	", "	Ilustre e m força	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Guanabara	", "	Braço d e mar	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guanabarin o	", "	Relativo a Guanab ara	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guanand i	", "	Nome de u ma árvore	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guaporé	", "	Cacho eira no ca mpo	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guara ci	", "	O criador , o sol (nome de ho mem)	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guara ciaba	", "	Cabelos louros, cabe los de sol	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guara miranga	", "	O me smo que Guar apira nga	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guarani	", "	Guerrear , guerreir o	", "	Guara ni	", "	Extraído de Livro dos Nomes	"),
-# ("	Guarantã	", "	Madeira co mprida, madeira dura	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guaráobi	", "	Verde-az ulado	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guarapa ri	", "	Garça v ermelha	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guarapiranga	", "	Guará vermelh o	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guarapuava	", "	O rumor dos pássaros	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guaraqueçaba	", "	O ninho das garças	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guara rapes	", "	O estro ndo dos tam bores	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guaratinguetá	", "	Garç as brancas	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guaratuba	", "	Lugar o nde se junta m as garç as	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guaru	", "	Aquele qu e come	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guarujá	", "	Comedores, barrigudos	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guarulh os	", "	Dos g uarus	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guayr	", "	Filh o	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guaytí	", "	Ninho de pássar o	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guataç ara	", "	Andarilho, viajante	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guaxupé	", "	Abelha ne gra	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Guedes	", "	Sobren ome portugu ês	", "	Gal ego	", "	Extraído de Livro dos Nomes	"),
-# ("	Guercino	", "	Guerci o, estráb ico, vesgo	", "	Italiano	", "	Extraído de Livro dos Nomes	"),
-# ("	Guerda	", "	Esbe lta, fina co mo u ma vara	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Guerino	", "	W arin, defensor 	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Guido	", "	W ido, floresta, bosqu es	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Guilherm e	", "	O  que protege, o protetor 	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Guimarã es	", "	Wigmar, cavalo de com bate	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Guiomar	", "	Glori osa, ilustre	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Gunter	", "	Exército guerre iro	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Habib	", "	Amor, querido	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-# ("	Hadassa	", "	M irto, murta	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hagite	", "	Nasci da nu ma festa	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Haidê	", "	Aidios, honrada; modesta	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Hala	", "	Doçura	", "	Ára be	", "	Extraído de Livro dos Nomes	"),
-# ("	Halina	", "	Halo, qu e tem sal	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Hamed	", "	Louvado	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-# ("	Hamílcar	", "	Han-me lkar, graça de H ércules	", "	Púnic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Hamilto n	", "	Hamilton, al deia fortifica da, aldeia da mo ntanh a	", "	Ing lês	", "	Extraído de Livro dos Nomes	"),
-# ("	Hamlet	", "	Aldeiazinh a	", "	Inglês	", "	Extraído de Livro dos Nomes	"),
-# ("	Haniré	", "	Suco de an anás, bebida forte  com an anás	", "	Nambiquara	", "	Extraído de Livro dos Nomes	"),
-# ("	Hansel	", "	Graça de D eus	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Harold o	", "	Haruald, chefe de exército, com andante de tropa	", "	Esca ndinavo	", "	Extraído de Livro dos Nomes	"),
-# ("	Harrison	", "	Filho de Harr y	", "	Ing lês	", "	Extraído de Livro dos Nomes	"),
-# ("	Hasaka	", "	Palhaço	", "	Sâ nscrito	", "	Extraído de Livro dos Nomes	"),
-# ("	Hasin	", "	Ris onho	", "	Sânscrito	", "	Extraído de Livro dos Nomes	"),
-# ("	Hassan	", "	Bom, b onito	", "	Árabe	", "	Extraído de Livro dos Nomes	"),
-# ("	Havilah	", "	Che io de tesouros	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Haydée	", "	Aider, ajudar, auxili ar, auxilia dora	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Hazael	", "	Deus v iu. Foi rei da Síria	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Haziel	", "	M inha visão é De us	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hebe	", "	He be, juventud e, mocidade; era a de usa da juventude	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Hêber	", "	Co mpanhe iro	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hector	", "	Que se gura firm emente	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Heda	", "	Luta	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hedi	", "	Hedy's, suave , doce	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Hedviges	", "	Guerreir a feliz, a guerre ira	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Heida	", "	Luta	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Heitor	", "	Hektor , o que p ossui, possu idor, o gu ardad or	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Heládi o	", "	De H élade, Gréci a Antig a	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Hélder	", "	Her der, forte,  duro	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hele	", "	Filh a de Atamas, rei de Tebas	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Helen	", "	He lena	", "	Inglês	", "	Extraído de Livro dos Nomes	"),
-# ("	Helena	", "	He lene, tocha, luz	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Heleno	", "	Masculi no de He lena. Perso nage m mitológico	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Helga	", "	Halag, sublime, sagra da, religiosa	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Heli	", "	Altíssi mo, Deus	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hélio	", "	Hé lios, sol	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Heliodoro	", "	Dádiva do sol	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Hell	", "	Inferno	", "	Inglês	", "	Extraído de Livro dos Nomes	"),
-# ("	Helma	", "	Helm, elmo proteçã o	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Helmar	", "	Guerreir o famoso	", "	Sânscrito	", "	Extraído de Livro dos Nomes	"),
-# ("	Helmuth	", "	Alegre pr oteção	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Heloísa	", "	Helóise, variaçã o de Luísa	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Helvécio	", "	Natur al da He lvécia, Suíça, branco, luze nte	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Hélvio	", "	Castanh o, pardo, escuro	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Hemet ério	", "	Amor	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Henderson	", "	Filho e xcelente	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Henoque	", "	Inic iado, consa grado	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Henri	", "	Henrique	", "	Francês	", "	Extraído de Livro dos Nomes	"),
-# ("	Henrietta	", "	Enr iqueta	", "	Ing lês	", "	Extraído de Livro dos Nomes	"),
-# ("	Henriq ue	", "	Heinrik, prínc ipe pod eroso	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hera	", "	Hera, senhor a. Hera, a deusa Jun o, esposa de Júp iter	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Herácles	", "	Filh o de Hera	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Heráclio	", "	Co nsagra do a Hércules	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Heráclito	", "	Proteg ido por Hérc ules	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Herádio	", "	De Hera	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Herbert	", "	Heriberaht,  combatente bril hante, guerre iro gl orioso	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hercília	", "	Or valho	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Herculano	", "	Dedicado a Hérc ules; de Hérc ules	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Hércules	", "	Herakl es. Deriva do verbo hercere, fechar , cerc ar	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Heribald o	", "	Audacioso d o exército	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Heriberto	", "	Heri + bert (exército + brilhante); soldado ilustre,	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hermano	", "	Irmão. Também variante d e Armando	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-# ("	Hermeneg ildo	", "	O  que faz sacr ifício aos deuses	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hermengarda	", "	Aquela que proteg e	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hermínio	", "	Grande, o forte,  o po deroso	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hermione	", "	O  que oculta, que g uarda	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Hermógenes	", "	De boa saú de, sadio, o gera do de Her mes	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Herodes	", "	Dragão e m fogo	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Heródot o	", "	Da do por Juno	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Heron	", "	Herói	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Herta	", "	A divinda de da terra.  A deusa Terra	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hesíoso	", "	Guia	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Hespéria	", "	Hesper os, o qu e segue a estrel a vespertin a, o oci dente	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Hidalgo	", "	Fidalgo	", "	Espan hol	", "	Extraído de Livro dos Nomes	"),
-# ("	Hiero	", "	Hieros, sagr ado	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Hiérocles	", "	Glóri a sagrad a	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Higin o	", "	De b oa saúde, sad io	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Hilária	", "	Alegre, jovial	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Hilário	", "	Hi larius, alegre	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Hilda	", "	Hi lde, donz ela de bata lha	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hildeberto	", "	Gran de senh or	", "	Celta	", "	Extraído de Livro dos Nomes	"),
-# ("	Hildebrando	", "	Hildebran d, espada de g uerra, espad a de com bate	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hildefonso	", "	Alerta para o co mbate. Variação de Ildefo nso	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hildegardo	", "	O que cu ida dos co mbatentes	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hilderico	", "	Hilde + rihhi, com bate + poderoso, poderos o na guerr a	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hildema r	", "	Célebre na gu erra	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hildo n	", "	Guerr eiro, ald eia da co lina	", "	An glo-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Hilma r	", "	O que co mbate com esc udo	", "	Ger mânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hilton	", "	H yltum, da mo ntanha	", "	Angl o-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Himério	", "	Gramátic o e sofista gr ego	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Hipócrat es	", "	O  que tem a força de u m cavalo	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Hipól ito	", "	Aquele que des atrela os ca valos	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Hipurina	", "	Donzela, flor, fruta	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Hiram	", "	Hira m, o ma is no bre	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hiran	", "	M eu irmão é excelso	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hiren	", "	Gavião pequeno	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Hiroíto	", "	Ho mem (hito) grande (h iro)	", "	Japonês	", "	Extraído de Livro dos Nomes	"),
-# ("	Hirosh i	", "	Generos o	", "	Japonês	", "	Extraído de Livro dos Nomes	"),
-# ("	Hisok a	", "	Reservado	", "	Japonês	", "	Extraído de Livro dos Nomes	"),
-# ("	Hitler	", "	Lavrador , cabaneiro, o da choça, pequeno agr icultor 	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hoffman	", "	Atendente de corte rea l	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hofmann	", "	Ho mem da quinta, ser vente de u ma quinta, lavrador 	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Holanda	", "	Nascid o na Hol anda	", "	Portug uês	", "	Extraído de Livro dos Nomes	"),
-# ("	Holofernes	", "	Capitão forte	", "	Assírio	", "	Extraído de Livro dos Nomes	"),
-# ("	Homero	", "	Ho meros, refém, segur ança	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Honorata	", "	Digna de honr as	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Honorato	", "	Aquele que me rece ser h onrad o	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Honorico	", "	Hu nn + rihhi, urso novo + poderoso; pod eroso co mo u m	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Honorina	", "	Que rec ebe ho nras	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Honorin da	", "	Digna de h onra	", "	Espera nto	", "	Extraído de Livro dos Nomes	"),
-# ("	Honório	", "	Honor, honra	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Honorius	", "	Honorável	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Horácio	", "	Horatius, relativo às horas	", "	Grego, latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Hortênsia	", "	Horte nsia, a que cultiva o jardim ou h orta	", "	Latim	", "	Extraído de Livro dos Nomes	"),
-# ("	Hortênsio	", "	O da horta, jard ineiro	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Hosana, Hosanã	", "	Salve !	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hostílio	", "	Hostil, adversário	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Huáscar	", "	Cor da de ouro, corda	", "	Quíchua	", "	Extraído de Livro dos Nomes	"),
-# ("	Huberto	", "	Hu g + bert, inteligênc ia + brilhante;  de inteligênci a	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Hugo	", "	Ajuizado	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Humberto	", "	Hunberaht,  espírito  brilhante	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Humphrey	", "	Gigante que prote ge	", "	An glo-saxão	", "	Extraído de Livro dos Nomes	"),
-# ("	Hurassí	", "	Nuvem	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Hypséa	", "	A esperta.  Nome da mã e de Medéia	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Iabá	", "	Orgul hoso, arroga nte	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Iacê	", "	Poderos a telepati a	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Iaci	", "	Lua. É um a linda jovem  indígen a da len da do ma te	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Iaé	", "	Na mitologia in dígena, é a irm ã (lua) de Kuat (sol)	", "	Ca maiurá	", "	Extraído de Livro dos Nomes	"),
-# ("	Iagê	", "	Tem qu alidade d e telepatia	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Ialê	", "	Mulher fa vorita	", "	Afro- brasileiro	", "	Extraído de Livro dos Nomes	"),
-# ("	Iamana	", "	Flauta, instrum ento musical	", "	Par eci	", "	Extraído de Livro dos Nomes	"),
-# ("	Iami	", "	Minha mã e	", "	Afro- brasileiro	", "	Extraído de Livro dos Nomes	"),
-# ("	Ian	", "	A graç a de Deus	", "	Hebraic o	", "	Extraído de Livro dos Nomes	"),
-# ("	Iandeya ra	", "	Nosso sen hor Jesus Cristo	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Iapuama	", "	Cheiros o, resce nder	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Iara	", "	Ig: "á gua", e iar a: "senhor a"; senhor a das águas; Iara é a beleza	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Iatemin	", "	Mãe- de-santo, com  mais de dez an os na direção de	", "	Afro- brasileiro	", "	Extraído de Livro dos Nomes	"),
-# ("	Iayí	", "	Gota de orvalho	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Ibá	", "	Fruta	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Ibaíra	", "	Árvore d o mel	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Ibald	", "	Nobre arq ueiro	", "	Teutôn ico	", "	Extraído de Livro dos Nomes	"),
-# ("	Ibañez	", "	De Ibañes	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-# ("	Iberê	", "	Nome de person agem da óp era "O Escravo", de Car los Gom es	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Ibiã	", "	Ladeira, barr anco	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Ibiacy	", "	Terra bo a	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Ibiapaba	", "	Chapad a, terra des moronada	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Ibiap ina	", "	Terra se m vegetaç ão, terra pe lada	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Ibinayaya	", "	Cobra d'ág ua	", "	Guaran i	", "	Extraído de Livro dos Nomes	"),
-# ("	Ibiracy	", "	Mão  da árvore	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Ibiri	", "	O  prematuro	", "	Afro- brasileiro	", "	Extraído de Livro dos Nomes	"),
-# ("	Íbis	", "	Ave sagrada	", "	Egito	", "	Extraído de Livro dos Nomes	"),
-# ("	Ibotira	", "	Flor , pé de flor	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Ibsen	", "	Filho de Ib	", "	Esca ndinavo	", "	Extraído de Livro dos Nomes	"),
-# ("	Ícaro	", "	De orig em mitológica. Ícaro fugi u da ilha de Creta usan do asas	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Icora cy	", "	Raio de sol	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Ida	", "	Ida: diligente, industrioso; ou (Angl o-saxão) - Eada: feliz	", "	Teutônico	", "	Extraído de Livro dos Nomes	"),
-# ("	Idália	", "	Que viu o Sol	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Idalino	", "	Serp ente ativa	", "	Germ ânico	", "	Extraído de Livro dos Nomes	"),
-# ("	Idálio	", "	Sol fla mejante	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Idomeu	", "	Espírito  vidente	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Idúlio	", "	Idulium, no me da ví tima que se i molava a Júp iter no dia dos Idos	", "	Lati m	", "	Extraído de Livro dos Nomes	"),
-# ("	Ieda	", "	Fa vo de me l	", "	Hebr aico	", "	Extraído de Livro dos Nomes	"),
-# ("	Ifigên ia	", "	Com vigor , com força	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Ifigên io	", "	De bom nasci mento	", "	Grego	", "	Extraído de Livro dos Nomes	"),
-# ("	Iglesias	", "	Igrej as	", "	Esp anho l	", "	Extraído de Livro dos Nomes	"),
-# ("	Igor	", "	Ingvar , defensor d e Ingo, divindade ger mânica	", "	Esca ndinavo	", "	Extraído de Livro dos Nomes	"),
-# ("	Iguaba	", "	Lugar ond e se bebe ág ua	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Iguaçu	", "	Águ a grande	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Iguana	", "	Lagarto	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Iguapé	", "	Seio d'água	", "	Tupi	", "	Extraído de Livro dos Nomes	"),
-# ("	Marcos	", "	protegid o de ma rte (o deus da gu erra)	", "	Marcus	", "	Extraído de Livro dos Nomes	")
+# Os nomes vêm de dados/nomes.csv.gz (checksum conferido antes da leitura) e
+# são inseridos numa única transação (nomes já existentes são ignorados)
+lidos, inseridos = carregar_sqlite(dados_nomes.ler())
 
-    
-]
-
-# Conecta ao banco
-conn = get_connection()
-cursor = conn.cursor()
-
-# Insere os nomes no banco
-for nome, significado, origem, motivo in nomes:
-    # Verifica se o nome já existe para não duplicar
-    cursor.execute("SELECT id FROM nomes WHERE nome = ?", (nome,))
-    if cursor.fetchone() is None:
-        cursor.execute("""
-            INSERT INTO nomes (nome, significado, origem, motivo_escolha, pesquisas)
-            VALUES (?, ?, ?, ?, 0)
-        """, (nome, significado, origem, motivo))
-
-conn.commit()
-conn.close()
-
-print("Banco populado com sucesso!")
+print(f"Banco populado com sucesso! {inseridos} nome(s) novo(s) de {lidos} lido(s).")
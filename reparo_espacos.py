@@ -0,0 +1,310 @@
+"""
+Reparo dos espaços que a extração do PDF inseriu no meio das palavras
+("Hebr aico", "resp eito", "M eu ser vo é De us").
+
+    python reparo_espacos.py "Sobr enome d e"        # mostra o texto reparado
+    python reparo_espacos.py --migrar --sqlite nomes.db [--simular]
+    python reparo_espacos.py --migrar [--simular]    # PostgreSQL (DB_*)
+
+O vocabulário (com a frequência de cada palavra) vem do livro_dos_nomes.txt,
+que não tem os espaços quebrados, e fica numa trie. Em cada linha, os
+espaços só podem ser removidos, nunca inseridos: a programação dinâmica
+escolhe, entre os agrupamentos de fragmentos vizinhos que formam palavras da
+trie, o de maior probabilidade (unigramas), com um custo por espaço removido.
+Pontuação solta ("feliz .", "( Waldomar)") é colada à palavra vizinha.
+"""
+import os
+import re
+import sys
+import math
+import argparse
+from collections import Counter
+
+ARQUIVO_VOCABULARIO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'livro_dos_nomes.txt')
+# Fragmentos juntados no máximo por palavra ("Anglo-franc o-ale mão" = 3).
+MAX_FRAGMENTOS = 4
+# Probabilidade a priori de um espaço ser espúrio (custo de removê-lo).
+P_ESPACO_ESPURIO = 0.03
+
+_PONTUACAO = '()[]{}"“”\'‘’.,;:!?+*/'
+_FECHAMENTO = '.,;:!?)]”'
+_PALAVRA = re.compile(r"[^\W\d_](?:[\w'’-]*\w)?")
+_FIM = None  # chave da trie que guarda a frequência da palavra
+
+
+class Trie:
+    """Trie de caracteres (dicts aninhados) com a frequência de cada palavra."""
+
+    def __init__(self):
+        self.raiz = {}
+        self.total = 0
+
+    def inserir(self, palavra, frequencia=1):
+        no = self.raiz
+        for letra in palavra:
+            no = no.setdefault(letra, {})
+        no[_FIM] = no.get(_FIM, 0) + frequencia
+        self.total += frequencia
+
+    def andar(self, no, texto):
+        """Desce pela trie a partir de 'no'; None se o caminho não existe."""
+        for letra in texto:
+            no = no.get(letra)
+            if no is None:
+                return None
+        return no
+
+    def frequencia(self, palavra):
+        no = self.andar(self.raiz, palavra)
+        return no.get(_FIM, 0) if no is not None else 0
+
+
+def _colar_pontuacao(tokens):
+    """Cola ao vizinho os tokens que são só pontuação: "fugir ." -> "fugir.",
+    "( Waldomar)" -> "(Waldomar)", '"feliz "' -> '"feliz"'."""
+    saida, aspas, abrir = [], 0, False
+    for token in tokens:
+        if abrir:
+            saida[-1] += token
+            abrir = False
+        elif (saida and not token.strip(_PONTUACAO)
+              and (token[0] in _FECHAMENTO or (token[0] == '"' and aspas % 2))):
+            saida[-1] += token
+        else:
+            saida.append(token)
+            abrir = token in ('(', '“') or (token == '"' and aspas % 2 == 0)
+        aspas += token.count('"')
+    return saida
+
+
+def _separar(token):
+    """(pontuação inicial, núcleo, pontuação final) de um token."""
+    nucleo = token.lstrip(_PONTUACAO)
+    inicio = token[:len(token) - len(nucleo)]
+    nucleo_final = nucleo.rstrip(_PONTUACAO)
+    return inicio, nucleo_final, nucleo[len(nucleo_final):]
+
+
+class Reparador:
+    """Junta fragmentos de palavras quebradas usando a trie do vocabulário."""
+
+    def __init__(self, frequencias):
+        self.trie = Trie()
+        for palavra, frequencia in frequencias.items():
+            self.trie.inserir(palavra, frequencia)
+        total = max(self.trie.total, 1)
+        self._log_total = math.log(total)
+        self._custo_juntar = -math.log(P_ESPACO_ESPURIO)
+        self._custo_manter = -math.log(1 - P_ESPACO_ESPURIO)
+
+    @classmethod
+    def de_arquivo(cls, caminho=ARQUIVO_VOCABULARIO):
+        frequencias = Counter()
+        with open(caminho, encoding='utf-8') as arquivo:
+            for linha in arquivo:
+                frequencias.update(p.casefold() for p in _PALAVRA.findall(linha))
+        return cls(frequencias)
+
+    def _custo_palavra(self, frequencia, tamanho):
+        if frequencia:
+            return self._log_total - math.log(frequencia)
+        # Desconhecida: fica mais improvável quanto maior (modelo de Norvig).
+        return self._log_total + (tamanho - 1) * math.log(10)
+
+    def reparar_linha(self, linha):
+        tokens = _colar_pontuacao(linha.split())
+        if len(tokens) < 2:
+            return ' '.join(tokens)
+        partes = [_separar(t) for t in tokens]
+        n = len(tokens)
+        # melhor[i] = (custo, início do último grupo) para os tokens [0, i).
+        melhor = [(0.0, 0)] + [(math.inf, 0)] * n
+        for i in range(n):
+            custo_ate_i = melhor[i][0]
+            inicio, nucleo, fim = partes[i]
+            # O token sozinho (sempre possível).
+            custo = custo_ate_i + self._custo_palavra(
+                self.trie.frequencia(nucleo.casefold()), len(nucleo)) + self._custo_manter
+            if custo < melhor[i + 1][0]:
+                melhor[i + 1] = (custo, i)
+            if not nucleo or fim:
+                continue
+            # Grupos i..j que formam uma palavra conhecida.
+            no = self.trie.andar(self.trie.raiz, nucleo.casefold())
+            for j in range(i + 1, min(n, i + MAX_FRAGMENTOS)):
+                inicio_j, nucleo_j, fim_j = partes[j]
+                # Fragmento com pontuação antes ou com maiúscula inicial
+                # ("Rosa Bela") marca o começo de outra palavra.
+                if no is None or inicio_j or not nucleo_j or nucleo_j[0].isupper():
+                    break
+                no = self.trie.andar(no, nucleo_j.casefold())
+                if no is None:
+                    break
+                if no.get(_FIM):
+                    custo = (custo_ate_i + self._custo_palavra(no[_FIM], 0)
+                             + (j - i) * self._custo_juntar + self._custo_manter)
+                    if custo < melhor[j + 1][0]:
+                        melhor[j + 1] = (custo, i)
+                if fim_j:
+                    break
+        # Reconstrói os grupos do fim para o começo.
+        palavras, fim_grupo = [], n
+        while fim_grupo > 0:
+            inicio_grupo = melhor[fim_grupo][1]
+            palavras.append(''.join(tokens[inicio_grupo:fim_grupo]))
+            fim_grupo = inicio_grupo
+        return ' '.join(reversed(palavras))
+
+    def reparar(self, texto):
+        """Repara cada linha do texto (os espaços repetidos viram um só)."""
+        if not texto:
+            return texto
+        return '\n'.join(self.reparar_linha(linha) for linha in texto.split('\n'))
+
+
+_padrao = None
+
+
+def reparador():
+    """Reparador com o vocabulário do livro_dos_nomes.txt (carregado uma vez)."""
+    global _padrao
+    if _padrao is None:
+        _padrao = Reparador.de_arquivo()
+    return _padrao
+
+
+def reparar(texto):
+    return reparador().reparar(texto)
+
+
+# --------------------------------------------------------------------------
+# Migração: limpa os registros já gravados (SQLite e PostgreSQL)
+# --------------------------------------------------------------------------
+
+def _alteracoes(linhas):
+    """(id, nome, significado, origem) reparados, só das linhas que mudam."""
+    rep = reparador()
+    for id_, nome, significado, origem in linhas:
+        novos = tuple(rep.reparar(v) if v else v for v in (nome, significado, origem))
+        if novos != (nome, significado, origem):
+            yield (id_,) + novos
+
+
+def migrar_sqlite(caminho, simular=False):
+    """Repara nome/significado/origem no SQLite. Retorna (alterados, fundidos).
+
+    Se o nome reparado já existe em outro registro (UNIQUE), o registro
+    quebrado é removido e suas pesquisas vão para o existente.
+    """
+    import sqlite3
+
+    conn = sqlite3.connect(caminho, timeout=10)
+    try:
+        linhas = conn.execute("SELECT id, nome, significado, origem FROM nomes").fetchall()
+        alteracoes = list(_alteracoes(linhas))
+        existentes = {nome: id_ for id_, nome, _, _ in linhas}
+        nome_atual = {id_: nome for id_, nome, _, _ in linhas}
+        fundidos = 0
+        with conn:
+            for id_, nome, significado, origem in alteracoes:
+                if existentes.get(nome_atual[id_]) == id_:
+                    del existentes[nome_atual[id_]]
+                outro = existentes.get(nome)
+                if outro is not None and outro != id_:
+                    conn.execute("UPDATE nomes SET pesquisas = COALESCE(pesquisas, 0) + "
+                                 "(SELECT COALESCE(pesquisas, 0) FROM nomes WHERE id = ?) WHERE id = ?",
+                                 (id_, outro))
+                    conn.execute("DELETE FROM nomes WHERE id = ?", (id_,))
+                    fundidos += 1
+                else:
+                    conn.execute("UPDATE nomes SET nome = ?, significado = ?, origem = ? WHERE id = ?",
+                                 (nome, significado, origem, id_))
+                    existentes[nome] = id_
+            if simular:
+                conn.rollback()
+        return len(alteracoes) - fundidos, fundidos
+    finally:
+        conn.close()
+
+
+def migrar_postgres(simular=False):
+    """Repara nome/significado/origem no PostgreSQL. Retorna (alterados, fundidos)."""
+    import db_postgres as db_conexao
+
+    conn = db_conexao.get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("LOCK TABLE nomes IN SHARE ROW EXCLUSIVE MODE;")
+        cursor.execute("SELECT id, nome, significado, origem FROM nomes;")
+        alteracoes = list(_alteracoes(cursor.fetchall()))
+        cursor.execute("""
+            CREATE TEMP TABLE nomes_reparo (id INTEGER PRIMARY KEY, nome TEXT, significado TEXT, origem TEXT)
+            ON COMMIT DROP;
+        """)
+        cursor.executemany("INSERT INTO nomes_reparo VALUES (%s, %s, %s, %s)", alteracoes)
+        # Nome reparado que já existe em outro registro: funde no existente.
+        cursor.execute("""
+            WITH conflitos AS (
+                -- Prefere um registro que não muda; entre os reparados, o de menor id.
+                SELECT DISTINCT ON (r.id) r.id AS quebrado, n.id AS existente
+                FROM nomes_reparo r
+                JOIN (SELECT n.id, n.nome, false AS reparado FROM nomes n
+                      WHERE NOT EXISTS (SELECT 1 FROM nomes_reparo x WHERE x.id = n.id)
+                      UNION ALL
+                      SELECT id, nome, true FROM nomes_reparo) n
+                  ON nome_normalizado(n.nome) = nome_normalizado(r.nome)
+                 AND (NOT n.reparado OR n.id < r.id)
+                ORDER BY r.id, n.reparado, n.id
+            ), somados AS (
+                -- Soma antes: vários quebrados podem cair no mesmo existente, e
+                -- o UPDATE ... FROM aplicaria só uma das linhas do join.
+                UPDATE nomes AS n SET pesquisas = COALESCE(n.pesquisas, 0) + s.extra
+                FROM (SELECT c.existente, SUM(COALESCE(q.pesquisas, 0)) AS extra
+                      FROM conflitos c JOIN nomes q ON q.id = c.quebrado
+                      GROUP BY c.existente) s
+                WHERE n.id = s.existente
+            )
+            DELETE FROM nomes WHERE id IN (SELECT quebrado FROM conflitos);
+        """)
+        fundidos = cursor.rowcount
+        cursor.execute("""
+            UPDATE nomes AS n SET nome = r.nome, significado = r.significado, origem = r.origem
+            FROM nomes_reparo r WHERE n.id = r.id;
+        """)
+        alterados = cursor.rowcount
+        db_conexao.normalizar_origens(cursor)
+        if simular:
+            conn.rollback()
+        else:
+            conn.commit()
+        cursor.close()
+        return alterados, fundidos
+    except Exception as e:
+        conn.rollback()
+        print(f"Erro na migração dos espaços (PostgreSQL): {e}")
+        raise
+    finally:
+        db_conexao.devolver_conexao(conn)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Repara espaços quebrados no meio das palavras.")
+    parser.add_argument('texto', nargs='*', help="texto a reparar (sem --migrar)")
+    parser.add_argument('--migrar', action='store_true', help="limpa os registros já gravados no banco")
+    parser.add_argument('--sqlite', metavar='ARQUIVO', help="migra este banco SQLite em vez do PostgreSQL")
+    parser.add_argument('--simular', action='store_true', help="mostra os totais sem gravar")
+    args = parser.parse_args(argv)
+
+    if not args.migrar:
+        print(reparar(' '.join(args.texto) if args.texto else sys.stdin.read()))
+        return
+    if args.sqlite:
+        alterados, fundidos = migrar_sqlite(args.sqlite, args.simular)
+    else:
+        alterados, fundidos = migrar_postgres(args.simular)
+    print(f"{alterados} registro(s) reparado(s), {fundidos} duplicado(s) fundido(s)"
+          + (" (simulação, nada gravado)." if args.simular else "."))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,249 @@
+"""
+Lógica das rotas compartilhada por app.py (Flask) e app_async.py (Quart).
+
+Aqui ficam só as partes em Python puro: as consultas SQL, a montagem dos
+filtros, a leitura dos parâmetros e a paginação do /listar. Cada app cuida
+apenas de executar as consultas (psycopg2 ou psycopg 3 assíncrono) e de
+renderizar os templates, para que as duas variantes não se afastem.
+"""
+import exportacao
+import contador_pesquisas
+import indice_nomes
+
+POR_PAGINA = 10
+
+# Ranking dos mais pesquisados (/, /top10 e /estatisticas): uma só consulta,
+# servida pelo índice idx_nomes_ranking. Empates saem em ordem alfabética e
+# contadores nulos ficam por último.
+QUERY_RANKING = """
+    SELECT nome, pesquisas FROM nomes
+    ORDER BY pesquisas DESC NULLS LAST, nome ASC, id ASC
+    LIMIT %s
+"""
+
+QUERY_TOTAL = "SELECT COUNT(id) AS total FROM nomes"
+
+QUERY_BUSCA = indice_nomes.QUERY_LINHAS + """
+    WHERE n.nome ILIKE %s
+    ORDER BY n.nome ASC
+"""
+
+# Um único INSERT: o índice único em nome_normalizado(nome) barra duplicados
+# (sem diferenciar maiúsculas/acentos), mesmo com cadastros simultâneos. A
+# origem canônica existente é só lida; uma nova só é criada se o nome ainda
+# não existe (nada de linha travada nem origem órfã). Se outro cadastro criar
+# a mesma origem ao mesmo tempo, o nome entra com origem_id nulo e o
+# normalizar_origens() do init_db o liga depois.
+QUERY_CADASTRO = """
+    WITH existente AS (
+        SELECT id FROM origens WHERE nome = %s
+    ), nova AS (
+        INSERT INTO origens (nome)
+        SELECT %s::text
+        WHERE NOT EXISTS (SELECT 1 FROM existente)
+          AND NOT EXISTS (SELECT 1 FROM nomes WHERE nome_normalizado(nome) = nome_normalizado(%s))
+        ON CONFLICT (nome) DO NOTHING
+        RETURNING id
+    )
+    INSERT INTO nomes (nome, significado, origem, origem_id, motivo_escolha, pesquisas)
+    VALUES (%s, %s, %s, COALESCE((SELECT id FROM existente), (SELECT id FROM nova)), %s, 0)
+    ON CONFLICT (nome_normalizado(nome)) DO NOTHING
+    RETURNING id
+"""
+
+# Contagem por origem pré-agregada (tabela origem_stats, mantida por triggers).
+QUERY_ORIGENS = """
+    SELECT o.nome AS origem, s.total AS count
+    FROM origem_stats s LEFT JOIN origens o ON o.id = s.origem_id
+    WHERE s.total > 0
+    ORDER BY s.total DESC, o.nome
+"""
+
+
+def ler_cursor(valor):
+    """Converte o parâmetro de paginação 'nome,id' em (nome, id)."""
+    nome, _, id_texto = (valor or '').rpartition(',')
+    try:
+        return (nome, int(id_texto)) if nome else None
+    except ValueError:
+        return None
+
+
+def filtros_listagem(filtro_nome, filtro_origem):
+    """Trecho do WHERE (sobre 'nomes n') e parâmetros dos filtros de nome e origem."""
+    filtros = ""
+    params = []
+    if filtro_nome:
+        filtros += " AND n.nome ILIKE %s"
+        params.append(f"%{filtro_nome}%")
+    if filtro_origem:
+        filtros += " AND n.origem_id IN (SELECT id FROM origens WHERE nome ILIKE %s)"
+        params.append(f"%{filtro_origem}%")
+    return filtros, params
+
+
+# --------------------------------------------------------------------------
+# /buscar, /cadastrar e /exportar
+# --------------------------------------------------------------------------
+
+def marcar_pesquisados(resultados):
+    """Mostra em cada resultado o contador já com esta pesquisa e devolve os
+    ids para contador_pesquisas.registrar().
+
+    O número exibido é aproximado: soma o valor lido do banco (ou do índice
+    em memória, que pode estar até um TTL atrasado) aos incrementos ainda não
+    gravados, lidos num instante seguinte (ver contador_pesquisas.pendentes).
+    """
+    ids = [row['id'] for row in resultados]
+    nao_gravadas = contador_pesquisas.pendentes(ids)
+    for row in resultados:
+        row['pesquisas'] = (row['pesquisas'] or 0) + nao_gravadas[row['id']] + 1
+    return ids
+
+
+def parametros_cadastro(form):
+    """(nome, significado, origem, motivo_escolha) do formulário, sem espaços nas bordas."""
+    return tuple(form.get(campo, '').strip()
+                 for campo in ('nome', 'significado', 'origem', 'motivo_escolha'))
+
+
+def valores_cadastro(nome, significado, origem, canonica, motivo_escolha):
+    """Parâmetros do QUERY_CADASTRO, na ordem dos marcadores."""
+    return (canonica, canonica, nome, nome, significado, origem, motivo_escolha)
+
+
+def consulta_exportacao(args):
+    """(formato, query, params) do /exportar; formato None se não for suportado."""
+    formato = args.get('formato', 'csv').lower()
+    if formato not in exportacao.FORMATOS:
+        return None, None, None
+    filtros, params = filtros_listagem(args.get('nome', '').strip(), args.get('origem', '').strip())
+    return formato, exportacao.QUERY + filtros + " ORDER BY n.nome ASC, n.id ASC", tuple(params)
+
+
+# --------------------------------------------------------------------------
+# /listar
+# --------------------------------------------------------------------------
+
+class Pagina:
+    """Parâmetros de uma página do /listar (número, filtros e cursor)."""
+
+    def __init__(self, args):
+        try:
+            numero = int(args.get('page', 1))
+        except ValueError:
+            numero = 1
+        self.numero = max(numero, 1)
+        self.filtro_nome = args.get('nome', '').strip()
+        self.filtro_origem = args.get('origem', '').strip()
+        # Paginação por cursor (keyset): after/before = "nome,id" da borda da página.
+        self.apos = ler_cursor(args.get('after'))
+        self.antes = None if self.apos else ler_cursor(args.get('before'))
+        self.filtros, self.params = filtros_listagem(self.filtro_nome, self.filtro_origem)
+
+    @property
+    def offset(self):
+        return (self.numero - 1) * POR_PAGINA
+
+    def consulta_estimativa(self):
+        """Total aproximado de registros, sem varrer a tabela.
+
+        Sem filtros usa as estatísticas do pg_class; com filtros, a estimativa
+        de linhas do planejador. Leia o resultado com total_estimado().
+        """
+        if not self.filtros:
+            return "SELECT reltuples::bigint AS total FROM pg_class WHERE oid = 'nomes'::regclass", ()
+        return (f"EXPLAIN (FORMAT JSON) SELECT n.id FROM nomes n WHERE 1=1{self.filtros}",
+                tuple(self.params))
+
+    def total_estimado(self, resultado):
+        """Total lido do resultado de consulta_estimativa(), ou None se for
+        preciso contar de verdade (QUERY_TOTAL): tabela ainda não analisada
+        (reltuples = -1)."""
+        if not resultado:
+            return 0
+        if self.filtros:
+            return int(resultado['QUERY PLAN'][0]['Plan']['Plan Rows'])
+        return resultado['total'] if resultado['total'] >= 0 else None
+
+    def consulta_linhas(self):
+        """(query, params) das linhas da página, com uma linha a mais para saber se há próxima."""
+        query = indice_nomes.QUERY_LINHAS + " WHERE 1=1" + self.filtros
+        params = list(self.params)
+        if self.apos:
+            query += " AND (n.nome, n.id) > (%s, %s) ORDER BY n.nome ASC, n.id ASC LIMIT %s"
+            params.extend([self.apos[0], self.apos[1], POR_PAGINA + 1])
+        elif self.antes:
+            query += " AND (n.nome, n.id) < (%s, %s) ORDER BY n.nome DESC, n.id DESC LIMIT %s"
+            params.extend([self.antes[0], self.antes[1], POR_PAGINA + 1])
+        else:
+            # Sem cursor (links da janela de páginas): OFFSET, limitado às
+            # páginas próximas da atual.
+            query += " ORDER BY n.nome ASC, n.id ASC LIMIT %s OFFSET %s"
+            params.extend([POR_PAGINA + 1, self.offset])
+        return query, tuple(params)
+
+    def do_banco(self, nomes, total_registros):
+        """Contexto do template a partir das linhas de consulta_linhas()."""
+        total_pages = max((total_registros + POR_PAGINA - 1) // POR_PAGINA, 1)
+        tem_mais = len(nomes) > POR_PAGINA
+        nomes = nomes[:POR_PAGINA]
+        if self.antes:
+            nomes.reverse()
+            tem_anterior, tem_proxima = tem_mais, True
+        else:
+            tem_anterior = self.numero > 1 or self.apos is not None
+            tem_proxima = tem_mais
+        total_pages = max(total_pages, self.numero + (1 if tem_proxima else 0))
+        return self._contexto(nomes, self.numero, total_pages, total_registros, True,
+                              tem_anterior, tem_proxima)
+
+    def do_indice(self, indice):
+        """Contexto do template com filtro e paginação direto da memória (indice_nomes)."""
+        posicoes = indice.filtrar(self.filtro_nome, self.filtro_origem)
+        total_registros = len(posicoes)
+        total_pages = (total_registros + POR_PAGINA - 1) // POR_PAGINA
+        offset = self.offset
+        if not (self.apos or self.antes) and self.numero > total_pages > 0:
+            offset = (total_pages - 1) * POR_PAGINA
+        inicio, fim = indice.pagina(posicoes, POR_PAGINA, offset, self.apos, self.antes)
+        nomes = indice.linhas(posicoes[inicio:fim])
+        return self._contexto(nomes, inicio // POR_PAGINA + 1, total_pages, total_registros, False,
+                              inicio > 0, fim < len(posicoes))
+
+    def _contexto(self, nomes, page, total_pages, total_registros, total_aproximado,
+                  tem_anterior, tem_proxima):
+        for i, nome in enumerate(nomes):
+            nome['indice'] = (page - 1) * POR_PAGINA + i + 1
+        return dict(nomes=nomes,
+                    page=page,
+                    total_pages=total_pages,
+                    total_registros=total_registros,
+                    total_aproximado=total_aproximado,
+                    janela=range(max(1, page - 2), min(total_pages, page + 2) + 1),
+                    cursor_anterior=f"{nomes[0]['nome']},{nomes[0]['id']}" if nomes and tem_anterior else None,
+                    cursor_proximo=f"{nomes[-1]['nome']},{nomes[-1]['id']}" if nomes and tem_proxima else None,
+                    filtro_nome=self.filtro_nome,
+                    filtro_origem=self.filtro_origem)
+
+
+# --------------------------------------------------------------------------
+# /estatisticas e /graficos
+# --------------------------------------------------------------------------
+
+def definir_grafico(nome_grafico, dados):
+    """Parâmetros (tipo, título, rótulos, valores, ylabel) de cada gráfico."""
+    if nome_grafico == 'origens':
+        return ('pie', 'Distribuição de Nomes por Origem',
+                [d['origem'] for d in dados], [d['count'] for d in dados], None)
+    return ('bar', 'Top 5 Nomes Mais Pesquisados',
+            [d['nome'] for d in dados], [d['pesquisas'] for d in dados], 'Número de Pesquisas')
+
+
+def consulta_grafico(nome_grafico):
+    """(query, params) dos dados de cada gráfico; None se o gráfico não existe."""
+    if nome_grafico == 'origens':
+        return QUERY_ORIGENS, None
+    if nome_grafico == 'top5':
+        return QUERY_RANKING, (5,)
+    return None